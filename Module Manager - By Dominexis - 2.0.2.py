@@ -3,10 +3,23 @@
 import os
 import shutil
 import sys
+import re
 import json
+import string
+import hashlib
+import sqlite3
+import zipfile
+import random
+import argparse
+import platform
+import tempfile
+import threading
+import statistics
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
+from time import perf_counter, sleep, time_ns
 
 
 
@@ -28,6 +41,42 @@ if not (
 PROGRAM_PATH = Path(__file__).parent
 MODULE_MANAGER_VERSION = "2.0.2"
 PACK_FORMAT = 10
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+CATALOG_FILE_NAME = "Module Manager Catalog.db"
+CATALOG_SCHEMA_VERSION = 1
+BENCHMARK_FILE_NAME = "Module Manager Benchmark.json"
+BUNDLE_NAME = "Module Bundle DP"
+CACHE_FILE_NAME = "Module Manager Cache.db"
+CACHE_SCHEMA_VERSION = 1
+CACHE_SIZE_LIMIT = 64*1024*1024
+CACHE_GENERATOR_FINGERPRINT = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+DISPATCH_LEAF_SIZE = 4
+WRITER_THREADS = 16
+LINT_PLAYER_COUNT = 8
+LINT_ENTITY_COUNT = 64
+LINT_MAX_DEPTH = 64
+LINT_RULES = {
+    "NBT selector": 8,
+    "@e selector without type": 4,
+    "data get entity": 4
+}
+LINT_ENTRY_POINTS = {
+    "tick/main": 1,
+    "player/main": LINT_PLAYER_COUNT,
+    "entity/main": LINT_ENTITY_COUNT,
+    "object/main": LINT_ENTITY_COUNT
+}
+FUNCTION_CALL_PATTERN = re.compile(r"(?:^|\brun )function (#?[a-z0-9_.\-]+:[a-z0-9_./\-]+)")
+ITERATION_PATTERN = re.compile(r"\b(?:as|at) @([ae])\b")
+DATA_GET_ENTITY_PATTERN = re.compile(r"\bdata get entity\b")
+TYPE_FILTER_PATTERN = re.compile(r"\btype=(?!!)")
+PATH_PART_ILLEGAL_PATTERN = re.compile(r'[/\\?<>:"|]')
+INTERNAL_PATTERN = re.compile(r"[a-z0-9\-_.]+")
+VERSION_PATTERN = re.compile(r"([0-9]+)\.([0-9]+)\.([0-9]+)")
+DATA_PACK_NAME_PATTERN = re.compile(r"(.+) DP - By .+ - [0-9]+\.[0-9]+\.[0-9]+")
+INTEGER_LIMIT = 2147483647
+DISPATCH_HEADER = "# Run function based on {} type, generated from {}_kinds with hash {}"
+MINIFY_KEPT_PREFIXES = tuple(DISPATCH_HEADER.format(category, category, "") for category in ["entity", "object"])
 
 class State(Enum):
     """Enumeration which stores the IDs of the program states.
@@ -37,6 +86,7 @@ class State(Enum):
     An enumeration ensures that the values are accurate because the IDE can flag typos."""
 
     MAIN_MENU = "main_menu"
+    TOGGLE_OUTPUT = "toggle_output"
 
     CREATE_MODULE = "create_module"
 
@@ -68,6 +118,8 @@ class Setting_Category(Enum):
     MODULE_INFO = "module_info"
     DEPENDENCIES = "dependencies"
     FEATURES = "features"
+    ENTITY_KINDS = "entity_kinds"
+    OBJECT_KINDS = "object_kinds"
 
 class Module_Setting(Enum):
     """Enumeration which stores the IDs of the module settings.
@@ -112,6 +164,57 @@ class Feature(Enum):
     MINIMUM_ENTITY_TIME = "minimum_entity_time"
     MINIMUM_OBJECT_TIME = "minimum_object_time"
     MINIMUM_DIFFICULTY = "minimum_difficulty"
+    KEYED_VERIFICATION = "keyed_verification"
+
+GENERATOR_FEATURES = {
+    Feature.KEYED_VERIFICATION.value
+}
+"""Features which only change how the module is generated, and so aren't assigned as Nexus feature scores."""
+
+class Build_Stage(Enum):
+    """Enumeration which stores the IDs of the stages which generate a module, named after the methods that run them.
+
+    Using plain strings to store these sorts of values risks typos breaking the system.
+
+    An enumeration ensures that the values are accurate because the IDE can flag typos."""
+
+    PACK_MCMETA = "create_pack_mcmeta"
+    MODULE_INFO_JSON = "create_module_info_json"
+    TAGS = "create_tags"
+    ENTITY_FUNCTIONS = "create_entity_functions"
+    EVENT_ID_FUNCTIONS = "create_event_id_functions"
+    OBJECT_FUNCTIONS = "create_object_functions"
+    PLAYER_FUNCTIONS = "create_player_functions"
+    SETUP_FUNCTIONS = "create_setup_functions"
+    UPDATE_SETUP_FUNCTIONS = "update_setup_functions"
+    TICK_FUNCTIONS = "create_tick_functions"
+    UNINSTALL_FUNCTIONS = "create_uninstall_functions"
+    VERIFICATION_FUNCTIONS = "create_verification_functions"
+    HOOK_TAGS = "prune_hook_tags"
+
+UPDATE_STAGES = {
+    Build_Stage.PACK_MCMETA,
+    Build_Stage.MODULE_INFO_JSON,
+    Build_Stage.UPDATE_SETUP_FUNCTIONS,
+    Build_Stage.ENTITY_FUNCTIONS,
+    Build_Stage.EVENT_ID_FUNCTIONS,
+    Build_Stage.OBJECT_FUNCTIONS,
+    Build_Stage.VERIFICATION_FUNCTIONS
+}
+"""Stages which are run when updating a module."""
+
+FEATURE_STAGES: dict[str, set[Build_Stage]] = {
+    Feature.ENTITY_PROCESSING.value: {Build_Stage.ENTITY_FUNCTIONS},
+    Feature.CUSTOM_ENTITY_TICKING.value: {Build_Stage.ENTITY_FUNCTIONS},
+    Feature.EVENT_ID_PLAYER_HURT_ENTITY.value: {Build_Stage.EVENT_ID_FUNCTIONS},
+    Feature.EVENT_ID_PLAYER_KILLED_ENTITY.value: {Build_Stage.EVENT_ID_FUNCTIONS},
+    Feature.EVENT_ID_ENTITY_HURT_PLAYER.value: {Build_Stage.EVENT_ID_FUNCTIONS},
+    Feature.EVENT_ID_ENTITY_KILLED_PLAYER.value: {Build_Stage.EVENT_ID_FUNCTIONS},
+    Feature.EVENT_ID_PLAYER_INTERACTED_WITH_ENTITY.value: {Build_Stage.EVENT_ID_FUNCTIONS},
+    Feature.OBJECT_TICKING.value: {Build_Stage.OBJECT_FUNCTIONS},
+    Feature.KEYED_VERIFICATION.value: {Build_Stage.VERIFICATION_FUNCTIONS}
+}
+"""Update stages which depend on a feature, besides the feature assignment which depends on every feature."""
 
 class Setting_Kind(Enum):
     """Enumeration which stores the IDs of the setting kinds, that is, their names.
@@ -138,14 +241,34 @@ class Setting_Template:
 
     name = Setting_Kind.GENERIC
 
+    __slots__ = (
+        "value",
+    )
+
+    value: str
+    """Value of the setting."""
+
     def __init__(self, value: str):
         self.value = value
 
     def __str__(self) -> str:
         return self.value
 
+    @classmethod
+    def check(cls, value: str, key: str) -> str:
+        """Returns an error message if `value` can't be assigned to this kind of setting, or an empty string if it can."""
+        return ""
+
+    @classmethod
+    def convert(cls, value: str) -> str | int | bool | dict[str, int]:
+        """Converts a value which passed `check()` into the raw form returned by `export()`."""
+        return value
+
     def assign(self, value: str, key: str) -> str:
-        self.value = value
+        error_message = self.check(value, key)
+        if error_message:
+            return error_message
+        self.value = self.convert(value)
         return ""
 
     def export(self) -> str | int | bool:
@@ -160,13 +283,16 @@ class Path_Part(Setting_Template):
 
     name = Setting_Kind.PATH_PART
 
-    def assign(self, value: str, key: str) -> str:
+    __slots__ = ()
+
+    @classmethod
+    def check(cls, value: str, key: str) -> str:
+        if not isinstance(value, str):
+            return f" ERROR: {key}: Input must be a string!\n"
         if len(value) == 0:
             return f" ERROR: {key}: Cannot use an empty string!\n"
-        for char in ["/", "\\", "?", "<", ">", ":", "\"", "|"]:
-            if char in value:
-                return f" ERROR: {key}: Cannot use illegal characters in file names!\n"
-        self.value = value
+        if PATH_PART_ILLEGAL_PATTERN.search(value):
+            return f" ERROR: {key}: Cannot use illegal characters in file names!\n"
         return ""
 
 class Version(Setting_Template):
@@ -178,6 +304,19 @@ class Version(Setting_Template):
 
     name = Setting_Kind.VERSION
 
+    __slots__ = (
+        "major",
+        "minor",
+        "patch"
+    )
+
+    major: int
+    """Major version, which changes when the module breaks compatibility."""
+    minor: int
+    """Minor version, which changes when the module adds features."""
+    patch: int
+    """Patch version, which changes when the module fixes bugs."""
+
     def __init__(self, major: int, minor: int, patch: int):
         self.major = major
         self.minor = minor
@@ -186,7 +325,8 @@ class Version(Setting_Template):
     def __str__(self) -> str:
         return f'{self.major}.{self.minor}.{self.patch}'
 
-    def assign(self, value: str | dict[str, int], key: str):
+    @classmethod
+    def check(cls, value: str | dict[str, int], key: str) -> str:
         # Manage dict type
         if isinstance(value, dict):
             if "major" not in value or "minor" not in value or "patch" not in value:
@@ -194,25 +334,38 @@ class Version(Setting_Template):
             for entry in value:
                 if not isinstance(value[entry], int):
                     return f" ERROR: {key}: Cannot use non-numbers in version ID!\n"
-                if value[entry] > 2147483647:
+                if value[entry] > INTEGER_LIMIT:
                     return f" ERROR: {key}: Cannot have values larger than the 32-bit integer limit!\n"
-            self.major = value["major"]
-            self.minor = value["minor"]
-            self.patch = value["patch"]
             return ""
 
+        if not isinstance(value, str):
+            return f" ERROR: {key}: Version must use the format MAJOR.MINOR.PATCH!\n"
         if len(value) == 0:
             return f" ERROR: {key}: Cannot use an empty string!\n"
-        if len(value.split(".")) != 3:
-            return f" ERROR: {key}: Version must use the format MAJOR.MINOR.PATCH!\n"
-        for entry in value.split("."):
-            if not entry.isnumeric():
-                return f" ERROR: {key}: Cannot use non-numbers in version ID!\n"
-            if int(entry) > 2147483647:
-                return f" ERROR: {key}: Cannot have values larger than the 32-bit integer limit!\n"
-        self.major = int(value.split(".")[0])
-        self.minor = int(value.split(".")[1])
-        self.patch = int(value.split(".")[2])
+        match = VERSION_PATTERN.fullmatch(value)
+        if not match:
+            if value.count(".") != 2:
+                return f" ERROR: {key}: Version must use the format MAJOR.MINOR.PATCH!\n"
+            return f" ERROR: {key}: Cannot use non-numbers in version ID!\n"
+        if any(int(entry) > INTEGER_LIMIT for entry in match.groups()):
+            return f" ERROR: {key}: Cannot have values larger than the 32-bit integer limit!\n"
+        return ""
+
+    @classmethod
+    def convert(cls, value: str | dict[str, int]) -> dict[str, int]:
+        if isinstance(value, dict):
+            return {"major": value["major"], "minor": value["minor"], "patch": value["patch"]}
+        major, minor, patch = map(int, VERSION_PATTERN.fullmatch(value).groups())
+        return {"major": major, "minor": minor, "patch": patch}
+
+    def assign(self, value: str | dict[str, int], key: str):
+        error_message = self.check(value, key)
+        if error_message:
+            return error_message
+        version = self.convert(value)
+        self.major = version["major"]
+        self.minor = version["minor"]
+        self.patch = version["patch"]
         return ""
 
     def export(self) -> dict[str, int]:
@@ -231,13 +384,16 @@ class Internal(Setting_Template):
 
     name = Setting_Kind.INTERNAL
 
-    def assign(self, value: str, key: str) -> str:
+    __slots__ = ()
+
+    @classmethod
+    def check(cls, value: str, key: str) -> str:
+        if not isinstance(value, str):
+            return f" ERROR: {key}: Input must be a string!\n"
         if len(value) == 0:
             return f" ERROR: {key}: Cannot use an empty string!\n"
-        for char in value:
-            if char not in ["a","b","c","d","e","f","g","h","i","j","k","l","m","n","o","p","q","r","s","t","u","v","w","x","y","z","0","1","2","3","4","5","6","7","8","9","-","_","."]:
-                return f" ERROR: {key}: Cannot use illegal characters in an internal string!\n"
-        self.value = value
+        if not INTERNAL_PATTERN.fullmatch(value):
+            return f" ERROR: {key}: Cannot use illegal characters in an internal string!\n"
         return ""
 
 class Link(Setting_Template):
@@ -249,6 +405,14 @@ class Link(Setting_Template):
 
     name = Setting_Kind.LINK
 
+    __slots__ = ()
+
+    @classmethod
+    def check(cls, value: str, key: str) -> str:
+        if not isinstance(value, str):
+            return f" ERROR: {key}: Input must be a string!\n"
+        return ""
+
 class Boolean(Setting_Template):
     """Stores a Boolean. Used in the feature list.
 
@@ -258,6 +422,8 @@ class Boolean(Setting_Template):
 
     name = Setting_Kind.BOOLEAN
 
+    __slots__ = ()
+
     def __init__(self, value: bool):
         self.value = value
 
@@ -266,18 +432,18 @@ class Boolean(Setting_Template):
             return "true"
         return "false"
 
-    def assign(self, value: str | bool, key: str) -> str:
-        if type(value).__name__ == "bool":
-            self.value = value
-            return ""
-        if value in ["true", "True", "TRUE", "t", "T", "1"]:
-            self.value = True
-            return ""
-        if value in ["false", "False", "FALSE", "f", "F", "0"]:
-            self.value = False
+    @classmethod
+    def check(cls, value: str | bool, key: str) -> str:
+        if type(value).__name__ == "bool" or value in ["true", "True", "TRUE", "t", "T", "1", "false", "False", "FALSE", "f", "F", "0"]:
             return ""
         return f" ERROR: {key} Input must be a boolean!\n"
 
+    @classmethod
+    def convert(cls, value: str | bool) -> bool:
+        if type(value).__name__ == "bool":
+            return value
+        return value in ["true", "True", "TRUE", "t", "T", "1"]
+
 class Time(Setting_Template):
     """Stores an integer which represents the number of ticks allotted to a specific task by the Nexus. Used in the feature list.
 
@@ -287,21 +453,26 @@ class Time(Setting_Template):
 
     name = Setting_Kind.TIME
 
+    __slots__ = ()
+
     def __init__(self, value: int):
         self.value = value
 
     def __str__(self):
         return str(self.value)
 
-    def assign(self, value: str | int, key: str) -> str:
-        if isinstance(value, int):
-            self.value = value
-            return ""
-        if value.isnumeric():
-            self.value = int(value)
+    @classmethod
+    def check(cls, value: str | int, key: str) -> str:
+        if isinstance(value, int) or (isinstance(value, str) and value.isnumeric()):
             return ""
         return f" ERROR: {key}: Input must be a number!\n"
 
+    @classmethod
+    def convert(cls, value: str | int) -> int:
+        if isinstance(value, int):
+            return value
+        return int(value)
+
 class Difficulty(Setting_Template):
     """Stores a string representing a difficulty mode. Can be `peaceful`, `easy`, `normal`, or `hard`.
 
@@ -311,19 +482,1604 @@ class Difficulty(Setting_Template):
 
     name = Setting_Kind.DIFFICULTY
 
-    def assign(self, value: str, key: str) -> str:
-        if value in ["peaceful", "easy", "normal", "hard"]:
-            self.value = value
-            return ""
-        if value in ["0", "1", "2", "3"]:
-            self.value = ["peaceful", "easy", "normal", "hard"][["0", "1", "2", "3"].index(value)]
+    __slots__ = ()
+
+    @classmethod
+    def check(cls, value: str, key: str) -> str:
+        if value in ["peaceful", "easy", "normal", "hard", "0", "1", "2", "3"]:
             return ""
         return f" ERROR: {key}: Input must be a valid difficulty!\n"
 
+    @classmethod
+    def convert(cls, value: str) -> str:
+        if value in ["0", "1", "2", "3"]:
+            return ["peaceful", "easy", "normal", "hard"][["0", "1", "2", "3"].index(value)]
+        return value
+
     def score(self) -> int:
         """Converts the difficulty into its numeric form for scores."""
         return ["peaceful", "easy", "normal", "hard"].index(self.value)
 
+MODULE_INFO_CLASSES: dict[str, type[Setting_Template]] = {
+    Module_Setting.MODULE_NAME.value: Path_Part,
+    Module_Setting.AUTHOR.value: Path_Part,
+    Module_Setting.VERSION.value: Version,
+    Module_Setting.INTERNAL_ID.value: Internal,
+    Module_Setting.NAMESPACE.value: Internal,
+    Module_Setting.DOWNLOAD_LINK.value: Link
+}
+"""Setting type of each module info setting, in the order they are exported."""
+DEPENDENCY_CLASSES: dict[str, type[Setting_Template]] = {
+    Module_Setting.MODULE_NAME.value: Path_Part,
+    Module_Setting.VERSION.value: Version,
+    Module_Setting.INTERNAL_ID.value: Internal,
+    Module_Setting.DOWNLOAD_LINK.value: Link
+}
+"""Setting type of each dependency setting, in the order they are exported."""
+FEATURE_CLASSES: dict[str, type[Setting_Template]] = {feature.value: Boolean for feature in Feature} | {
+    Feature.MAXIMUM_ENTITY_TIME.value: Time,
+    Feature.MAXIMUM_OBJECT_TIME.value: Time,
+    Feature.MINIMUM_ENTITY_TIME.value: Time,
+    Feature.MINIMUM_OBJECT_TIME.value: Time,
+    Feature.MINIMUM_DIFFICULTY.value: Difficulty
+}
+"""Setting type of each feature, in the order they are exported."""
+FLAG_FEATURES = tuple(feature for feature, setting_class in FEATURE_CLASSES.items() if setting_class is Boolean)
+"""Features which are stored as bits in `Module_Record.flags`, ordered from the lowest bit."""
+VALUE_FEATURES = tuple(feature for feature, setting_class in FEATURE_CLASSES.items() if setting_class is not Boolean)
+"""Features which are stored in `Module_Record.values`, in order."""
+CACHE_PLACEHOLDERS: dict[str, str] = {
+    Module_Setting.MODULE_NAME.value: "Module Manager Cache Name",
+    Module_Setting.INTERNAL_ID.value: "module_manager_cache_id",
+    Module_Setting.NAMESPACE.value: "module_manager_cache_namespace"
+}
+"""Values which cached files are generated with in place of each module info setting that `Generation_Cache.fill()` fills in."""
+
+class Module_Record:
+    """A compact form of the settings of a module, used when handling many modules at once.
+
+    Module info and dependencies are stored as plain values and tuples, Boolean features are packed into the bits of `flags`,
+    and the other features are stored in `values`. Records are converted straight from and to the JSON of a settings file
+    with `from_json()` and `to_json()`, which give the same results as `import_settings()` and `export_settings()`
+    without creating a setting object for every value."""
+
+    __slots__ = (
+        "module_name",
+        "author",
+        "version",
+        "internal_id",
+        "namespace",
+        "download_link",
+        "dependencies",
+        "flags",
+        "values",
+        "entity_kinds",
+        "object_kinds"
+    )
+
+    module_name: str
+    """Name of the module."""
+    author: str
+    """Author of the module."""
+    version: tuple[int, int, int]
+    """Version of the module as `(major, minor, patch)`."""
+    internal_id: str
+    """Internal ID of the module."""
+    namespace: str
+    """Namespace of the module."""
+    download_link: str
+    """Download link of the module, which may be empty."""
+    dependencies: tuple[tuple[str, tuple[int, int, int], str, str], ...]
+    """Name, version, internal ID, and download link of each dependency."""
+    flags: int
+    """Boolean features, with the bit of each feature in `FLAG_FEATURES` set if it is enabled."""
+    values: tuple[int | str, ...]
+    """Value of each feature in `VALUE_FEATURES`."""
+    entity_kinds: tuple[str, ...]
+    """Declared entity kinds."""
+    object_kinds: tuple[str, ...]
+    """Declared object kinds."""
+
+    default_json: dict[str, dict[str, str] | list[dict[str, str]]] = {}
+    """Settings which are used for anything missing from the JSON, filled in from the defaults of `Program` when first needed."""
+    default_dependency_json: dict[str, str | dict[str, int]] = {}
+    """Dependency settings which are used for anything missing from a dependency."""
+
+    @classmethod
+    def from_json(cls, settings_json: dict[str, dict[str, str] | list[dict[str, str]]]) -> tuple["Module_Record", str]:
+        """Creates a record from the JSON of a settings file or `module_info.json`.
+
+        Like `import_settings()`, anything missing or invalid keeps its default value, though each category must have the right JSON type.
+        Returns the record and the error messages of any invalid settings."""
+        if not cls.default_json:
+            program = Program(False)
+            cls.default_json.update(program.export_settings())
+            cls.default_dependency_json.update({setting: value.export() for setting, value in program.default_dependency().items()})
+        record = cls()
+        message = ""
+
+        # Module info
+        category = Setting_Category.MODULE_INFO.value
+        module_info: dict[str, str | dict[str, int]] = dict(cls.default_json[category])
+        for setting, value in settings_json.get(category, {}).items():
+            if setting not in MODULE_INFO_CLASSES:
+                continue
+            error_message = MODULE_INFO_CLASSES[setting].check(value, setting)
+            message += error_message
+            if not error_message:
+                module_info[setting] = MODULE_INFO_CLASSES[setting].convert(value)
+        record.module_name = module_info[Module_Setting.MODULE_NAME.value]
+        record.author = module_info[Module_Setting.AUTHOR.value]
+        record.version = version_tuple(module_info[Module_Setting.VERSION.value])
+        record.internal_id = module_info[Module_Setting.INTERNAL_ID.value]
+        record.namespace = module_info[Module_Setting.NAMESPACE.value]
+        record.download_link = module_info[Module_Setting.DOWNLOAD_LINK.value]
+
+        # Dependencies
+        category = Setting_Category.DEPENDENCIES.value
+        dependencies: list[tuple[str, tuple[int, int, int], str, str]] = []
+        for dependency_json in settings_json.get(category, cls.default_json[category]):
+            dependency = dict(cls.default_dependency_json)
+            for setting, value in dependency_json.items():
+                if setting not in DEPENDENCY_CLASSES:
+                    continue
+                error_message = DEPENDENCY_CLASSES[setting].check(value, setting)
+                message += error_message
+                if not error_message:
+                    dependency[setting] = DEPENDENCY_CLASSES[setting].convert(value)
+            dependencies.append(
+                (
+                    dependency[Module_Setting.MODULE_NAME.value],
+                    version_tuple(dependency[Module_Setting.VERSION.value]),
+                    dependency[Module_Setting.INTERNAL_ID.value],
+                    dependency[Module_Setting.DOWNLOAD_LINK.value]
+                )
+            )
+        record.dependencies = tuple(dependencies)
+
+        # Features
+        category = Setting_Category.FEATURES.value
+        features: dict[str, bool | int | str] = dict(cls.default_json[category])
+        for setting, value in settings_json.get(category, {}).items():
+            if setting not in FEATURE_CLASSES:
+                continue
+            error_message = FEATURE_CLASSES[setting].check(value, setting)
+            message += error_message
+            if not error_message:
+                features[setting] = FEATURE_CLASSES[setting].convert(value)
+        record.flags = sum(1 << i for i, feature in enumerate(FLAG_FEATURES) if features[feature])
+        record.values = tuple(features[feature] for feature in VALUE_FEATURES)
+
+        # Kinds
+        for category in [Setting_Category.ENTITY_KINDS.value, Setting_Category.OBJECT_KINDS.value]:
+            kinds: list[str] = []
+            for kind in settings_json.get(category, []):
+                error_message = Internal.check(kind, category)
+                if not error_message and kind in kinds:
+                    error_message = f' ERROR: {category}: Cannot declare "{kind}" twice!\n'
+                message += error_message
+                if not error_message:
+                    kinds.append(kind)
+            setattr(record, category, tuple(kinds))
+
+        return record, message
+
+    def to_json(self) -> dict[str, dict[str, str] | list[dict[str, str]]]:
+        """Returns the settings in the same form as `export_settings()`."""
+        flags = self.flags
+        features: dict[str, bool | int | str] = {}
+        values = iter(self.values)
+        for feature, setting_class in FEATURE_CLASSES.items():
+            if setting_class is Boolean:
+                features[feature] = bool(flags & 1)
+                flags >>= 1
+            else:
+                features[feature] = next(values)
+
+        return {
+            Setting_Category.MODULE_INFO.value: {
+                Module_Setting.MODULE_NAME.value: self.module_name,
+                Module_Setting.AUTHOR.value: self.author,
+                Module_Setting.VERSION.value: dict(zip(["major", "minor", "patch"], self.version)),
+                Module_Setting.INTERNAL_ID.value: self.internal_id,
+                Module_Setting.NAMESPACE.value: self.namespace,
+                Module_Setting.DOWNLOAD_LINK.value: self.download_link
+            },
+            Setting_Category.DEPENDENCIES.value: [
+                {
+                    Module_Setting.MODULE_NAME.value: module_name,
+                    Module_Setting.VERSION.value: dict(zip(["major", "minor", "patch"], version)),
+                    Module_Setting.INTERNAL_ID.value: internal_id,
+                    Module_Setting.DOWNLOAD_LINK.value: download_link
+                }
+                for module_name, version, internal_id, download_link in self.dependencies
+            ],
+            Setting_Category.FEATURES.value: features,
+            Setting_Category.ENTITY_KINDS.value: list(self.entity_kinds),
+            Setting_Category.OBJECT_KINDS.value: list(self.object_kinds)
+        }
+
+    def feature(self, feature: Feature) -> bool | int | str:
+        """Returns the value of a feature."""
+        if feature.value in FLAG_FEATURES:
+            return bool(self.flags >> FLAG_FEATURES.index(feature.value) & 1)
+        return self.values[VALUE_FEATURES.index(feature.value)]
+
+class Text_Template:
+    """A JSON text component, such as a tellraw message, with `{name}` fields which are filled in with `fill()`.
+
+    The template is parsed once when it is created, so filling it in only joins strings together.
+    Values are escaped as JSON strings, so a quote in a name or link can't break the component.
+    Fields written as `{name:raw}` are inserted as they are, which is used to nest other components.
+    Literal braces are doubled, like in f-strings."""
+
+    __slots__ = (
+        "parts",
+    )
+
+    parts: list[tuple[str, str | None, bool]]
+    """Literal text before each field, the name of the field, and whether it is inserted without escaping."""
+
+    def __init__(self, template: str):
+        self.parts = [(literal, field, format_spec == "raw") for literal, field, format_spec, _ in string.Formatter().parse(template)]
+
+    def fill(self, **values: str | Setting_Template) -> str:
+        """Returns the component with each field replaced by its value."""
+        contents: list[str] = []
+        for literal, field, raw in self.parts:
+            contents.append(literal)
+            if field is None:
+                continue
+            value = str(values[field])
+            contents.append(value if raw else json.dumps(value, ensure_ascii=False)[1:-1])
+        return "".join(contents)
+
+ERROR_PREFIX = '["",{{"text":"[","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"red"}}," ",{{"text":"Error: ","color":"dark_red"}},'
+DEPENDENCY_TEXT = '{{"text":"{dependency_name}","color":"{dependency_color}"}}'
+INSTALLED_MAJOR_TEXT = '{"score":{"name":"#installed_major","objective":"nexus.value"},"color":"gold"},{"text":".x.x","color":"gold"}'
+INSTALLED_MINOR_TEXT = '{"score":{"name":"#installed_major","objective":"nexus.value"},"color":"gold"},{"text":".","color":"gold"},{"score":{"name":"#installed_minor","objective":"nexus.value"},"color":"gold"},{"text":".x","color":"gold"}'
+INSTALLED_PATCH_TEXT = '{"score":{"name":"#installed_major","objective":"nexus.value"},"color":"gold"},{"text":".","color":"gold"},{"score":{"name":"#installed_minor","objective":"nexus.value"},"color":"gold"},{"text":".","color":"gold"},{"score":{"name":"#installed_patch","objective":"nexus.value"},"color":"gold"}'
+
+DOWNLOAD_TEMPLATE = Text_Template('," ",{{"text":"Click here to download.","color":"red","underlined":true,"hoverEvent":{{"action":"show_text","value":[{{"text":"{name}","color":"{color}"}},{{"text":" download","color":"gray"}}]}},"clickEvent":{{"action":"open_url","value":"{link}"}}}}')
+NOT_INSTALLED_TEMPLATE = Text_Template(ERROR_PREFIX + DEPENDENCY_TEXT + ',{{"text":" is not installed.","color":"red"}}{dependency_download:raw}]')
+MULTIPLE_COPIES_TEMPLATE = Text_Template(ERROR_PREFIX + '{{"text":"Multiple copies of ","color":"red"}},' + DEPENDENCY_TEXT + ',{{"text":" exist. Remove all outdated versions.","color":"red"}}]')
+TOO_OLD_TEMPLATE = Text_Template(ERROR_PREFIX + DEPENDENCY_TEXT + '," ",{installed:raw},{{"text":" is too old, update it to the latest version.","color":"red"}}{dependency_download:raw}]')
+TOO_NEW_TEMPLATE = Text_Template(ERROR_PREFIX + DEPENDENCY_TEXT + '," ",{installed:raw},{{"text":" is too new, update ","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":" to the latest version.","color":"red"}}{module_download:raw}]')
+UNINSTALLED_TEMPLATE = Text_Template('["",{{"text":"[","color":"gray"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"gray"}}," ",{{"text":"Module was successfully uninstalled.","color":"gray"}}]')
+LOGIN_TEMPLATE = Text_Template(
+    '[" ", {{"text": "- ", "color": "gray"}}, {{"text": "{module_name}", "color": "gold"}}, {{"text": " - ", "color": "gray"}}, '
+    '{{"nbt": "modules[{{id:\\"{internal_id}\\"}}].version.major", "storage": "nexus:data", "color": "gold"}}, {{"text": ".", "color": "gold"}}, '
+    '{{"nbt": "modules[{{id:\\"{internal_id}\\"}}].version.minor", "storage": "nexus:data", "color": "gold"}}, {{"text": ".", "color": "gold"}}, '
+    '{{"nbt": "modules[{{id:\\"{internal_id}\\"}}].version.patch", "storage": "nexus:data", "color": "gold"}}]'
+)
+
+class Build_Trace:
+    """Records how long each stage of a build takes, along with the files, bytes, and directories it produces.
+
+    Events are stored in the Chrome trace event format, so a trace file can be opened in `chrome://tracing` or Perfetto.
+    Timestamps come from `perf_counter()`, which is shared between processes, so the events of every worker line up."""
+
+    __slots__ = (
+        "events",
+    )
+
+    events: list[dict[str, str | int | float | dict[str, str | int]]]
+    """Complete events which have been recorded."""
+
+    def __init__(self):
+        self.events = []
+
+    def record(self, name: str, category: str, start: float, end: float, arguments: dict[str, str | int]):
+        """Records an event from `start` to `end`, both taken from `perf_counter()`."""
+        self.events.append(
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start*1000000,
+                "dur": (end - start)*1000000,
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": arguments
+            }
+        )
+
+class File_Writer:
+    """Writes the files of a build plan one at a time, waiting for each write to finish before starting the next.
+
+    Operations are queued with `write()` and `link()`, and `finish()` waits for every queued operation.
+    A failed operation doesn't stop the others, its error is collected and returned by `finish()` instead.
+    The directory of a file must already exist when the file is queued."""
+
+    __slots__ = (
+        "errors",
+    )
+
+    errors: list[str]
+    """Errors of the operations which failed since `finish()` was last called."""
+
+    def __init__(self):
+        self.errors = []
+
+    def write(self, file_path: Path, contents: bytes):
+        """Queues writing `contents` to `file_path`."""
+        self.run(self.write_file, file_path, contents)
+
+    def link(self, source_path: Path, file_path: Path):
+        """Queues creating `file_path` as a hard link to `source_path`."""
+        self.run(self.link_file, source_path, file_path)
+
+    def run(self, function, *arguments):
+        """Runs a queued operation and records its error if it fails. Other writers override this to run it elsewhere."""
+        try:
+            function(*arguments)
+        except OSError as exception:
+            self.errors.append(f"{type(exception).__name__}: {exception}")
+
+    def finish(self) -> list[str]:
+        """Waits for every queued operation to finish, and returns the errors of the ones which failed."""
+        errors = self.errors
+        self.errors = []
+        return errors
+
+    @staticmethod
+    def write_file(file_path: Path, contents: bytes):
+        """Writes `contents` to `file_path`."""
+        with file_path.open("wb") as file:
+            file.write(contents)
+
+    @staticmethod
+    def link_file(source_path: Path, file_path: Path):
+        """Creates `file_path` as a hard link to `source_path`, or copies it if the file system doesn't support hard links."""
+        try:
+            os.link(source_path, file_path)
+        except OSError:
+            shutil.copy2(source_path, file_path)
+
+class Threaded_File_Writer(File_Writer):
+    """Writes the files of a build plan from a bounded pool of threads, keeping many small writes in flight at once.
+
+    This hides the round trip of each write on network file systems such as SMB or NFS, where it dominates the time taken."""
+
+    __slots__ = (
+        "threads",
+        "executor"
+    )
+
+    threads: int
+    """Maximum number of operations in flight at once."""
+    executor: ThreadPoolExecutor | None
+    """Pool which runs the queued operations, started when the first operation is queued."""
+
+    def __init__(self, threads: int = WRITER_THREADS):
+        super().__init__()
+        self.threads = threads
+        self.executor = None
+
+    def run(self, function, *arguments):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.threads)
+        self.executor.submit(super().run, function, *arguments)
+
+    def finish(self) -> list[str]:
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        return super().finish()
+
+WRITER_BACKENDS: dict[str, type[File_Writer]] = {
+    "serial": File_Writer,
+    "threaded": Threaded_File_Writer
+}
+
+class Build_Plan:
+    """Collects the files generated for a module so that they can be written in a single pass.
+
+    Files are added as `(path, bytes)` entries with `add()`, and written to the disk with `flush()`,
+    which creates each directory once before writing every file. Existing files can be deleted with `remove()`.
+
+    An incremental plan updates an existing module, keeping its other files and skipping files which didn't change.
+    Otherwise the plan replaces the module entirely."""
+
+    __slots__ = (
+        "module_path",
+        "incremental",
+        "files",
+        "volatile",
+        "preserved",
+        "removed",
+        "stale_folders",
+        "trace",
+        "writer"
+    )
+
+    module_path: Path
+    """Root folder of the module being generated."""
+    incremental: bool
+    """Determines whether the plan updates the existing module instead of replacing it."""
+    files: dict[Path, bytes]
+    """Contents of each planned file, keyed by its path."""
+    volatile: set[Path]
+    """Files which change on every run, and so are only written alongside other changes."""
+    preserved: set[Path]
+    """Files which belong to the user once they exist, and so are only written if they are missing."""
+    removed: set[Path]
+    """Existing files which get removed when flushing."""
+    stale_folders: list[Path]
+    """Folders in which every file that isn't planned gets removed."""
+    trace: Build_Trace | None
+    """Records the time taken by each part of flushing, if the build is being traced."""
+    writer: File_Writer
+    """Writes the files of the staging folder when flushing."""
+
+    def __init__(self, module_path: Path, incremental: bool = False, trace: Build_Trace | None = None, writer: File_Writer | None = None):
+        self.module_path = module_path
+        self.incremental = incremental
+        self.files = {}
+        self.volatile = set()
+        self.preserved = set()
+        self.removed = set()
+        self.stale_folders = []
+        self.trace = trace
+        self.writer = writer or File_Writer()
+
+    def add(self, file_path: Path, contents: bytes, volatile: bool = False, preserved: bool = False):
+        """Adds a file to the plan, replacing any earlier entry for the same path."""
+        self.files[file_path] = contents
+        self.volatile.discard(file_path)
+        self.preserved.discard(file_path)
+        self.removed.discard(file_path)
+        if volatile:
+            self.volatile.add(file_path)
+        if preserved:
+            self.preserved.add(file_path)
+
+    def existing_file(self, file_path: Path) -> bytes | None:
+        """Returns the current contents of a file in the module being updated, or `None` if it doesn't exist.
+
+        This is always `None` if the plan isn't incremental, since the module is being replaced."""
+        if not self.incremental:
+            return None
+        if is_zip_module(self.module_path):
+            try:
+                with zipfile.ZipFile(self.module_path) as archive:
+                    return archive.read(file_path.relative_to(self.module_path).as_posix())
+            except (FileNotFoundError, KeyError, zipfile.BadZipFile):
+                return None
+        try:
+            with file_path.open("rb") as file:
+                return file.read()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+
+    def minify(self):
+        """Minifies every planned file with `minify_file()`, for a release build."""
+        for file_path, contents in self.files.items():
+            self.files[file_path] = minify_file(file_path, contents)
+
+    def remove(self, file_path: Path):
+        """Marks an existing file of the module to be removed when flushing, replacing any earlier entry for the same path."""
+        self.files.pop(file_path, None)
+        self.volatile.discard(file_path)
+        self.preserved.discard(file_path)
+        self.removed.add(file_path)
+
+    def remove_stale(self, folder_path: Path):
+        """Marks a folder so that any file within it which isn't part of the plan is removed when flushing."""
+        self.stale_folders.append(folder_path)
+
+    def directories(self, file_paths: list[Path]) -> list[Path]:
+        """Returns every directory needed by `file_paths`, with parents ordered before their children."""
+        directories: set[Path] = {self.module_path}
+        for file_path in file_paths:
+            for parent in file_path.parents:
+                if parent in directories:
+                    break
+                directories.add(parent)
+        return sorted(directories, key=lambda directory: len(directory.parts))
+
+    def stale_files(self, existing: dict[Path, bytes] | None = None) -> list[Path]:
+        """Returns the existing files which were removed from the plan, or are in the stale folders and aren't part of the plan.
+
+        Files are looked up in `existing` if it is given, otherwise on the disk."""
+        if existing is not None:
+            stale_files = [file_path for file_path in sorted(self.removed) if file_path in existing]
+        else:
+            stale_files = [file_path for file_path in sorted(self.removed) if file_path.is_file()]
+        for folder_path in self.stale_folders:
+            if existing is not None:
+                stale_files.extend([file_path for file_path in existing if folder_path in file_path.parents and file_path not in self.files and file_path not in self.removed])
+                continue
+            if not folder_path.is_dir():
+                continue
+            for file_path in folder_path.rglob("*"):
+                if file_path not in self.files and file_path not in self.removed and not file_path.is_dir():
+                    stale_files.append(file_path)
+        return stale_files
+
+    def is_unchanged(self, file_path: Path, existing: dict[Path, bytes] | None = None) -> bool:
+        """Checks if the file already has the planned contents, or exists at all if it is preserved.
+
+        The file is looked up in `existing` if it is given, otherwise on the disk."""
+        if existing is not None:
+            if file_path in self.preserved:
+                return file_path in existing
+            return existing.get(file_path) == self.files[file_path]
+        if file_path in self.preserved:
+            return file_path.is_file()
+        try:
+            with file_path.open("rb") as file:
+                return file.read() == self.files[file_path]
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return False
+
+    def changes(self, existing: dict[Path, bytes] | None = None) -> tuple[list[Path], list[Path]]:
+        """Returns the planned files which need to be written, and the stale files which need to be removed.
+
+        For an incremental plan, files which already have the planned contents are left out,
+        and volatile files are only included if something else changed."""
+        stale_files = self.stale_files(existing)
+        if not self.incremental:
+            return list(self.files), stale_files
+        write_paths = [file_path for file_path in self.files if file_path not in self.volatile and not self.is_unchanged(file_path, existing)]
+        if write_paths or stale_files:
+            write_paths.extend([file_path for file_path in self.volatile if not self.is_unchanged(file_path, existing)])
+        return write_paths, stale_files
+
+    def read_existing(self, source_path: Path | None = None) -> dict[Path, bytes]:
+        """Reads every file of the existing module, whether it is a folder or a zip file.
+
+        The files are read from `source_path` if it is given, such as the zip file that a folder module is written to,
+        but are still keyed by their path within the module."""
+        if source_path is None:
+            source_path = self.module_path
+        existing: dict[Path, bytes] = {}
+        if is_zip_module(source_path) and source_path.is_file():
+            with zipfile.ZipFile(source_path) as archive:
+                for info in archive.infolist():
+                    if not info.is_dir():
+                        existing[self.module_path / info.filename] = archive.read(info)
+        elif source_path.is_dir():
+            for file_path in source_path.rglob("*"):
+                if file_path.is_file():
+                    existing[self.module_path / file_path.relative_to(source_path)] = file_path.read_bytes()
+        return existing
+
+    def diff(self, source_path: Path | None = None) -> list[tuple[str, Path, int]]:
+        """Compares the plan with the module on the disk, or at `source_path` if it is given, without writing anything.
+
+        Returns the status of each file that flushing would add, modify, or delete, along with the change in its size in bytes.
+        An incremental folder plan only reads the planned files and the stale folders, rather than the whole module.
+        For an incremental plan written to another `source_path`, such as a folder module written as a zip file,
+        the files which `flush_zip()` would combine from the module and the plan are compared with `source_path` instead."""
+        if source_path is None:
+            source_path = self.module_path
+        existing: dict[Path, bytes] | None = None
+        planned = self.files
+        if self.incremental and source_path == self.module_path and not is_zip_module(source_path):
+            write_paths, stale_files = self.changes()
+        elif self.incremental and source_path != self.module_path:
+            current = self.read_existing()
+            planned = self.combine(current, *self.changes(current))
+            existing = self.read_existing(source_path)
+            write_paths = [file_path for file_path in planned if existing.get(file_path) != planned[file_path]]
+            stale_files = [file_path for file_path in existing if file_path not in planned]
+        else:
+            existing = self.read_existing(source_path)
+            if self.incremental:
+                write_paths, stale_files = self.changes(existing)
+            else:
+                write_paths = [file_path for file_path in self.files if existing.get(file_path) != self.files[file_path]]
+                stale_files = [file_path for file_path in existing if file_path not in self.files]
+
+        differences: list[tuple[str, Path, int]] = []
+        for file_path in sorted(write_paths):
+            size = self.existing_size(file_path, existing)
+            if size is None:
+                differences.append(("added", file_path, len(planned[file_path])))
+            else:
+                differences.append(("modified", file_path, len(planned[file_path]) - size))
+        for file_path in sorted(stale_files):
+            differences.append(("deleted", file_path, -(self.existing_size(file_path, existing) or 0)))
+        return differences
+
+    def combine(self, existing: dict[Path, bytes], write_paths: list[Path], stale_files: list[Path]) -> dict[Path, bytes]:
+        """Returns the files of the existing module which aren't stale, with the planned files that need to be written in place of them."""
+        combined = {file_path: contents for file_path, contents in existing.items() if file_path not in stale_files}
+        for file_path, contents in self.files.items():
+            if file_path in existing and file_path not in write_paths:
+                continue
+            combined[file_path] = contents
+        return combined
+
+    def existing_size(self, file_path: Path, existing: dict[Path, bytes] | None = None) -> int | None:
+        """Returns the size of a file of the existing module in bytes, or `None` if it doesn't exist.
+
+        The file is looked up in `existing` if it is given, otherwise on the disk."""
+        if existing is not None:
+            return len(existing[file_path]) if file_path in existing else None
+        try:
+            return file_path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def flush(self) -> tuple[int, int, int]:
+        """Writes the plan into a staging folder next to the module, then swaps it into place with a rename.
+
+        The live module is never partially written, so a reload during a build sees either the old or the new module.
+        For an incremental plan, the existing files of the module are carried over into the staging folder as hard links,
+        files which already have the planned contents are skipped, volatile files are only written if something else changed,
+        and the module is left untouched if nothing changed. Files are written through the plan's writer,
+        and if any of them fail, the module is left untouched and an `OSError` listing every failure is raised.
+        Returns the number of files written, skipped, and removed."""
+        start = perf_counter()
+        write_paths, stale_files = self.changes()
+        if self.trace:
+            self.trace.record("compare", "flush", start, perf_counter(), {"files": len(self.files), "changed": len(write_paths), "stale": len(stale_files)})
+        if self.incremental and not write_paths and not stale_files:
+            return 0, len(self.files), 0
+
+        staging_path = self.module_path.parent / f'.{self.module_path.name}.staging'
+        if staging_path.exists():
+            shutil.rmtree(staging_path)
+
+        # Carry over existing files
+        errors: list[str] = []
+        if self.incremental and self.module_path.is_dir():
+            start = perf_counter()
+            linked = self.link_existing(staging_path, set(write_paths) | set(stale_files))
+            errors.extend(self.writer.finish())
+            for folder_path in self.stale_folders:
+                staged_folder_path = staging_path / folder_path.relative_to(self.module_path)
+                if not staged_folder_path.is_dir():
+                    continue
+                for directory in sorted(staged_folder_path.rglob("*"), key=lambda directory: len(directory.parts), reverse=True):
+                    if directory.is_dir() and not any(directory.iterdir()):
+                        directory.rmdir()
+            for file_path in self.removed:
+                for directory in (staging_path / file_path.relative_to(self.module_path)).parents:
+                    if directory == staging_path or not directory.is_dir() or any(directory.iterdir()):
+                        break
+                    directory.rmdir()
+            if self.trace:
+                self.trace.record("link", "flush", start, perf_counter(), {"files": linked})
+
+        # Create directories
+        start = perf_counter()
+        created = 0
+        self.module_path.parent.mkdir(exist_ok=True, parents=True)
+        for directory in self.directories(write_paths):
+            try:
+                (staging_path / directory.relative_to(self.module_path)).mkdir()
+                created += 1
+            except FileExistsError:
+                pass
+        if self.trace:
+            self.trace.record("mkdir", "flush", start, perf_counter(), {"directories": created})
+
+        # Write files
+        start = perf_counter()
+        for file_path in write_paths:
+            self.writer.write(staging_path / file_path.relative_to(self.module_path), self.files[file_path])
+        errors.extend(self.writer.finish())
+        if self.trace:
+            self.trace.record("write", "flush", start, perf_counter(), {"files": len(write_paths), "bytes": sum(len(self.files[file_path]) for file_path in write_paths)})
+        if errors:
+            shutil.rmtree(staging_path, True)
+            raise OSError(f'{len(errors)} file{"" if len(errors) == 1 else "s"} could not be written, the module was left untouched: {"; ".join(errors)}')
+
+        start = perf_counter()
+        self.swap(staging_path)
+        if self.trace:
+            self.trace.record("swap", "flush", start, perf_counter(), {})
+        return len(write_paths), len(self.files) - len(write_paths), len(stale_files)
+
+    def link_existing(self, staging_path: Path, excluded: set[Path]) -> int:
+        """Recreates the existing module in the staging folder using hard links, leaving out the excluded files.
+
+        Files are copied instead if the file system doesn't support hard links. Directories are created right away,
+        while the files are queued on the writer. Returns the number of files carried over."""
+        linked = 0
+        for directory, _, file_names in os.walk(self.module_path):
+            directory = Path(directory)
+            staged_directory = staging_path / directory.relative_to(self.module_path)
+            staged_directory.mkdir()
+            for file_name in file_names:
+                if directory / file_name in excluded:
+                    continue
+                self.writer.link(directory / file_name, staged_directory / file_name)
+                linked += 1
+        return linked
+
+    def swap(self, staging_path: Path):
+        """Renames the staging folder into the place of the module, and deletes the old module in the background."""
+        if not self.module_path.exists():
+            os.rename(staging_path, self.module_path)
+            return
+        old_path = self.module_path.parent / f'.{self.module_path.name}.old.{time_ns()}'
+        os.rename(self.module_path, old_path)
+        os.rename(staging_path, self.module_path)
+        threading.Thread(target=shutil.rmtree, args=(old_path, True)).start()
+
+    def flush_zip(self, zip_path: Path) -> tuple[int, int, int]:
+        """Streams the planned files into a zip data pack at `zip_path` without creating any folders.
+
+        Entries are sorted and timestamped identically on every run so that the zip is reproducible.
+        For an incremental plan, the files of the existing module are carried over into the zip,
+        and a zip module being updated in place is left untouched if nothing changed.
+        Returns the number of files written, skipped, and removed."""
+        start = perf_counter()
+        existing: dict[Path, bytes] = self.read_existing() if self.incremental else {}
+        write_paths, stale_files = self.changes(existing)
+        if self.trace:
+            self.trace.record("compare", "flush", start, perf_counter(), {"files": len(self.files), "existing": len(existing), "changed": len(write_paths), "stale": len(stale_files)})
+        if self.incremental and zip_path == self.module_path and not write_paths and not stale_files:
+            return 0, len(self.files), 0
+
+        # Combine planned files with existing files
+        entries = {file_path.relative_to(self.module_path).as_posix(): contents for file_path, contents in self.combine(existing, write_paths, stale_files).items()}
+
+        # Write zip
+        start = perf_counter()
+        zip_path.parent.mkdir(exist_ok=True, parents=True)
+        temporary_path = zip_path.parent / f'{zip_path.name}.tmp'
+        with zipfile.ZipFile(temporary_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for name in sorted(entries):
+                info = zipfile.ZipInfo(name, ZIP_DATE_TIME)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                archive.writestr(info, entries[name])
+        os.replace(temporary_path, zip_path)
+        if self.trace:
+            self.trace.record("write_zip", "flush", start, perf_counter(), {"files": len(entries), "bytes": sum(map(len, entries.values())), "compressed_bytes": zip_path.stat().st_size})
+
+        return len(write_paths), len(self.files) - len(write_paths), len(stale_files)
+
+class Module_Catalog:
+    """A local SQLite catalog of the `module_info.json` of every module in a workspace.
+
+    Entries are refreshed with `refresh()`, which only re-reads modules whose `module_info.json` changed since the last refresh.
+    The catalog can then be listed with `modules()` and searched with `query()`."""
+
+    __slots__ = (
+        "workspace",
+        "connection"
+    )
+
+    workspace: Path
+    """Folder which contains the modules."""
+    connection: sqlite3.Connection
+    """Connection to the catalog database."""
+
+    def __init__(self, workspace: Path, database_path: Path | None = None):
+        self.workspace = workspace.resolve()
+        self.connection = sqlite3.connect(database_path or workspace / CATALOG_FILE_NAME)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+
+        # Rebuild the tables if they were made by a different version
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != CATALOG_SCHEMA_VERSION:
+            self.connection.executescript(
+                f"""
+                DROP TABLE IF EXISTS features;
+                DROP TABLE IF EXISTS dependencies;
+                DROP TABLE IF EXISTS modules;
+                CREATE TABLE modules (
+                    path TEXT PRIMARY KEY,
+                    mtime INTEGER NOT NULL,
+                    module_name TEXT,
+                    author TEXT,
+                    major INTEGER,
+                    minor INTEGER,
+                    patch INTEGER,
+                    internal_id TEXT,
+                    namespace TEXT,
+                    download_link TEXT,
+                    settings TEXT NOT NULL
+                );
+                CREATE TABLE dependencies (
+                    path TEXT NOT NULL REFERENCES modules(path) ON DELETE CASCADE,
+                    module_name TEXT,
+                    internal_id TEXT,
+                    major INTEGER,
+                    minor INTEGER,
+                    patch INTEGER
+                );
+                CREATE TABLE features (
+                    path TEXT NOT NULL REFERENCES modules(path) ON DELETE CASCADE,
+                    feature TEXT NOT NULL,
+                    value TEXT
+                );
+                CREATE INDEX modules_internal_id ON modules(internal_id);
+                CREATE INDEX dependencies_internal_id ON dependencies(internal_id);
+                CREATE INDEX features_feature ON features(feature, value);
+                PRAGMA user_version = {CATALOG_SCHEMA_VERSION};
+                """
+            )
+
+    def close(self):
+        """Closes the connection to the catalog database."""
+        self.connection.close()
+
+    def refresh(self) -> tuple[int, int]:
+        """Brings the catalog up to date with the modules in the workspace.
+
+        Only modules whose `module_info.json` has a different modification time are read again.
+        Returns the number of modules which were read and removed."""
+        found: dict[str, int] = {}
+        with os.scandir(self.workspace) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir():
+                    try:
+                        found[entry.path] = os.stat(os.path.join(entry.path, "module_info.json")).st_mtime_ns
+                    except (FileNotFoundError, NotADirectoryError):
+                        continue
+                elif entry.is_file() and entry.name.endswith(".zip"):
+                    found[entry.path] = entry.stat().st_mtime_ns
+
+        stored: dict[str, int] = dict(self.connection.execute("SELECT path, mtime FROM modules"))
+        read = 0
+        with self.connection:
+            removed = [path for path in stored if path not in found]
+            self.connection.executemany("DELETE FROM modules WHERE path = ?", [(path,) for path in removed])
+            for path, mtime in found.items():
+                if stored.get(path) == mtime:
+                    continue
+                settings_json, error_message = read_module_info(Path(path))
+                self.connection.execute("DELETE FROM modules WHERE path = ?", (path,))
+                if error_message:
+                    continue
+                self.store(path, mtime, settings_json)
+                read += 1
+        return read, len(removed)
+
+    def store(self, path: str, mtime: int, settings_json: dict[str, dict[str, str]]):
+        """Inserts the contents of a module's `module_info.json` into the catalog."""
+        module_info = settings_json.get(Setting_Category.MODULE_INFO.value, {})
+        self.connection.execute(
+            "INSERT INTO modules VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                mtime,
+                module_info.get(Module_Setting.MODULE_NAME.value),
+                module_info.get(Module_Setting.AUTHOR.value),
+                *version_tuple(module_info.get(Module_Setting.VERSION.value)),
+                module_info.get(Module_Setting.INTERNAL_ID.value),
+                module_info.get(Module_Setting.NAMESPACE.value),
+                module_info.get(Module_Setting.DOWNLOAD_LINK.value),
+                json.dumps(settings_json)
+            )
+        )
+        self.connection.executemany(
+            "INSERT INTO dependencies VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    path,
+                    dependency.get(Module_Setting.MODULE_NAME.value),
+                    dependency.get(Module_Setting.INTERNAL_ID.value),
+                    *version_tuple(dependency.get(Module_Setting.VERSION.value))
+                )
+                for dependency in settings_json.get(Setting_Category.DEPENDENCIES.value, [])
+                if isinstance(dependency, dict)
+            ]
+        )
+        self.connection.executemany(
+            "INSERT INTO features VALUES (?, ?, ?)",
+            [
+                (path, feature, json.dumps(value))
+                for feature, value in settings_json.get(Setting_Category.FEATURES.value, {}).items()
+            ]
+        )
+
+    def modules(self) -> list[Path]:
+        """Returns the path of every cataloged module, sorted by name."""
+        return [Path(path) for path, in self.connection.execute("SELECT path FROM modules ORDER BY path")]
+
+    def settings(self, module_path: Path) -> tuple[dict[str, dict[str, str]], str]:
+        """Returns the cataloged `module_info.json` of a module without reading it from the disk,
+        along with an error message. Modules which aren't in the catalog are read from the disk instead."""
+        row = self.connection.execute("SELECT settings FROM modules WHERE path = ?", (str(module_path.resolve()),)).fetchone()
+        if row is None:
+            return read_module_info(module_path)
+        return json.loads(row[0]), ""
+
+    def query(
+        self,
+        depends_on: str | None = None,
+        below: Version | None = None,
+        at_least: Version | None = None,
+        features: dict[str, bool | int | str] | None = None
+    ) -> list[tuple[Path, str, str]]:
+        """Searches the catalog, returning the path, internal ID, and version of each matching module.
+
+        `depends_on` matches modules with a dependency on that internal ID, optionally limited to versions
+        `below` and `at_least` the ones given. `features` matches modules with those feature values."""
+        conditions: list[str] = []
+        parameters: list[str | int] = []
+        if depends_on is not None:
+            dependency_conditions = ["dependencies.path = modules.path", "dependencies.internal_id = ?"]
+            parameters.append(depends_on)
+            if below is not None:
+                dependency_conditions.append("(dependencies.major, dependencies.minor, dependencies.patch) < (?, ?, ?)")
+                parameters.extend([below.major, below.minor, below.patch])
+            if at_least is not None:
+                dependency_conditions.append("(dependencies.major, dependencies.minor, dependencies.patch) >= (?, ?, ?)")
+                parameters.extend([at_least.major, at_least.minor, at_least.patch])
+            conditions.append(f"EXISTS (SELECT 1 FROM dependencies WHERE {' AND '.join(dependency_conditions)})")
+        for feature, value in (features or {}).items():
+            conditions.append("EXISTS (SELECT 1 FROM features WHERE features.path = modules.path AND feature = ? AND value = ?)")
+            parameters.extend([feature, json.dumps(value)])
+
+        return [
+            (Path(path), internal_id, f'{major}.{minor}.{patch}')
+            for path, internal_id, major, minor, patch in self.connection.execute(
+                "SELECT path, internal_id, major, minor, patch FROM modules" +
+                (f" WHERE {' AND '.join(conditions)}" if conditions else "") +
+                " ORDER BY path",
+                parameters
+            )
+        ]
+
+class Generation_Cache:
+    """A local SQLite cache of the files generated for each distinct set of module settings.
+
+    Entries are keyed by `key()`, a hash of the normalized settings along with the versions that decide what gets generated.
+    The module name, internal ID, and namespace are left out of the key, since cached files are generated with `CACHE_PLACEHOLDERS`
+    in their place, and `fill()` puts the values of the module being created into the paths and contents of the files.
+    `load()` fills a build plan from a matching entry and `store()` saves the files of a plan, evicting the least recently used
+    entries once the cache grows past its size limit. Volatile files are never stored, since they change on every run."""
+
+    __slots__ = (
+        "connection",
+        "size_limit"
+    )
+
+    connection: sqlite3.Connection
+    """Connection to the cache database."""
+    size_limit: int
+    """Total size in bytes of the cached files past which the least recently used entries are evicted."""
+
+    def __init__(self, database_path: Path = PROGRAM_PATH / CACHE_FILE_NAME, size_limit: int = CACHE_SIZE_LIMIT):
+        self.connection = sqlite3.connect(database_path, timeout=30)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.size_limit = size_limit
+
+        # Rebuild the tables if they were made by a different version
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != CACHE_SCHEMA_VERSION:
+            self.connection.executescript(
+                f"""
+                DROP TABLE IF EXISTS files;
+                DROP TABLE IF EXISTS entries;
+                DROP TABLE IF EXISTS counters;
+                CREATE TABLE entries (
+                    key TEXT PRIMARY KEY,
+                    size INTEGER NOT NULL,
+                    last_used INTEGER NOT NULL
+                );
+                CREATE TABLE files (
+                    key TEXT NOT NULL REFERENCES entries(key) ON DELETE CASCADE,
+                    path TEXT NOT NULL,
+                    contents BLOB NOT NULL,
+                    preserved INTEGER NOT NULL
+                );
+                CREATE TABLE counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                );
+                CREATE INDEX files_key ON files(key);
+                CREATE INDEX entries_last_used ON entries(last_used);
+                PRAGMA user_version = {CACHE_SCHEMA_VERSION};
+                """
+            )
+
+    def close(self):
+        """Closes the connection to the cache database."""
+        self.connection.close()
+
+    @staticmethod
+    def key(settings_json: dict[str, dict[str, str | int | bool] | list[dict[str, str]] | list[str]]) -> str:
+        """Returns the cache key of a set of exported settings.
+
+        The settings in `CACHE_PLACEHOLDERS` are left out, and the rest are normalized by sorting their keys, and hashed along with
+        `MODULE_MANAGER_VERSION`, `PACK_FORMAT`, and `CACHE_GENERATOR_FINGERPRINT`, so that any change to this program which isn't released as a new version still misses the cache."""
+        settings_json = settings_json | {
+            Setting_Category.MODULE_INFO.value: {
+                setting: value
+                for setting, value in settings_json[Setting_Category.MODULE_INFO.value].items()
+                if setting not in CACHE_PLACEHOLDERS
+            }
+        }
+        normalized = json.dumps([MODULE_MANAGER_VERSION, PACK_FORMAT, CACHE_GENERATOR_FINGERPRINT, settings_json], sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def fill(path: str, contents: bytes, values: dict[str, str]) -> tuple[str, bytes]:
+        """Returns the path within the module and the contents of a file generated with `CACHE_PLACEHOLDERS`,
+        with each placeholder replaced by the value of the same setting in `values`.
+
+        Values are escaped the same way `json.dumps()` escapes them in JSON files,
+        and the hash in the header of a dispatch function is taken again from the filled commands."""
+        text = contents.decode("utf-8", errors="surrogateescape")
+        for setting, placeholder in CACHE_PLACEHOLDERS.items():
+            path = path.replace(placeholder, values[setting])
+            text = text.replace(placeholder, json.dumps(values[setting])[1:-1] if path.endswith((".json", ".mcmeta")) else values[setting])
+        if path.endswith(".mcfunction") and text.startswith(MINIFY_KEPT_PREFIXES):
+            header, _, commands = text.partition("\n")
+            prefix = next(prefix for prefix in MINIFY_KEPT_PREFIXES if header.startswith(prefix))
+            text = prefix + dispatch_hash([line.strip() for line in commands.splitlines() if line.strip()]) + "\n" + commands
+        return path, text.encode("utf-8", errors="surrogateescape")
+
+    def load(self, key: str, plan: Build_Plan, values: dict[str, str]) -> bool:
+        """Adds the cached files of `key` to the plan, filled in with `values` by `fill()`, and returns `True` if the key was in the cache."""
+        with self.connection:
+            found = self.connection.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time_ns(), key)).rowcount > 0
+            self.count("hits" if found else "misses")
+        if not found:
+            return False
+        for path, contents, preserved in self.connection.execute("SELECT path, contents, preserved FROM files WHERE key = ?", (key,)):
+            path, contents = self.fill(path, contents, values)
+            plan.add(plan.module_path / path, contents, preserved=bool(preserved))
+        return True
+
+    def store(self, key: str, plan: Build_Plan):
+        """Saves every file of the plan which isn't volatile under `key`, then evicts entries if the cache is too large.
+        The plan must have been generated with `CACHE_PLACEHOLDERS`.
+
+        Plans which are larger than the whole cache are not stored."""
+        files = [
+            (key, file_path.relative_to(plan.module_path).as_posix(), contents, int(file_path in plan.preserved))
+            for file_path, contents in plan.files.items()
+            if file_path not in plan.volatile
+        ]
+        size = sum(len(contents) for _, _, contents, _ in files)
+        if size > self.size_limit:
+            return
+        with self.connection:
+            self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.connection.execute("INSERT INTO entries VALUES (?, ?, ?)", (key, size, time_ns()))
+            self.connection.executemany("INSERT INTO files VALUES (?, ?, ?, ?)", files)
+            self.evict()
+
+    def evict(self):
+        """Removes the least recently used entries until the cached files fit within the size limit."""
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.size_limit:
+            return
+        evicted: list[tuple[str]] = []
+        for key, size in self.connection.execute("SELECT key, size FROM entries ORDER BY last_used").fetchall():
+            if total <= self.size_limit:
+                break
+            evicted.append((key,))
+            total -= size
+        self.connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+        self.count("evictions", len(evicted))
+
+    def count(self, name: str, amount: int = 1):
+        """Adds to one of the counters reported by `statistics()`."""
+        self.connection.execute(
+            "INSERT INTO counters VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount)
+        )
+
+    def statistics(self) -> dict[str, int]:
+        """Returns the number of entries, their total size, and the number of hits, misses, and evictions."""
+        counters: dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+        counters.update(self.connection.execute("SELECT name, value FROM counters"))
+        entries, size = self.connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": entries, "size": size, **counters}
+
+    def clear(self):
+        """Removes every entry and resets the counters."""
+        with self.connection:
+            self.connection.execute("DELETE FROM entries")
+            self.connection.execute("DELETE FROM counters")
+
+
+
+
+
+
+class Module_Linter:
+    """Finds expensive commands in the functions which the Nexus runs every tick for a module.
+
+    The functions of the module are parsed in parallel by `parse_function_files()`. `lint()` then follows the `function` calls
+    from the Nexus tags run every tick, and scores each expensive command by the weight of its rule in `LINT_RULES`
+    times the number of times it runs per tick, which is multiplied by each `execute as` or `execute at` over players or entities."""
+
+    __slots__ = (
+        "module_path",
+        "functions",
+        "tags"
+    )
+
+    module_path: Path
+    """Folder or zip file of the module being linted."""
+    functions: dict[str, list[tuple[int, str, int, str, list[str]]]]
+    """Line number, command, iteration multiplier, called function, and broken rules of each command, keyed by function ID."""
+    tags: dict[str, list[str]]
+    """Entries of each function tag in the module, keyed by its ID starting with `#`."""
+
+    def __init__(self, module_path: Path, jobs: int | None = None):
+        self.module_path = module_path
+        self.functions = {}
+        self.tags = {}
+
+        # Find files
+        function_names: list[str] = []
+        tag_files: dict[str, bytes] = {}
+        if is_zip_module(module_path):
+            with zipfile.ZipFile(module_path) as archive:
+                names = archive.namelist()
+                function_names = [name for name in names if name.endswith(".mcfunction")]
+                tag_files = {name: archive.read(name) for name in names if "/tags/functions/" in name and name.endswith(".json")}
+        else:
+            for file_path in module_path.glob("data/*/functions/**/*.mcfunction"):
+                function_names.append(file_path.relative_to(module_path).as_posix())
+            for file_path in module_path.glob("data/*/tags/functions/**/*.json"):
+                tag_files[file_path.relative_to(module_path).as_posix()] = file_path.read_bytes()
+
+        # Read tags
+        for name, contents in tag_files.items():
+            parts = name.split("/")
+            try:
+                values = json.loads(contents)["values"]
+            except (json.JSONDecodeError, UnicodeDecodeError, TypeError, KeyError):
+                continue
+            self.tags["#" + parts[1] + ":" + "/".join(parts[4:]).removesuffix(".json")] = [
+                value["id"] if isinstance(value, dict) else value
+                for value in values
+                if isinstance(value, str) or isinstance(value, dict) and isinstance(value.get("id"), str)
+            ]
+
+        # Parse functions in parallel
+        if len(function_names) < 2*LINT_ENTITY_COUNT:
+            self.functions.update(parse_function_files(str(module_path), function_names))
+            return
+        chunk_size = -(-len(function_names)//(4*(jobs or os.cpu_count() or 1)))
+        chunks = [function_names[i:i + chunk_size] for i in range(0, len(function_names), chunk_size)]
+        with ProcessPoolExecutor(jobs) as executor:
+            for functions in executor.map(parse_function_files, [str(module_path)]*len(chunks), chunks):
+                self.functions.update(functions)
+
+    def lint(self) -> tuple[list[tuple[int, str, int, str, list[str], str, int]], int]:
+        """Follows the function calls from each entry point in `LINT_ENTRY_POINTS` and scores every command which breaks a rule.
+
+        A function reached along several paths is scored along the one which runs it the most times per tick.
+        Returns the score, function ID, line number, command, broken rules, entry point, and call depth of each finding,
+        with the highest scores first, along with the number of functions which are run every tick."""
+        best: dict[str, int] = {}
+        findings: dict[tuple[str, int], tuple[int, str, int, str, list[str], str, int]] = {}
+        stack: list[tuple[str, int, int, str]] = [
+            (f"#nexus:{entry_point}", multiplier, 0, entry_point)
+            for entry_point, multiplier in LINT_ENTRY_POINTS.items()
+        ]
+        while stack:
+            function_id, multiplier, depth, entry_point = stack.pop()
+            if depth > LINT_MAX_DEPTH:
+                continue
+
+            # Expand function tags
+            if function_id.startswith("#"):
+                stack.extend([(value, multiplier, depth, entry_point) for value in self.tags.get(function_id, [])])
+                continue
+            if function_id not in self.functions or best.get(function_id, 0) >= multiplier:
+                continue
+            best[function_id] = multiplier
+
+            # Score commands
+            for line_number, command, iterations, call, rules in self.functions[function_id]:
+                if rules:
+                    score = sum(LINT_RULES[rule] for rule in rules)*multiplier*iterations
+                    if score > findings.get((function_id, line_number), (0,))[0]:
+                        findings[(function_id, line_number)] = score, function_id, line_number, command, rules, entry_point, depth
+                if call:
+                    stack.append((call, multiplier*iterations, depth + 1, entry_point))
+
+        return sorted(findings.values(), key=lambda finding: (-finding[0], finding[1], finding[2])), len(best)
+
+class Module_Bundle:
+    """Several modules merged into a single data pack, for worlds which always run the same set of modules.
+
+    Files are merged by their path within the modules, and tags are merged by combining their entries,
+    the same way the game combines tags with `"replace": false`. `fuse()` then replaces the entity and object verify functions
+    of the modules, which the Nexus runs one after another for every entity every tick, with a single dispatcher for the bundle."""
+
+    __slots__ = (
+        "files",
+        "tags",
+        "modules",
+        "pack_format",
+        "message"
+    )
+
+    files: dict[str, bytes]
+    """Contents of each merged file other than tags, keyed by its path within the data pack."""
+    tags: dict[str, list[str | dict[str, str | bool]]]
+    """Combined entries of each tag, keyed by its path within the data pack."""
+    modules: list[tuple[str, str]]
+    """Name and namespace of each bundled module."""
+    pack_format: int
+    """Highest pack format of the bundled modules."""
+    message: str
+    """Errors and warnings found while merging the modules."""
+
+    def __init__(self, module_paths: list[Path]):
+        self.files = {}
+        self.tags = {}
+        self.modules = []
+        self.pack_format = PACK_FORMAT
+        self.message = ""
+        for module_path in module_paths:
+            if not is_module(module_path):
+                self.message += f" ERROR: {module_path.as_posix()} is not a module!\n"
+                continue
+            settings_json, error_message = read_module_info(module_path)
+            if error_message:
+                self.message += error_message
+                continue
+            record, error_message = Module_Record.from_json(settings_json)
+            if error_message:
+                self.message += f" ERROR: {module_path.as_posix()}/module_info.json has invalid settings! Check it with the validate command.\n"
+                continue
+            if record.namespace in [namespace for _, namespace in self.modules]:
+                self.message += f" ERROR: {module_path.as_posix()} uses the namespace {record.namespace}, which is already used by another module in the bundle!\n"
+                continue
+            self.modules.append((record.module_name, record.namespace))
+
+            # Merge files
+            for file_path, contents in Build_Plan(module_path, True).read_existing().items():
+                name = file_path.relative_to(module_path).as_posix()
+                if name == "pack.mcmeta":
+                    try:
+                        self.pack_format = max(self.pack_format, json.loads(contents)["pack"]["pack_format"])
+                    except (json.JSONDecodeError, UnicodeDecodeError, TypeError, KeyError):
+                        pass
+                    continue
+                if "/" not in name:
+                    continue
+                parts = name.split("/")
+                if len(parts) > 3 and parts[2] == "tags" and name.endswith(".json"):
+                    self.merge_tag(name, contents, module_path)
+                elif self.files.get(name, contents) != contents:
+                    self.message += f" ERROR: {name} is in more than one module with different contents, including {module_path.name}!\n"
+                else:
+                    self.files[name] = contents
+
+    def merge_tag(self, name: str, contents: bytes, module_path: Path):
+        """Adds the entries of a module's tag to the combined entries of the tag, skipping entries which are already there."""
+        try:
+            tag_json = json.loads(contents)
+            values = tag_json["values"]
+        except (json.JSONDecodeError, UnicodeDecodeError, TypeError, KeyError):
+            self.message += f" ERROR: {name} in {module_path.name} is not properly formatted!\n"
+            return
+        if tag_json.get("replace", False):
+            self.message += f" ERROR: {name} in {module_path.name} replaces the tag, so it can't be merged with the other modules!\n"
+            return
+        combined = self.tags.setdefault(name, [])
+        for value in values:
+            if value not in combined:
+                combined.append(value)
+
+    def fuse(self, namespace: str) -> int:
+        """Replaces the entity and object verify functions of the bundled modules in the Nexus tags with a dispatcher in `namespace`.
+
+        Each entity is checked for the tag of every module only until it has one, which is then stored as a score,
+        so that finding the main function of its module takes a logarithmic number of commands from then on.
+        The tag is checked again before running the main function, and the score is reset once the entity loses it.
+        Entities with the tags of several modules are given a score of -1, and check every tag each time like before.
+        Entities without the tag of any module are given a score of 0, so that they aren't checked again every tick.
+        The objectives are created by `<namespace>:setup/main` and removed by `<namespace>:uninstall/main`.
+        Verify functions which were edited are left in the tags. Returns the number of verify functions replaced."""
+        fused = 0
+        setup: list[str] = []
+        uninstall: list[str] = []
+        for category in ["entity", "object"]:
+            tag_name = f"data/nexus/tags/functions/{category}/main.json"
+            values = self.tags.get(tag_name, [])
+
+            # Find unedited verify functions
+            namespaces: list[str] = []
+            for _, module_namespace in self.modules:
+                file_name = f"data/{module_namespace}/functions/{category}/verify.mcfunction"
+                if f"{module_namespace}:{category}/verify" not in values or file_name not in self.files:
+                    continue
+                generated = "\n".join(
+                    [
+                        f'# Run function if {category} is from the right module', '',
+                        f'execute if entity @s[tag={module_namespace}.{category}] run function {module_namespace}:{category}/main'
+                    ]
+                ).encode("utf-8")
+                if self.files[file_name] not in [generated, minify_file(Path(file_name), generated)]:
+                    self.message += f" WARNING: {module_namespace}:{category}/verify was edited, so it was left out of the dispatcher.\n"
+                    continue
+                values.remove(f"{module_namespace}:{category}/verify")
+                del self.files[file_name]
+                namespaces.append(module_namespace)
+            if not namespaces:
+                continue
+            fused += len(namespaces)
+
+            # Create dispatcher
+            objective = f"{namespace}.{category}"
+            root, branches = dispatch_tree(
+                len(namespaces),
+                f'execute if score @s {objective} matches',
+                lambda i: f'function {namespace}:{category}/module/{namespaces[i - 1]}',
+                lambda low, high: f'{namespace}:{category}/dispatch/{low}_{high}'
+            )
+            for (low, high), contents in branches.items():
+                self.files[f"data/{namespace}/functions/{category}/dispatch/{low}_{high}.mcfunction"] = "\n".join(contents).encode("utf-8")
+            self.files[f"data/{namespace}/functions/{category}/verify.mcfunction"] = "\n".join(
+                [
+                    f'# Find the module of the {category} until it has one', '',
+                    f'execute unless score @s {objective} matches -1.. run function {namespace}:{category}/assign',
+                    '',
+                    '# Run function based on module', '',
+                    f'execute if score @s {objective} matches -1 run function {namespace}:{category}/shared'
+                ] + root
+            ).encode("utf-8")
+            assign: list[str] = [f'# Mark {category} with the module it belongs to, with -1 if it belongs to several, or with 0 if it belongs to none', '']
+            for i, module_namespace in enumerate(namespaces, 1):
+                assign.extend(
+                    [
+                        f'execute if entity @s[tag={module_namespace}.{category}] if score @s {objective} matches 1.. run scoreboard players set @s {objective} -1',
+                        f'execute if entity @s[tag={module_namespace}.{category}] unless score @s {objective} matches -1.. run scoreboard players set @s {objective} {i}'
+                    ]
+                )
+                self.files[f"data/{namespace}/functions/{category}/module/{module_namespace}.mcfunction"] = "\n".join(
+                    [
+                        f'# Run function if {category} is still from the module, and find its module again otherwise', '',
+                        f'execute if entity @s[tag={module_namespace}.{category}] run function {module_namespace}:{category}/main',
+                        f'execute unless entity @s[tag={module_namespace}.{category}] run scoreboard players reset @s {objective}'
+                    ]
+                ).encode("utf-8")
+            assign.append(f'execute unless score @s {objective} matches -1.. run scoreboard players set @s {objective} 0')
+            self.files[f"data/{namespace}/functions/{category}/assign.mcfunction"] = "\n".join(assign).encode("utf-8")
+            self.files[f"data/{namespace}/functions/{category}/shared.mcfunction"] = "\n".join(
+                [f'# Run the function of every module the {category} is from', '']
+                + [f'execute if entity @s[tag={module_namespace}.{category}] run function {module_namespace}:{category}/main' for module_namespace in namespaces]
+            ).encode("utf-8")
+            values.append(f"{namespace}:{category}/verify")
+            setup.append(f'scoreboard objectives add {objective} dummy')
+            uninstall.append(f'scoreboard objectives remove {objective}')
+
+        # Create and remove objectives
+        if setup:
+            self.files[f"data/{namespace}/functions/setup/main.mcfunction"] = "\n".join(['# Create scoreboard objectives', ''] + setup).encode("utf-8")
+            self.tags.setdefault("data/nexus/tags/functions/setup/main.json", []).append(f"{namespace}:setup/main")
+            self.files[f"data/{namespace}/functions/uninstall/main.mcfunction"] = "\n".join(['# Remove scoreboard objectives', ''] + uninstall).encode("utf-8")
+            self.tags.setdefault("data/nexus/tags/functions/uninstall/modules.json", []).append(f"{namespace}:uninstall/main")
+        return fused
+
+    def plan(self, output_path: Path) -> Build_Plan:
+        """Returns a plan which writes the bundle to `output_path`, with a `pack.mcmeta` listing the bundled modules."""
+        plan = Build_Plan(output_path)
+        for name, contents in self.files.items():
+            plan.add(output_path / name, contents)
+        for name, values in self.tags.items():
+            plan.add(output_path / name, json.dumps({"replace": False, "values": values}, indent=4).encode("utf-8"))
+        plan.add(
+            output_path / "pack.mcmeta",
+            json.dumps(
+                {
+                    "pack": {
+                        "pack_format": self.pack_format,
+                        "description": [
+                            "",
+                            {"text": "Module Bundle", "color": "gold", "bold": True},
+                            "\n",
+                            {"text": ", ".join(module_name for module_name, _ in self.modules), "color": "gray"}
+                        ]
+                    }
+                },
+                indent=4
+            ).encode("utf-8")
+        )
+        return plan
+
+class Dependency_Graph:
+    """The dependencies between the modules in a workspace or world `datapacks` folder, indexed by internal ID.
+
+    `resolve()` finds the problems which the generated verification functions would otherwise only report in-game:
+    missing, duplicated, cyclic, and mismatched dependencies, as well as namespaces used by more than one module.
+    Several versions of a module are allowed, since only the newest one is deployed, but two copies of the same version are not.
+    Dependencies on data packs which aren't modules, such as the Nexus, are matched by the module name in the name of the data pack instead."""
+
+    __slots__ = (
+        "modules",
+        "index",
+        "external",
+        "unversioned",
+        "message"
+    )
+
+    modules: list[tuple[Path, Module_Record]]
+    """Path and settings of every module which was read."""
+    index: dict[str, list[int]]
+    """Positions in `modules` of every module with a given internal ID."""
+    external: set[str]
+    """Module names of the data packs which don't have a `module_info.json`, as given by `data_pack_name()`."""
+    unversioned: set[int]
+    """Positions in `modules` of every module with an invalid version, which isn't compared with what its dependents expect."""
+    message: str
+    """Errors found while reading and resolving the modules."""
+
+    def __init__(self, workspace: Path):
+        self.modules = []
+        self.index = {}
+        self.external = set()
+        self.unversioned = set()
+        self.message = ""
+        for module_path in sorted(workspace.iterdir()):
+            if not is_module(module_path):
+                if not module_path.name.startswith(".") and ((module_path / "pack.mcmeta").exists() or is_zip_module(module_path)):
+                    self.external.add(data_pack_name(module_path.name))
+                continue
+            settings_json, error_message = read_module_info(module_path)
+            module_info = settings_json.get(Setting_Category.MODULE_INFO.value)
+            dependencies = settings_json.get(Setting_Category.DEPENDENCIES.value, [])
+            if not error_message and (
+                not isinstance(module_info, dict) or
+                not isinstance(module_info.get(Module_Setting.INTERNAL_ID.value), str) or
+                not isinstance(dependencies, list) or
+                not all(isinstance(dependency, dict) for dependency in dependencies) or
+                not isinstance(settings_json.get(Setting_Category.FEATURES.value, {}), dict)
+            ):
+                error_message = f" ERROR: {module_path.as_posix()}/module_info.json is not properly formatted!\n"
+            if error_message:
+                self.message += error_message
+                continue
+
+            # Index the module by the settings which can still be read
+            record, error_message = Module_Record.from_json(settings_json)
+            if error_message:
+                self.message += "".join(f" ERROR: {module_path.name}: {line.removeprefix(' ERROR: ')}\n" for line in error_message.splitlines())
+                record.internal_id = module_info[Module_Setting.INTERNAL_ID.value]
+                if Version.check(module_info.get(Module_Setting.VERSION.value), Module_Setting.VERSION.value):
+                    self.unversioned.add(len(self.modules))
+            self.index.setdefault(record.internal_id, []).append(len(self.modules))
+            self.modules.append((module_path, record))
+
+    def resolve(self) -> list[str]:
+        """Checks the graph for problems, adding them to `message`, and returns the internal IDs in the order they can be loaded in,
+        with every module after its dependencies."""
+        # Check for duplicates and namespace collisions
+        namespaces: dict[str, str] = {}
+        for internal_id, positions in self.index.items():
+            versions: dict[tuple[int, int, int], list[int]] = {}
+            for i in positions:
+                if i not in self.unversioned:
+                    versions.setdefault(self.modules[i][1].version, []).append(i)
+            for version, copies in sorted(versions.items()):
+                if len(copies) > 1:
+                    self.message += f' ERROR: Multiple copies of {internal_id} {".".join(map(str, version))} exist: {", ".join(self.modules[i][0].name for i in copies)}\n'
+            if len(versions) > 1:
+                newest = max(versions)
+                self.message += f' WARNING: Older versions of {internal_id} exist, only {".".join(map(str, newest))} is deployed: {", ".join(self.modules[i][0].name for version in sorted(versions) if version != newest for i in versions[version])}\n'
+            namespace = self.modules[positions[0]][1].namespace
+            if namespace in namespaces:
+                self.message += f' ERROR: {internal_id} and {namespaces[namespace]} both use the namespace "{namespace}"!\n'
+            else:
+                namespaces[namespace] = internal_id
+
+        # Check dependencies
+        for module_path, record in self.modules:
+            for dependency_name, expected, dependency_id, _ in record.dependencies:
+                if dependency_id not in self.index:
+                    if dependency_name not in self.external:
+                        self.message += f' WARNING: {module_path.name}: {dependency_id} {".".join(map(str, expected))} is missing, unless it is installed as a data pack which isn\'t a module.\n'
+                    continue
+                versions = [self.modules[i][1].version for i in self.index[dependency_id] if i not in self.unversioned]
+                if not versions:
+                    continue
+                installed = max(versions)
+                if installed[:2] == expected[:2] and installed[2] >= expected[2]:
+                    continue
+                self.message += f' ERROR: {module_path.name}: {dependency_id} {".".join(map(str, installed))} is too {"old" if installed < expected else "new"}, expected {".".join(map(str, expected))}\n'
+
+        # Order modules after their dependencies, reporting any cycles
+        order: list[str] = []
+        visited: set[str] = set()
+        path: list[str] = []
+        def visit(internal_id: str):
+            if internal_id in path:
+                self.message += f' ERROR: Cyclic dependency: {" -> ".join(path[path.index(internal_id):] + [internal_id])}\n'
+                return
+            if internal_id in visited or internal_id not in self.index:
+                return
+            visited.add(internal_id)
+            path.append(internal_id)
+            for _, _, dependency_id, _ in self.modules[self.index[internal_id][0]][1].dependencies:
+                visit(dependency_id)
+            path.pop()
+            order.append(internal_id)
+        for internal_id in self.index:
+            visit(internal_id)
+        return order
+
+
+
+
+
+class Watch_Target:
+    """A settings file or module which is regenerated whenever its settings change.
+
+    The settings which the module was last generated with are kept in `snapshot`, so that only the stages whose settings changed are run,
+    and so that features enabled by editing `module_info.json` by hand are still treated as new."""
+
+    __slots__ = (
+        "target",
+        "settings_path",
+        "mtime",
+        "snapshot"
+    )
+
+    target: Path
+    """Settings file or module being watched."""
+    settings_path: Path
+    """File which is polled for changes."""
+    mtime: int | None
+    """Modification time of the settings file when it was last read."""
+    snapshot: dict[str, dict[str, str] | list[dict[str, str]]] | None
+    """Exported settings which the module was last generated with."""
+
+    def __init__(self, target: Path):
+        self.target = target
+        self.settings_path = target / "module_info.json" if target.is_dir() else target
+        self.mtime = None
+        self.snapshot = None
+
+    def changed(self) -> bool:
+        """Checks if the settings file was modified since it was last read."""
+        try:
+            mtime = os.stat(self.settings_path).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        if mtime == self.mtime:
+            return False
+        self.mtime = mtime
+        return True
+
+    def sync(self, workspace: Path) -> str:
+        """Creates the module if it doesn't exist, otherwise updates the stages whose settings changed. Returns the message to display."""
+        program = Program(False, workspace)
+        is_module_target = self.target.is_dir() or is_zip_module(self.target)
+        if is_module_target:
+            settings_json, error = program.open_module_info(self.target)
+        else:
+            settings_json, error = program.open_json(self.target)
+        if error:
+            return program.message
+        program.import_settings(settings_json)
+        if " ERROR:" in program.message:
+            return program.message
+        settings = program.export_settings()
+        module_path = self.target if is_module_target else program.get_module_path()
+
+        # Create module
+        if not module_path.exists():
+            program.build_module(module_path)
+            self.snapshot = settings
+            return program.message + " Module created\n"
+
+        # Find what changed since the module was generated
+        if self.snapshot is None:
+            old_settings_json, _ = read_module_info(module_path)
+            self.snapshot = Module_Record.from_json(old_settings_json)[0].to_json()
+        stages = changed_stages(self.snapshot, settings)
+        if not stages:
+            return ""
+
+        # Update module
+        if program.update_module(module_path, stages, self.snapshot[Setting_Category.FEATURES.value]):
+            return program.message
+        self.snapshot = settings
+        if is_module_target:
+            self.changed()
+        return program.message + f' Updated {", ".join(sorted(stage.value for stage in stages))}\n'
+
 
 
 
@@ -340,12 +2096,22 @@ class Program:
         "message",
         "dependency_index",
         "update_target",
-        "update_settings"
+        "update_settings",
+        "workspace",
+        "plan",
+        "output_zip",
+        "dry_run",
+        "prune_empty_hooks",
+        "release",
+        "catalog",
+        "cache",
+        "writer",
+        "trace"
     )
 
     state: State
     """State of the program."""
-    settings: dict[str, dict[str, Setting_Template] | list[dict[str, Setting_Template]]]
+    settings: dict[str, dict[str, Setting_Template] | list[dict[str, Setting_Template]] | list[Setting_Template]]
     """Settings, stores everything configurable about the program."""
     message: str
     """Message to display on the terminal."""
@@ -355,11 +2121,32 @@ class Program:
     """Which module is selected for updating."""
     update_settings: bool
     """Determines whether the settings were accessed from the update module menu or normally."""
-
-    def __init__(self):
+    workspace: Path
+    """Folder which modules are created in and listed from."""
+    plan: Build_Plan
+    """Files which are waiting to be written for the module being generated."""
+    output_zip: bool
+    """Determines whether modules are written as zip files instead of folders."""
+    dry_run: bool
+    """Determines whether generated modules are compared with the disk instead of being written."""
+    prune_empty_hooks: bool
+    """Determines whether hook functions without any commands are left out of the Nexus tags."""
+    release: bool
+    """Determines whether generated files are minified before they are written."""
+    catalog: Module_Catalog | None
+    """Catalog of the modules in the workspace, opened when it is first needed."""
+    cache: Generation_Cache | None
+    """Cache of the files generated for previously seen settings, if created modules should use it."""
+    writer: File_Writer
+    """Writes the files of generated modules."""
+    trace: Build_Trace | None
+    """Records the time taken by each stage of a build, if tracing is enabled."""
+
+    def __init__(self, interactive: bool = True, workspace: Path = PROGRAM_PATH):
         STATE_HANDLER = {
             # Main menu
             State.MAIN_MENU: self.__handle_main_menu,
+            State.TOGGLE_OUTPUT: self.__handle_toggle_output,
             # Module actions
             State.CREATE_MODULE: self.__handle_create_module,
             State.UPDATE_MODULE_MENU: self.__handle_update_module_menu,
@@ -417,10 +2204,27 @@ class Program:
                 Feature.MAXIMUM_OBJECT_TIME.value: Time(45),
                 Feature.MINIMUM_ENTITY_TIME.value: Time(5),
                 Feature.MINIMUM_OBJECT_TIME.value: Time(5),
-                Feature.MINIMUM_DIFFICULTY.value: Difficulty("easy")
-            }
+                Feature.MINIMUM_DIFFICULTY.value: Difficulty("easy"),
+                Feature.KEYED_VERIFICATION.value: Boolean(False)
+            },
+            Setting_Category.ENTITY_KINDS.value: [],
+            Setting_Category.OBJECT_KINDS.value: []
         }
         self.message = ""
+        self.update_settings = False
+        self.workspace = workspace
+        self.output_zip = False
+        self.dry_run = False
+        self.prune_empty_hooks = False
+        self.release = False
+        self.catalog = None
+        self.cache = None
+        self.writer = File_Writer()
+        self.trace = None
+
+        # Stop here if the program is being driven from the command line
+        if not interactive:
+            return
 
         # Execute state
         while True:
@@ -431,48 +2235,42 @@ class Program:
         display_title()
         self.display_config()
         print_lines(
+            f' Output: {"zip file" if self.output_zip else "folder"}',
+            "",
             " Actions:",
             "  1) Create module",
             "  2) Update module",
             "  3) Edit settings",
-            "  4) Exit program",
+            "  4) Toggle output",
+            "  5) Exit program",
             ""
         )
 
         # Process action
         action, error, self.message = check_action(
-            input(self.message + " Action: "), 1, 4)
+            input(self.message + " Action: "), 1, 5)
         if error:
             return
         self.state = {
             1: State.CREATE_MODULE,
             2: State.UPDATE_MODULE_MENU,
             3: State.SETTINGS,
-            4: State.EXIT
+            4: State.TOGGLE_OUTPUT,
+            5: State.EXIT
         }[action]
         self.message = ""
         self.update_settings = False
 
-    def __handle_create_module(self):
-        module_info: dict[str, Setting_Template] = self.settings[Setting_Category.MODULE_INFO.value]
-        module_name = module_info[Module_Setting.MODULE_NAME.value]
-        author = module_info[Module_Setting.AUTHOR.value]
-        version: Version = module_info[Module_Setting.VERSION.value]
-        internal_id = module_info[Module_Setting.INTERNAL_ID.value]
-        namespace = module_info[Module_Setting.NAMESPACE.value]
-        download_link = module_info[Module_Setting.DOWNLOAD_LINK.value]
-        module_path = PROGRAM_PATH / f'{module_name} DP - By {author} - {version}'
-        dependencies: list[dict[str, Setting_Template]] = self.settings[Setting_Category.DEPENDENCIES.value]
-        features: dict[str, Setting_Template] = self.settings[Setting_Category.FEATURES.value]
+    def __handle_toggle_output(self):
+        self.output_zip = not self.output_zip
+        self.message = f' Modules will be written as {"zip files" if self.output_zip else "folders"}\n'
+        self.state = State.MAIN_MENU
 
-        # Prepare old features
-        old_features = features.copy()
-        for feature in old_features:
-            if isinstance(old_features[feature], Boolean):
-                old_features[feature] = False
+    def __handle_create_module(self):
+        module_path = self.get_module_path()
 
         # Check if the module already exists
-        if module_path.exists():
+        if (zip_file_path(module_path) if self.output_zip else module_path).exists():
             print_lines(
                 " Module already exists! Are you sure you want to overwrite it?",
                 "  0) No",
@@ -484,20 +2282,8 @@ class Program:
             if error or action == 0:
                 self.state = State.MAIN_MENU
                 return
-            shutil.rmtree(module_path)
 
-        # Create files
-        self.create_pack_mcmeta(module_path, module_name, author, version, dependencies)
-        self.create_module_info_json(module_path)
-        self.create_tags(module_path, namespace)
-        self.create_entity_functions(module_path, namespace, features, old_features)
-        self.create_event_id_functions(module_path, namespace, features, old_features)
-        self.create_object_functions(module_path, namespace, features, old_features)
-        self.create_player_functions(module_path, module_name, internal_id, version, namespace, features)
-        self.create_setup_functions(module_path, internal_id, namespace, features)
-        self.create_tick_functions(module_path, namespace)
-        self.create_uninstall_functions(module_path, module_name, internal_id, namespace, features)
-        self.create_verification_functions(module_path, module_name, version, internal_id, namespace, download_link, dependencies)
+        self.build_module(module_path)
 
         self.message += " Module created\n"
         self.state = State.MAIN_MENU
@@ -511,16 +2297,13 @@ class Program:
             " Update module:",
             "  0) Go back"
         )
-        i = 1
+        if self.catalog is None:
+            self.catalog = Module_Catalog(self.workspace)
+        self.catalog.refresh()
         modules: dict[int, Path] = {}
-        for path in PROGRAM_PATH.iterdir():
-            if not path.is_dir():
-                continue
-            if not (path / "module_info.json").exists():
-                continue
+        for i, path in enumerate(self.catalog.modules(), 1):
             print(f'  {i}) {path.name}')
             modules[i] = path
-            i += 1
         print()
 
         # Process action
@@ -533,8 +2316,9 @@ class Program:
             self.message = ""
             return
         self.update_target = modules[action]
-        settings_json, error = self.open_json(self.update_target / "module_info.json")
-        if error:
+        settings_json, error_message = self.catalog.settings(self.update_target)
+        if error_message:
+            self.message = error_message
             return
         self.update_settings = False
         self.import_settings(settings_json)
@@ -572,46 +2356,17 @@ class Program:
         self.message = ""
         
     def __handle_update_module(self):
-        module_info: dict[str, Setting_Template] = self.settings[Setting_Category.MODULE_INFO.value]
-        module_name = module_info[Module_Setting.MODULE_NAME.value]
-        author = module_info[Module_Setting.AUTHOR.value]
-        version: Version = module_info[Module_Setting.VERSION.value]
-        internal_id = module_info[Module_Setting.INTERNAL_ID.value]
-        namespace = module_info[Module_Setting.NAMESPACE.value]
-        download_link = module_info[Module_Setting.DOWNLOAD_LINK.value]
-        dependencies: list[dict[str, Setting_Template]] = self.settings[Setting_Category.DEPENDENCIES.value]
-        features: dict[str, Setting_Template] = self.settings[Setting_Category.FEATURES.value]
-
-        # Get old features
-        settings_json, error = self.open_json(self.update_target / "module_info.json")
-        if error:
+        if self.update_module(self.update_target):
             return
-        old_features: dict[str, bool] = settings_json[Setting_Category.FEATURES.value]
-
-        # Update files
-        self.create_pack_mcmeta(self.update_target, module_name, author, version, dependencies)
-        self.create_module_info_json(self.update_target)
-        self.update_setup_functions(self.update_target, internal_id, namespace, features)
-        self.create_entity_functions(self.update_target, namespace, features, old_features)
-        self.create_event_id_functions(self.update_target, namespace, features, old_features)
-        self.create_object_functions(self.update_target, namespace, features, old_features)
-        
-        folder_path = self.update_target / "data" / namespace.value / "functions" / "verify"
-        if folder_path.exists():
-            shutil.rmtree(folder_path)
-        self.create_verification_functions(self.update_target, module_name, version, internal_id, namespace, download_link, dependencies)
 
         self.message += " Module updated\n"
         self.state = State.UPDATE_MODULE_TARGET
 
     def __handle_rename_module(self):
-        module_info: dict[str, Setting_Template] = self.settings[Setting_Category.MODULE_INFO.value]
-        module_name = module_info[Module_Setting.MODULE_NAME.value]
-        author = module_info[Module_Setting.AUTHOR.value]
-        version: Version = module_info[Module_Setting.VERSION.value]
-
         # Rename module
-        module_path = PROGRAM_PATH / f'{module_name} DP - By {author} - {version}'
+        module_path = self.get_module_path()
+        if is_zip_module(self.update_target):
+            module_path = zip_file_path(module_path)
         os.rename(self.update_target, module_path)
         self.update_target = module_path
 
@@ -888,6 +2643,19 @@ class Program:
                     self.message += new_dependency[setting].assign(dependency[setting], setting)
                 self.settings[category].append(new_dependency)
 
+        for category in [Setting_Category.ENTITY_KINDS.value, Setting_Category.OBJECT_KINDS.value]:
+            if category not in settings_json:
+                continue
+            self.settings[category] = []
+            for kind in settings_json[category]:
+                new_kind = Internal("")
+                error_message = new_kind.assign(kind, category)
+                if not error_message and kind in [existing_kind.value for existing_kind in self.settings[category]]:
+                    error_message = f' ERROR: {category}: Cannot declare "{kind}" twice!\n'
+                self.message += error_message
+                if not error_message:
+                    self.settings[category].append(new_kind)
+
     def export_settings(self) -> dict[str, dict[str, Setting_Template] | list[dict[str, Setting_Template]]]:
         """Exports settings from the stored settings dictionary and writes them to `settings_json`."""
         output: dict[str, dict[str, Setting_Template] | list[dict[str, Setting_Template]]] = {}
@@ -900,17 +2668,197 @@ class Program:
         category = Setting_Category.DEPENDENCIES.value
         output[category] = []
         for dependency in self.settings[category]:
-            output[category].append(self.default_dependency())
-            for setting in dependency:
-                output[category][-1][setting] = dependency[setting].export()
+            output[category].append({setting: dependency[setting].export() for setting in dependency})
 
         category = Setting_Category.FEATURES.value
         output[category] = {}
         for setting in self.settings[category]:
             output[category][setting] = self.settings[category][setting].export()
 
+        for category in [Setting_Category.ENTITY_KINDS.value, Setting_Category.OBJECT_KINDS.value]:
+            output[category] = [kind.export() for kind in self.settings[category]]
+
         return output
 
+    def get_module_path(self) -> Path:
+        """Returns the folder that the module described by the stored settings is created in."""
+        module_info: dict[str, Setting_Template] = self.settings[Setting_Category.MODULE_INFO.value]
+        module_name = module_info[Module_Setting.MODULE_NAME.value]
+        author = module_info[Module_Setting.AUTHOR.value]
+        version = module_info[Module_Setting.VERSION.value]
+        return self.workspace / f'{module_name} DP - By {author} - {version}'
+
+    def build_module(self, module_path: Path):
+        """Creates a module from scratch at `module_path` using the stored settings, replacing it if it already exists.
+
+        If a generation cache is open, the files are taken from it when the same settings were generated before,
+        and only the volatile files are created again. Otherwise the files are generated with `CACHE_PLACEHOLDERS`
+        so that they can be stored for other modules, and then filled in with the settings of this module."""
+        module_info: dict[str, Setting_Template] = self.settings[Setting_Category.MODULE_INFO.value]
+        module_name = module_info[Module_Setting.MODULE_NAME.value]
+        author = module_info[Module_Setting.AUTHOR.value]
+        version: Version = module_info[Module_Setting.VERSION.value]
+        internal_id = module_info[Module_Setting.INTERNAL_ID.value]
+        namespace = module_info[Module_Setting.NAMESPACE.value]
+        download_link = module_info[Module_Setting.DOWNLOAD_LINK.value]
+        dependencies: list[dict[str, Setting_Template]] = self.settings[Setting_Category.DEPENDENCIES.value]
+        features: dict[str, Setting_Template] = self.settings[Setting_Category.FEATURES.value]
+        entity_kinds: list[Setting_Template] = self.settings[Setting_Category.ENTITY_KINDS.value]
+        object_kinds: list[Setting_Template] = self.settings[Setting_Category.OBJECT_KINDS.value]
+
+        # Prepare old features
+        old_features = features.copy()
+        for feature in old_features:
+            if isinstance(old_features[feature], Boolean):
+                old_features[feature] = False
+
+        # Load cached files
+        start = perf_counter()
+        self.plan = Build_Plan(module_path, False, self.trace, self.writer)
+        cache_key = Generation_Cache.key(self.export_settings()) if self.cache else ""
+        values = {setting: module_info[setting].value for setting in CACHE_PLACEHOLDERS}
+        if self.cache and self.cache.load(cache_key, self.plan, values):
+            if self.trace:
+                self.trace.record("cache", "stage", start, perf_counter(), {"files": len(self.plan.files), "bytes": sum(map(len, self.plan.files.values()))})
+            self.run_stage(Build_Stage.UPDATE_SETUP_FUNCTIONS, module_path, internal_id, namespace, features, entity_kinds + object_kinds)
+
+        # Create files
+        else:
+            if self.cache:
+                self.settings[Setting_Category.MODULE_INFO.value] = module_info | {setting: MODULE_INFO_CLASSES[setting](placeholder) for setting, placeholder in CACHE_PLACEHOLDERS.items()}
+                module_name, internal_id, namespace = (self.settings[Setting_Category.MODULE_INFO.value][setting] for setting in CACHE_PLACEHOLDERS)
+            self.run_stage(Build_Stage.PACK_MCMETA, module_path, module_name, author, version, dependencies)
+            self.run_stage(Build_Stage.MODULE_INFO_JSON, module_path)
+            self.run_stage(Build_Stage.TAGS, module_path, namespace)
+            self.run_stage(Build_Stage.ENTITY_FUNCTIONS, module_path, namespace, features, old_features, entity_kinds)
+            self.run_stage(Build_Stage.EVENT_ID_FUNCTIONS, module_path, namespace, features, old_features)
+            self.run_stage(Build_Stage.OBJECT_FUNCTIONS, module_path, namespace, features, old_features, object_kinds)
+            self.run_stage(Build_Stage.PLAYER_FUNCTIONS, module_path, module_name, internal_id, version, namespace, features)
+            self.run_stage(Build_Stage.SETUP_FUNCTIONS, module_path, internal_id, namespace, features, entity_kinds + object_kinds)
+            self.run_stage(Build_Stage.TICK_FUNCTIONS, module_path, namespace)
+            self.run_stage(Build_Stage.UNINSTALL_FUNCTIONS, module_path, module_name, internal_id, namespace, features, entity_kinds + object_kinds)
+            self.run_stage(Build_Stage.VERIFICATION_FUNCTIONS, module_path, module_name, version, internal_id, namespace, download_link, dependencies, features)
+            if self.cache:
+                self.cache.store(cache_key, self.plan)
+                self.settings[Setting_Category.MODULE_INFO.value] = module_info
+                module_name, internal_id, namespace = (module_info[setting] for setting in CACHE_PLACEHOLDERS)
+                plan = self.plan
+                self.plan = Build_Plan(module_path, False, self.trace, self.writer)
+                for file_path, contents in plan.files.items():
+                    path, contents = Generation_Cache.fill(file_path.relative_to(module_path).as_posix(), contents, values)
+                    self.plan.add(module_path / path, contents, file_path in plan.volatile, file_path in plan.preserved)
+        if self.prune_empty_hooks:
+            self.run_stage(Build_Stage.HOOK_TAGS, module_path, module_name, internal_id, version, namespace, features, entity_kinds, object_kinds)
+        if self.release:
+            self.plan.minify()
+
+        # Write files
+        if self.dry_run:
+            self.describe_plan(zip_file_path(module_path) if self.output_zip else module_path)
+        elif self.output_zip:
+            self.plan.flush_zip(zip_file_path(module_path))
+        else:
+            self.plan.flush()
+        if self.trace:
+            self.trace.record(f"create {module_path.name}", "module", start, perf_counter(), {"files": len(self.plan.files)})
+
+    def update_module(self, module_path: Path, stages: set[Build_Stage] = UPDATE_STAGES, old_features: dict[str, bool] | None = None) -> bool:
+        """Updates the existing module at `module_path` using the stored settings, only running the given stages.
+
+        The features which the module was last generated with are read from its `module_info.json`,
+        unless they are given in `old_features`, which is needed if `module_info.json` was edited by hand.
+        Zip modules are updated in place. Folder modules are written to a zip file next to the folder if zip output is enabled.
+        Returns `True` if the module's current `module_info.json` could not be read."""
+        module_info: dict[str, Setting_Template] = self.settings[Setting_Category.MODULE_INFO.value]
+        module_name = module_info[Module_Setting.MODULE_NAME.value]
+        author = module_info[Module_Setting.AUTHOR.value]
+        version: Version = module_info[Module_Setting.VERSION.value]
+        internal_id = module_info[Module_Setting.INTERNAL_ID.value]
+        namespace = module_info[Module_Setting.NAMESPACE.value]
+        download_link = module_info[Module_Setting.DOWNLOAD_LINK.value]
+        dependencies: list[dict[str, Setting_Template]] = self.settings[Setting_Category.DEPENDENCIES.value]
+        features: dict[str, Setting_Template] = self.settings[Setting_Category.FEATURES.value]
+        entity_kinds: list[Setting_Template] = self.settings[Setting_Category.ENTITY_KINDS.value]
+        object_kinds: list[Setting_Template] = self.settings[Setting_Category.OBJECT_KINDS.value]
+
+        # Get old features
+        settings_json, error = self.open_module_info(module_path)
+        if error:
+            return True
+        if old_features is None:
+            old_features = settings_json[Setting_Category.FEATURES.value]
+
+        # Update files
+        start = perf_counter()
+        self.plan = Build_Plan(module_path, True, self.trace, self.writer)
+        if Build_Stage.PACK_MCMETA in stages:
+            self.run_stage(Build_Stage.PACK_MCMETA, module_path, module_name, author, version, dependencies)
+        if Build_Stage.MODULE_INFO_JSON in stages:
+            self.run_stage(Build_Stage.MODULE_INFO_JSON, module_path)
+        if Build_Stage.UPDATE_SETUP_FUNCTIONS in stages:
+            self.run_stage(Build_Stage.UPDATE_SETUP_FUNCTIONS, module_path, internal_id, namespace, features, entity_kinds + object_kinds)
+        if Build_Stage.ENTITY_FUNCTIONS in stages:
+            self.run_stage(Build_Stage.ENTITY_FUNCTIONS, module_path, namespace, features, old_features, entity_kinds)
+        if Build_Stage.EVENT_ID_FUNCTIONS in stages:
+            self.run_stage(Build_Stage.EVENT_ID_FUNCTIONS, module_path, namespace, features, old_features)
+        if Build_Stage.OBJECT_FUNCTIONS in stages:
+            self.run_stage(Build_Stage.OBJECT_FUNCTIONS, module_path, namespace, features, old_features, object_kinds)
+        if Build_Stage.VERIFICATION_FUNCTIONS in stages:
+            self.run_stage(Build_Stage.VERIFICATION_FUNCTIONS, module_path, module_name, version, internal_id, namespace, download_link, dependencies, features)
+            self.plan.remove_stale(module_path / "data" / namespace.value / "functions" / "verify")
+        if self.prune_empty_hooks:
+            self.run_stage(Build_Stage.HOOK_TAGS, module_path, module_name, internal_id, version, namespace, features, entity_kinds, object_kinds)
+        if self.release:
+            self.plan.minify()
+
+        # Write files that changed
+        if self.dry_run:
+            self.describe_plan(zip_file_path(module_path) if self.output_zip and not is_zip_module(module_path) else module_path)
+            return False
+        if is_zip_module(module_path):
+            written, skipped, removed = self.plan.flush_zip(module_path)
+        elif self.output_zip:
+            written, skipped, removed = self.plan.flush_zip(zip_file_path(module_path))
+        else:
+            written, skipped, removed = self.plan.flush()
+        self.message += f" {written} file{'' if written == 1 else 's'} written, {skipped} unchanged, {removed} removed\n"
+        if self.trace:
+            self.trace.record(f"update {module_path.name}", "module", start, perf_counter(), {"written": written, "unchanged": skipped, "removed": removed})
+        return False
+
+    def run_stage(self, stage: Build_Stage, *arguments):
+        """Runs the method of a build stage with the given arguments.
+
+        If tracing is enabled, this records how long the stage took, and the number of files and bytes it added to the plan."""
+        if not self.trace:
+            getattr(self, stage.value)(*arguments)
+            return
+        files = len(self.plan.files)
+        size = sum(map(len, self.plan.files.values()))
+        start = perf_counter()
+        getattr(self, stage.value)(*arguments)
+        self.trace.record(
+            stage.value, "stage", start, perf_counter(),
+            {"files": len(self.plan.files) - files, "bytes": sum(map(len, self.plan.files.values())) - size}
+        )
+
+    def describe_plan(self, source_path: Path):
+        """Adds every file that writing the plan over `source_path` would add, modify, or delete to the message,
+        along with the change in its size, without writing anything."""
+        SYMBOL = {
+            "added": "+",
+            "modified": "~",
+            "deleted": "-"
+        }
+
+        counts = {status: 0 for status in SYMBOL}
+        total = 0
+        for status, file_path, delta in self.plan.diff(source_path):
+            counts[status] += 1
+            total += delta
+            self.message += f" {SYMBOL[status]} {file_path.relative_to(self.plan.module_path).as_posix()} ({delta:+} bytes)\n"
+        self.message += f" {counts['added']} added, {counts['modified']} modified, {counts['deleted']} deleted ({total:+} bytes)\n"
+
     def display_config(self):
         """Displays basic information about the module settings"""
         module_info: dict[str, Setting_Template] = self.settings[Setting_Category.MODULE_INFO.value]
@@ -947,6 +2895,12 @@ class Program:
             self.message += f" ERROR: {file_path.as_posix()} is not properly formatted!\n"
             return {}, True
 
+    def open_module_info(self, module_path: Path) -> tuple[dict[str, dict[str, str]], bool]:
+        """Opens `module_info.json` from a module, whether it is a folder or a zip file."""
+        settings_json, error_message = read_module_info(module_path)
+        self.message += error_message
+        return settings_json, error_message != ""
+
     def create_pack_mcmeta(
         self,
         module_path: Path,
@@ -956,7 +2910,6 @@ class Program:
         dependencies: list[dict[str, Setting_Template]]
     ):
         """Creates `pack.mcmeta` in the target module."""
-        module_path.mkdir(exist_ok=True, parents=True)
         file_json = {
         	"pack": {
         		"pack_format": PACK_FORMAT,
@@ -985,21 +2938,18 @@ class Program:
                 )
                 break
 
-        with (module_path / "pack.mcmeta").open("w", encoding="utf-8") as file:
-            json.dump(file_json, file, indent=4)
+        self.plan.add(module_path / "pack.mcmeta", json.dumps(file_json, indent=4).encode("utf-8"))
 
     def create_module_info_json(self, module_path: Path):
         """Creates `module_info.json` in the target module by exporting the stored settings dictionary into it."""
-        module_path.mkdir(exist_ok=True, parents=True)
         settings_json = self.export_settings()
-        with (module_path / "module_info.json").open("w", encoding="utf-8") as file:
-            json.dump(settings_json, file, indent=4)
+        self.plan.add(module_path / "module_info.json", json.dumps(settings_json, indent=4).encode("utf-8"))
 
-    def create_function(self, file_path: Path, contents: list[str]):
-        """Creates a `.mcfunction` file from a list of lines."""
-        file_path.parent.mkdir(exist_ok=True, parents=True)
-        with file_path.open("w", encoding="utf-8") as file:
-            file.write("\n".join(contents))
+    def create_function(self, file_path: Path, contents: list[str], volatile: bool = False):
+        """Creates a `.mcfunction` file from a list of lines.
+
+        Volatile functions are only written during an update if another file changed."""
+        self.plan.add(file_path, "\n".join(contents).encode("utf-8"), volatile)
 
     def create_tags(self, module_path: Path, namespace: Setting_Template):
         """Creates a series of tags for a newly-created module."""
@@ -1023,19 +2973,130 @@ class Program:
 
     def create_tag(self, file_path: Path, contents: list[str]):
         """Creates a JSON data pack tag using a list of entries."""
-        file_path.parent.mkdir(exist_ok=True, parents=True)
-        with file_path.open("w", encoding="utf-8") as file:
-            json.dump(
+        self.plan.add(
+            file_path,
+            json.dumps(
                 {
                     "replace": False,
                     "values": contents
                 },
-                file,
                 indent=4
-            )
+            ).encode("utf-8")
+        )
+
+    def prune_feature(self, feature: str, features: dict[str, Setting_Template], generate):
+        """Removes the tag entries and functions of a feature which was turned off from the target module.
+
+        `generate(features, old_features)` runs the stage which creates the files of the feature, and is run against a scratch plan
+        with only that feature turned on to find out what it creates. The generated entries are removed from each tag,
+        and tags with no entries left are deleted. Functions are only deleted if they still have the generated contents,
+        either as generated or minified by a release build, otherwise they were edited by the user and are kept with a warning."""
+        # Generate the files of the feature
+        plan = self.plan
+        message = self.message
+        self.plan = Build_Plan(plan.module_path, True)
+        generate(
+            {name: Boolean(name == feature) if isinstance(value, Boolean) else value for name, value in features.items()},
+            {name: False for name in features}
+        )
+        generated = self.plan
+        self.plan = plan
+        self.message = message
+
+        # Remove the files which weren't edited
+        for file_path, contents in generated.files.items():
+            existing = self.plan.existing_file(file_path)
+            if existing is None:
+                continue
+            if file_path.suffix == ".json":
+                self.prune_tag(file_path, existing, json.loads(contents)["values"])
+            elif existing in [contents, minify_file(file_path, contents)]:
+                self.plan.remove(file_path)
+            else:
+                self.message += f" WARNING: {file_path.relative_to(self.plan.module_path).as_posix()} was edited, so it wasn't removed when {feature} was turned off. Delete it by hand if it's no longer needed.\n"
+        for folder_path in generated.stale_folders:
+            self.plan.remove_stale(folder_path)
+
+    def prune_tag(self, file_path: Path, existing: bytes, values: list[str]):
+        """Removes the given entries from an existing tag in the target module, deleting the tag if no entries are left."""
+        try:
+            tag_json = json.loads(existing)
+            remaining = [value for value in tag_json["values"] if value not in values]
+        except (json.JSONDecodeError, UnicodeDecodeError, TypeError, KeyError):
+            self.message += f" WARNING: {file_path.relative_to(self.plan.module_path).as_posix()} is not properly formatted, so its entries weren't removed. Remove {', '.join(values)} by hand.\n"
+            return
+        if not remaining:
+            self.plan.remove(file_path)
+        elif len(remaining) < len(tag_json["values"]):
+            tag_json["values"] = remaining
+            self.plan.add(file_path, json.dumps(tag_json, indent=4).encode("utf-8"))
+
+    def prune_hook_tags(
+        self,
+        module_path: Path,
+        module_name: Setting_Template,
+        internal_id: Setting_Template,
+        version: Version,
+        namespace: Setting_Template,
+        features: dict[str, Setting_Template],
+        entity_kinds: list[Setting_Template],
+        object_kinds: list[Setting_Template]
+    ):
+        """Leaves the hook functions of the target module which don't contain any commands out of the Nexus function tags,
+        so that the Nexus doesn't call them every tick, and adds them back once they have commands.
+        This only runs when hooks are pruned, so that entries which the user removed by hand aren't added back by other updates.
+
+        The tags which the module should have are found by running the stages which create them against a scratch plan.
+        Only entries which run a function of this module are changed, so other entries added by the user are kept."""
+        # Generate the tags of the module
+        plan = self.plan
+        message = self.message
+        self.plan = Build_Plan(plan.module_path, True)
+        old_features = {name: False for name in features}
+        self.create_tags(module_path, namespace)
+        self.create_player_functions(module_path, module_name, internal_id, version, namespace, features)
+        self.create_entity_functions(module_path, namespace, features, old_features, entity_kinds)
+        self.create_event_id_functions(module_path, namespace, features, old_features)
+        self.create_object_functions(module_path, namespace, features, old_features, object_kinds)
+        generated = self.plan
+        self.plan = plan
+        self.message = message
+
+        # Update the entries of each Nexus function tag
+        tags_path = module_path / "data" / "nexus" / "tags" / "functions"
+        for file_path, contents in generated.files.items():
+            if tags_path not in file_path.parents:
+                continue
+            existing = self.plan.files[file_path] if file_path in self.plan.files else self.plan.existing_file(file_path)
+            if existing is None or file_path in self.plan.removed:
+                continue
+            try:
+                tag_json = json.loads(existing)
+                values: list[str] = list(tag_json["values"])
+            except (json.JSONDecodeError, UnicodeDecodeError, TypeError, KeyError):
+                continue
+            for value in json.loads(contents)["values"]:
+                function_namespace, _, function_name = value.partition(":")
+                if function_namespace != namespace.value:
+                    continue
+                function_path = module_path / "data" / namespace.value / "functions" / f"{function_name}.mcfunction"
+                function = self.plan.files[function_path] if function_path in self.plan.files else self.plan.existing_file(function_path)
+                if function_path in self.plan.removed or function is None or not has_commands(function):
+                    if value in values:
+                        values.remove(value)
+                elif value not in values:
+                    values.append(value)
+            if values != tag_json["values"]:
+                tag_json["values"] = values
+                self.plan.add(file_path, json.dumps(tag_json, indent=4).encode("utf-8"))
+
+    def create_entity_functions(self, module_path: Path, namespace: Setting_Template, features: dict[str, Boolean], old_features: dict[str, bool], kinds: list[Setting_Template]):
+        """Creates functions and tags related to entity ticking and processing in the target module,
+        and removes them if their feature was turned off."""
+        for feature in [Feature.CUSTOM_ENTITY_TICKING.value, Feature.ENTITY_PROCESSING.value]:
+            if not features[feature].value and old_features[feature]:
+                self.prune_feature(feature, features, lambda features, old_features: self.create_entity_functions(module_path, namespace, features, old_features, kinds))
 
-    def create_entity_functions(self, module_path: Path, namespace: Setting_Template, features: dict[str, Boolean], old_features: dict[str, bool]):
-        """Creates functions and tags related to entity ticking and processing in the target module."""
         if features[Feature.CUSTOM_ENTITY_TICKING.value].value and not old_features[Feature.CUSTOM_ENTITY_TICKING.value]:
             self.create_tag(module_path / "data" / "nexus" / "tags" / "functions" / "entity" / "main.json", [f"{namespace}:entity/verify"])
             self.create_function(
@@ -1052,13 +3113,17 @@ class Program:
                 ]
             )
 
+        if features[Feature.CUSTOM_ENTITY_TICKING.value].value:
+            self.create_dispatch_functions(module_path, namespace, "entity", kinds)
+
         if features[Feature.ENTITY_PROCESSING.value].value and not old_features[Feature.ENTITY_PROCESSING.value]:
             self.create_tag(    module_path / "data" / "nexus" / "tags" / "functions" / "entity" / "process.json", [f"{namespace}:entity/generic/process/main"])
             self.create_function(module_path / "data" / namespace.value / "functions" / "entity" / "generic" / "process" / "main.mcfunction", [])
 
     def create_event_id_functions(self, module_path: Path, namespace: Setting_Template, features: dict[str, Setting_Template], old_features: dict[str, bool]):
         """Creates functions and tags in the target module related to the event ID system of the Nexus,
-        which detects interactions between players and entities and runs functions from either."""
+        which detects interactions between players and entities and runs functions from either.
+        The functions and tags of criteria which were turned off are removed."""
         for criteria in [
             Feature.EVENT_ID_ENTITY_HURT_PLAYER.value,
             Feature.EVENT_ID_ENTITY_KILLED_PLAYER.value,
@@ -1066,6 +3131,8 @@ class Program:
             Feature.EVENT_ID_PLAYER_KILLED_ENTITY.value,
             Feature.EVENT_ID_PLAYER_INTERACTED_WITH_ENTITY.value
         ]:
+            if not features[criteria].value and old_features[criteria]:
+                self.prune_feature(criteria, features, lambda features, old_features: self.create_event_id_functions(module_path, namespace, features, old_features))
             if not features[criteria].value or old_features[criteria]:
                 continue
             criteria_folder = criteria[9:]
@@ -1076,24 +3143,86 @@ class Program:
             self.create_function(module_path / "data" / namespace.value / "functions" / "generic" / "event_id" / criteria_folder / "player" / "post.mcfunction", [])
             self.create_function(module_path / "data" / namespace.value / "functions" / "generic" / "event_id" / criteria_folder / "entity.mcfunction", [])
 
-    def create_object_functions(self, module_path: Path, namespace: Setting_Template, features: dict[str, Setting_Template], old_features: dict[str, bool]):
-        """Creates functions and tags related to object system in the target module."""
-        if not features[Feature.OBJECT_TICKING.value].value or old_features[Feature.OBJECT_TICKING.value]:
+    def create_object_functions(self, module_path: Path, namespace: Setting_Template, features: dict[str, Setting_Template], old_features: dict[str, bool], kinds: list[Setting_Template]):
+        """Creates functions and tags related to object system in the target module, and removes them if object ticking was turned off."""
+        if not features[Feature.OBJECT_TICKING.value].value and old_features[Feature.OBJECT_TICKING.value]:
+            self.prune_feature(Feature.OBJECT_TICKING.value, features, lambda features, old_features: self.create_object_functions(module_path, namespace, features, old_features, kinds))
+        if not features[Feature.OBJECT_TICKING.value].value:
             return
-        self.create_tag(module_path / "data" / "nexus" / "tags" / "functions" / "object" / "main.json", [f"{namespace}:object/verify"])
-        self.create_function(
-            module_path / "data" / namespace.value / "functions" / "object" / "verify.mcfunction",
-            [
-                '# Run function if object is from the right module', '',
-                f'execute if entity @s[tag={namespace}.object] run function {namespace}:object/main'
-            ]
-        )
-        self.create_function(
-            module_path / "data" / namespace.value / "functions" / "object" / "main.mcfunction",
-            [
-                '# Run function based on object type', '', ''
-            ]
+        if not old_features[Feature.OBJECT_TICKING.value]:
+            self.create_tag(module_path / "data" / "nexus" / "tags" / "functions" / "object" / "main.json", [f"{namespace}:object/verify"])
+            self.create_function(
+                module_path / "data" / namespace.value / "functions" / "object" / "verify.mcfunction",
+                [
+                    '# Run function if object is from the right module', '',
+                    f'execute if entity @s[tag={namespace}.object] run function {namespace}:object/main'
+                ]
+            )
+            self.create_function(
+                module_path / "data" / namespace.value / "functions" / "object" / "main.mcfunction",
+                [
+                    '# Run function based on object type', '', ''
+                ]
+            )
+
+        self.create_dispatch_functions(module_path, namespace, "object", kinds)
+
+    def create_dispatch_functions(self, module_path: Path, namespace: Setting_Template, category: str, kinds: list[Setting_Template]):
+        """Creates a balanced binary function tree which runs the function of each declared entity or object kind,
+        so that finding the right function takes a logarithmic number of commands instead of a linear chain.
+
+        `category` is either `entity` or `object`. Each kind is numbered by its position in the declared list,
+        and is looked up with the `<namespace>.kind` score of the entity. The tree is rooted in `<category>/main`,
+        its branches are in `<category>/dispatch`, and each kind runs `<category>/kind/<kind>`, which is only created if it doesn't exist.
+        `<category>/dispatch/assign/<kind>` sets the score of a newly spawned entity.
+
+        The root is only written over `<category>/main` if the file is still blank, or still has the exact commands
+        that were last generated, which is checked against the hash in its header. Otherwise it goes in `<category>/dispatch/main`."""
+        folder_path = module_path / "data" / namespace.value / "functions" / category
+        main_path = folder_path / "main.mcfunction"
+        self.plan.remove_stale(folder_path / "dispatch")
+
+        # Leave the main function alone if it was written by the user
+        existing_main = self.plan.existing_file(main_path)
+        if existing_main is None:
+            existing_main = self.plan.files.get(main_path, b"")
+        existing_lines = [line.strip() for line in existing_main.decode("utf-8", errors="replace").splitlines()]
+        main_generated = bool(existing_lines) and existing_lines[0] == DISPATCH_HEADER.format(category, category, dispatch_hash([line for line in existing_lines[1:] if line]))
+        main_blank = existing_main in [f"# Run function based on {category} type\n\n".encode("utf-8"), b""]
+        if not kinds:
+            if main_generated:
+                self.create_function(main_path, [f'# Run function based on {category} type', '', ''])
+            return
+
+        # Create the function of each kind
+        for i, kind in enumerate(kinds, 1):
+            self.plan.add(
+                folder_path / "kind" / f"{kind}.mcfunction",
+                f'# Run function for "{kind}" {category} type\n\n'.encode("utf-8"),
+                preserved=True
+            )
+            self.create_function(
+                folder_path / "dispatch" / "assign" / f"{kind}.mcfunction",
+                [
+                    f'# Mark {category} as "{kind}"', '',
+                    f'scoreboard players set @s {namespace}.kind {i}'
+                ]
+            )
+
+        # Create tree
+        root, branches = dispatch_tree(
+            len(kinds),
+            f'execute if score @s {namespace}.kind matches',
+            lambda i: f'function {namespace}:{category}/kind/{kinds[i - 1]}',
+            lambda low, high: f'{namespace}:{category}/dispatch/{low}_{high}'
         )
+        for (low, high), contents in branches.items():
+            self.create_function(folder_path / "dispatch" / f"{low}_{high}.mcfunction", contents)
+        if main_generated or main_blank:
+            self.create_function(main_path, [DISPATCH_HEADER.format(category, category, dispatch_hash(root)), ''] + root)
+            return
+        self.create_function(folder_path / "dispatch" / "main.mcfunction", root)
+        self.message += f" WARNING: {category}/main.mcfunction was edited, so the dispatch tree wasn't connected to it. Run function {namespace}:{category}/dispatch/main from it instead.\n"
 
     def create_player_functions(self, module_path: Path, module_name: Setting_Template, internal_id: Setting_Template, version: Version, namespace: Setting_Template, features: dict[str, Setting_Template]):
         """Creates the player functions in the target module."""
@@ -1102,39 +3231,14 @@ class Program:
             module_path / "data" / namespace.value / "functions" / "player" / "login" / "main.mcfunction",
             [
                 '# Send message', '',
-                f'execute if score #debug_login_messages nexus.value matches 1 run tellraw @s ' +
-                json.dumps(
-                    [
-                        " ",
-                        { "text": "- ", "color": "gray" },
-                        { "text": str(module_name), "color": "gold" },
-                        { "text": " - ", "color": "gray" },
-                        {
-                            "nbt": f'modules[{{id:"{internal_id}"}}].version.major',
-                            "storage": "nexus:data",
-                            "color": "gold"
-                        },
-                        { "text": ".", "color": "gold" },
-                        {
-                            "nbt": f'modules[{{id:"{internal_id}"}}].version.minor',
-                            "storage": "nexus:data",
-                            "color": "gold"
-                        },
-                        { "text": ".", "color": "gold" },
-                        {
-                            "nbt": f'modules[{{id:"{internal_id}"}}].version.patch',
-                            "storage": "nexus:data",
-                            "color": "gold"
-                        }
-                    ]
-                )
+                f'execute if score #debug_login_messages nexus.value matches 1 run tellraw @s {LOGIN_TEMPLATE.fill(module_name=module_name, internal_id=internal_id)}'
             ]
         )
         if features[Feature.PLAYER_RESPAWN.value]:
             self.create_tag(    module_path / "data" / "nexus" / "tags" / "functions" / "player" / "respawn.json", [f"{namespace}:player/respawn/main"])
             self.create_function(module_path / "data" / namespace.value / "functions" / "player" / "respawn" / "main.mcfunction", [])
 
-    def create_setup_functions(self, module_path: Path, internal_id: Setting_Template, namespace: Setting_Template, features: dict[str, Setting_Template]):
+    def create_setup_functions(self, module_path: Path, internal_id: Setting_Template, namespace: Setting_Template, features: dict[str, Setting_Template], kinds: list[Setting_Template]):
         """Creates the setup functions in the target module."""
         self.create_function(
             module_path / "data" / namespace.value / "functions" / "setup" / "main.mcfunction",
@@ -1150,10 +3254,12 @@ class Program:
             ]
         )
 
-        self.update_setup_functions(module_path, internal_id, namespace, features)
+        self.update_setup_functions(module_path, internal_id, namespace, features, kinds)
+
+    def update_setup_functions(self, module_path: Path, internal_id: Setting_Template, namespace: Setting_Template, features: dict[str, Setting_Template], kinds: list[Setting_Template]):
+        """Creates the `last_modified` and feature assignment functions in the target module.
 
-    def update_setup_functions(self, module_path: Path, internal_id: Setting_Template, namespace: Setting_Template, features: dict[str, Setting_Template]):
-        """Creates the `last_modified` and feature assignment functions in the target module."""
+        If any entity or object kinds are declared, the feature assignment also creates the objective used by the dispatch tree."""
         time = datetime.now()
         self.create_function(
             module_path / "data" / namespace.value / "functions" / "setup" / "last_modified.mcfunction",
@@ -1162,11 +3268,14 @@ class Program:
                 f'scoreboard players set #last_modified nexus.value {time.year}{"0" if time.month < 10 else ""}{time.month}{"0" if time.day < 10 else ""}{time.day}{"0" if time.hour*4 + time.minute//15 < 10 else ""}{time.hour*4 + time.minute//15}',
                 f'execute unless score #{internal_id}_last_modified nexus.value = #last_modified nexus.value run scoreboard players set #update_installation_boolean nexus.value 1',
                 f'scoreboard players operation #{internal_id}_last_modified nexus.value = #last_modified nexus.value'
-            ]
+            ],
+            True
         )
 
         feature_list: list[str] = []
         for feature in features:
+            if feature in GENERATOR_FEATURES:
+                continue
             feature_name = feature.replace(
                 "player_hurt_entity",
                 "phe"
@@ -1200,25 +3309,36 @@ class Program:
                 feature_list.append(
                     f"execute if score #feature_{feature_name} nexus.value matches ..{features[feature].score()} run scoreboard players set #feature_{feature_name} nexus.value {features[feature].score()}"
                 )
-        self.create_function(
-            module_path / "data" / namespace.value / "functions" / "setup" / "feature" / "assign.mcfunction",
-            [
-                '# Assign features', '',
-                "\n".join(feature_list)
-            ]
-        )
+        contents = [
+            '# Assign features', '',
+            "\n".join(feature_list)
+        ]
+        if kinds:
+            contents.extend(
+                [
+                    '\n'*6,
+                    '# Create dispatch objective', '',
+                    f'scoreboard objectives add {namespace}.kind dummy'
+                ]
+            )
+        self.create_function(module_path / "data" / namespace.value / "functions" / "setup" / "feature" / "assign.mcfunction", contents)
 
     def create_tick_functions(self, module_path: Path, namespace: Setting_Template):
         """Creates a blank ticking function in the target module."""
         self.create_function(module_path / "data" / namespace.value / "functions" / "tick" / "main.mcfunction", [])
 
-    def create_uninstall_functions(self, module_path: Path, module_name: Setting_Template, internal_id: Setting_Template, namespace: Setting_Template, features: dict[str, Setting_Template]):
-        """Creates the uninstall function in the target module."""
+    def create_uninstall_functions(self, module_path: Path, module_name: Setting_Template, internal_id: Setting_Template, namespace: Setting_Template, features: dict[str, Setting_Template], kinds: list[Setting_Template]):
+        """Creates the uninstall function in the target module.
+
+        The objective used by the dispatch tree is only removed if any entity or object kinds are declared."""
+        objectives = [f'scoreboard objectives remove {namespace}.value']
+        if kinds:
+            objectives.append(f'scoreboard objectives remove {namespace}.kind')
         self.create_function(
             module_path / "data" / namespace.value / "functions" / "uninstall" / "main.mcfunction",
             [
                 '# Remove scoreboard objectives', '',
-                f'scoreboard objectives remove {namespace}.value',
+                "\n".join(objectives),
                 '\n'*6,
                 '# Terminate entities', '',
                 f'kill @e[type=#{namespace}:generic/entity,tag={namespace}.entity]',
@@ -1233,7 +3353,7 @@ class Program:
                 f'scoreboard players reset #{internal_id}_last_modified nexus.value',
                 '\n'*6,
                 '# Send message to chat', '',
-                f'execute if score #debug_system_messages nexus.value matches 1 run tellraw @a[tag=nexus.player.operator] ["",{{"text":"[","color":"gray"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"gray"}}," ",{{"text":"Module was successfully uninstalled.","color":"gray"}}]'
+                f'execute if score #debug_system_messages nexus.value matches 1 run tellraw @a[tag=nexus.player.operator] {UNINSTALLED_TEMPLATE.fill(module_name=module_name)}'
             ]
         )
 
@@ -1245,11 +3365,20 @@ class Program:
         internal_id: Setting_Template,
         namespace: Setting_Template,
         download_link: Setting_Template,
-        dependencies: list[dict[str, Setting_Template]]
+        dependencies: list[dict[str, Setting_Template]],
+        features: dict[str, Setting_Template]
     ):
         """Creates the version-verification system in the target module.
         This system is used to ensure that every module has their dependencies installed,
-        and that conflicting versions do not coexist. It is the primary thing which changes when automated updates occur."""
+        and that conflicting versions do not coexist. It is the primary thing which changes when automated updates occur.
+
+        With keyed verification, each module also registers under its internal ID in `nexus:data module_index`,
+        so that the version and copy count of a dependency are read directly instead of filtering the whole module list.
+        Each entry is stamped with the game time of the verification which wrote it, so entries left over from an earlier
+        verification are ignored even when the Nexus doesn't reset the index, and a second copy in the same verification
+        increments the count of the entry instead of replacing it.
+        Dependencies which don't register themselves there, such as the Nexus, fall back to filtering the module list."""
+        keyed: bool = features[Feature.KEYED_VERIFICATION.value].value
         # Create main file
         file_path = module_path / "data" / "nexus" / "functions" / "verify" / "main.mcfunction"
         self.create_function(
@@ -1263,6 +3392,7 @@ class Program:
                 '\n'*6,
                 '# Verify modules', '',
                 "data modify storage nexus:data modules set value []",
+                "data modify storage nexus:data module_index set value {}",
                 'function #nexus:verify/version',
                 'function #nexus:verify/check',
                 '\n'*6,
@@ -1277,18 +3407,39 @@ class Program:
         # Create module-specific files
         folder_path = module_path / "data" / namespace.value / "functions" / "verify" / str(version).replace(".", "_")
 
-        self.create_function(
-            folder_path / "version.mcfunction",
-            [
-                '# Add pack version ID to module list', '',
-                f'data modify storage nexus:data modules append value {{id:"{internal_id}",version:{{major:{version.major},minor:{version.minor},patch:{version.patch}}}}}'
-            ]
-        )
+        version_contents = [
+            '# Add pack version ID to module list', '',
+            f'data modify storage nexus:data modules append value {{id:"{internal_id}",version:{{major:{version.major},minor:{version.minor},patch:{version.patch}}}}}'
+        ]
+        if keyed:
+            version_contents.extend(
+                [
+                    '',
+                    '# Register pack version and copy count in module index', '',
+                    'execute store result score #time nexus.value run time query gametime',
+                    f'execute store result score #index_time nexus.value run data get storage nexus:data module_index."{internal_id}".time',
+                    'scoreboard players set #module_count nexus.value 0',
+                    f'execute if score #index_time nexus.value = #time nexus.value store result score #module_count nexus.value run data get storage nexus:data module_index."{internal_id}".copies',
+                    'scoreboard players add #module_count nexus.value 1',
+                    f'data modify storage nexus:data module_index."{internal_id}" set value {{version:{{major:{version.major},minor:{version.minor},patch:{version.patch}}},time:0,copies:0}}',
+                    f'execute store result storage nexus:data module_index."{internal_id}".time int 1 run scoreboard players get #time nexus.value',
+                    f'execute store result storage nexus:data module_index."{internal_id}".copies int 1 run scoreboard players get #module_count nexus.value'
+                ]
+            )
+        self.create_function(folder_path / "version.mcfunction", version_contents)
 
         contents: list[str] = []
+        if keyed:
+            contents.extend(
+                [
+                    '# Get time of this verification', '',
+                    'execute store result score #time nexus.value run time query gametime',
+                    '\n'*6
+                ]
+            )
         module_download = ""
         if download_link.value != "":
-            module_download = f'," ",{{"text":"Click here to download.","color":"red","underlined":true,"hoverEvent":{{"action":"show_text","value":[{{"text":"{module_name}","color":"gold"}},{{"text":" download","color":"gray"}}]}},"clickEvent":{{"action":"open_url","value":"{download_link}"}}}}'
+            module_download = DOWNLOAD_TEMPLATE.fill(name=module_name, color="gold", link=download_link)
         for dependency in dependencies:
             dependency_name = dependency[Module_Setting.MODULE_NAME.value].value
             dependency_version: Version = dependency[Module_Setting.VERSION.value]
@@ -1300,16 +3451,38 @@ class Program:
                 dependency_color = "blue"
             dependency_download = ""
             if dependency_download_link != "":
-                dependency_download = f'," ",{{"text":"Click here to download.","color":"red","underlined":true,"hoverEvent":{{"action":"show_text","value":[{{"text":"{dependency_name}","color":"{dependency_color}"}},{{"text":" download","color":"gray"}}]}},"clickEvent":{{"action":"open_url","value":"{dependency_download_link}"}}}}'
+                dependency_download = DOWNLOAD_TEMPLATE.fill(name=dependency_name, color=dependency_color, link=dependency_download_link)
 
+            # Find installed copies of the dependency
             contents.extend(
                 [
                     f'# Throw error if "{dependency_name}" is not installed properly',
-                    '',
-                    f'execute store result score #module_count nexus.value if data storage nexus:data modules[{{id:"{dependency_internal_id}"}}]',
+                    ''
+                ]
+            )
+            if keyed:
+                version_path = 'module_check.version'
+                contents.extend(
+                    [
+                        'data modify storage nexus:data module_check set value {}',
+                        f'execute store result score #index_time nexus.value run data get storage nexus:data module_index."{dependency_internal_id}".time',
+                        f'execute if score #index_time nexus.value = #time nexus.value run data modify storage nexus:data module_check set from storage nexus:data module_index."{dependency_internal_id}"',
+                        'execute store result score #module_count nexus.value run data get storage nexus:data module_check.copies',
+                        f'execute unless data storage nexus:data module_check.copies store result score #module_count nexus.value if data storage nexus:data modules[{{id:"{dependency_internal_id}"}}]',
+                        f'execute unless data storage nexus:data module_check.copies if score #module_count nexus.value matches 1 run data modify storage nexus:data module_check set from storage nexus:data modules[{{id:"{dependency_internal_id}"}}]'
+                    ]
+                )
+            else:
+                version_path = f'modules[{{id:"{dependency_internal_id}"}}].version'
+                contents.append(
+                    f'execute store result score #module_count nexus.value if data storage nexus:data modules[{{id:"{dependency_internal_id}"}}]'
+                )
+
+            contents.extend(
+                [
                     'execute unless score #module_count nexus.value matches 1 run scoreboard players set #doms_nexus_error_boolean nexus.value 1',
-                    f'execute if score #module_count nexus.value matches 000 run tellraw @a ["",{{"text":"[","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"red"}}," ",{{"text":"Error: ","color":"dark_red"}},{{"text":"{dependency_name}","color":"{dependency_color}"}},{{"text":" is not installed.","color":"red"}}{dependency_download}]',
-                    f'execute if score #module_count nexus.value matches 2.. run tellraw @a ["",{{"text":"[","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"red"}}," ",{{"text":"Error: ","color":"dark_red"}},{{"text":"Multiple copies of ","color":"red"}},{{"text":"{dependency_name}","color":"{dependency_color}"}},{{"text":" exist. Remove all outdated versions.","color":"red"}}]',
+                    f'execute if score #module_count nexus.value matches 000 run tellraw @a {NOT_INSTALLED_TEMPLATE.fill(module_name=module_name, dependency_name=dependency_name, dependency_color=dependency_color, dependency_download=dependency_download)}',
+                    f'execute if score #module_count nexus.value matches 2.. run tellraw @a {MULTIPLE_COPIES_TEMPLATE.fill(module_name=module_name, dependency_name=dependency_name, dependency_color=dependency_color)}',
                     '',
                     f'scoreboard players set #expected_major nexus.value {dependency_version.major}',
                     f'scoreboard players set #expected_minor nexus.value {dependency_version.minor}',
@@ -1318,17 +3491,17 @@ class Program:
                     'scoreboard players set #installed_minor nexus.value 0',
                     'scoreboard players set #installed_patch nexus.value 0',
                     '',
-                    f'execute if score #module_count nexus.value matches 1 store result score #installed_major nexus.value run data get storage nexus:data modules[{{id:"{dependency_internal_id}"}}].version.major',
-                    f'execute if score #module_count nexus.value matches 1 store result score #installed_minor nexus.value run data get storage nexus:data modules[{{id:"{dependency_internal_id}"}}].version.minor',
-                    f'execute if score #module_count nexus.value matches 1 store result score #installed_patch nexus.value run data get storage nexus:data modules[{{id:"{dependency_internal_id}"}}].version.patch',
+                    f'execute if score #module_count nexus.value matches 1 store result score #installed_major nexus.value run data get storage nexus:data {version_path}.major',
+                    f'execute if score #module_count nexus.value matches 1 store result score #installed_minor nexus.value run data get storage nexus:data {version_path}.minor',
+                    f'execute if score #module_count nexus.value matches 1 store result score #installed_patch nexus.value run data get storage nexus:data {version_path}.patch',
                     f'execute if score #module_count nexus.value matches 1 unless score #installed_major nexus.value = #expected_major nexus.value run scoreboard players set #doms_nexus_error_boolean nexus.value 1',
-                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value < #expected_major nexus.value run tellraw @a ["",{{"text":"[","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"red"}}," ",{{"text":"Error: ","color":"dark_red"}},{{"text":"{dependency_name}","color":"{dependency_color}"}}," ",{{"score":{{"name":"#installed_major","objective":"nexus.value"}},"color":"gold"}},{{"text":".x.x","color":"gold"}},{{"text":" is too old, update it to the latest version.","color":"red"}}{dependency_download}]',
-                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value > #expected_major nexus.value run tellraw @a ["",{{"text":"[","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"red"}}," ",{{"text":"Error: ","color":"dark_red"}},{{"text":"{dependency_name}","color":"{dependency_color}"}}," ",{{"score":{{"name":"#installed_major","objective":"nexus.value"}},"color":"gold"}},{{"text":".x.x","color":"gold"}},{{"text":" is too new, update ","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":" to the latest version.","color":"red"}}{module_download}]',
+                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value < #expected_major nexus.value run tellraw @a {TOO_OLD_TEMPLATE.fill(module_name=module_name, dependency_name=dependency_name, dependency_color=dependency_color, installed=INSTALLED_MAJOR_TEXT, dependency_download=dependency_download)}',
+                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value > #expected_major nexus.value run tellraw @a {TOO_NEW_TEMPLATE.fill(module_name=module_name, dependency_name=dependency_name, dependency_color=dependency_color, installed=INSTALLED_MAJOR_TEXT, module_download=module_download)}',
                     f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value = #expected_major nexus.value unless score #installed_minor nexus.value = #expected_minor nexus.value run scoreboard players set #doms_nexus_error_boolean nexus.value 1',
-                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value = #expected_major nexus.value if score #installed_minor nexus.value < #expected_minor nexus.value run tellraw @a ["",{{"text":"[","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"red"}}," ",{{"text":"Error: ","color":"dark_red"}},{{"text":"{dependency_name}","color":"{dependency_color}"}}," ",{{"score":{{"name":"#installed_major","objective":"nexus.value"}},"color":"gold"}},{{"text":".","color":"gold"}},{{"score":{{"name":"#installed_minor","objective":"nexus.value"}},"color":"gold"}},{{"text":".x","color":"gold"}},{{"text":" is too old, update it to the latest version.","color":"red"}}{dependency_download}]',
-                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value = #expected_major nexus.value if score #installed_minor nexus.value > #expected_minor nexus.value run tellraw @a ["",{{"text":"[","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"red"}}," ",{{"text":"Error: ","color":"dark_red"}},{{"text":"{dependency_name}","color":"{dependency_color}"}}," ",{{"score":{{"name":"#installed_major","objective":"nexus.value"}},"color":"gold"}},{{"text":".","color":"gold"}},{{"score":{{"name":"#installed_minor","objective":"nexus.value"}},"color":"gold"}},{{"text":".x","color":"gold"}},{{"text":" is too new, update ","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":" to the latest version.","color":"red"}}{module_download}]',
+                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value = #expected_major nexus.value if score #installed_minor nexus.value < #expected_minor nexus.value run tellraw @a {TOO_OLD_TEMPLATE.fill(module_name=module_name, dependency_name=dependency_name, dependency_color=dependency_color, installed=INSTALLED_MINOR_TEXT, dependency_download=dependency_download)}',
+                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value = #expected_major nexus.value if score #installed_minor nexus.value > #expected_minor nexus.value run tellraw @a {TOO_NEW_TEMPLATE.fill(module_name=module_name, dependency_name=dependency_name, dependency_color=dependency_color, installed=INSTALLED_MINOR_TEXT, module_download=module_download)}',
                     f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value = #expected_major nexus.value if score #installed_minor nexus.value = #expected_minor nexus.value unless score #installed_patch nexus.value >= #expected_patch nexus.value run scoreboard players set #doms_nexus_error_boolean nexus.value 1',
-                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value = #expected_major nexus.value if score #installed_minor nexus.value = #expected_minor nexus.value if score #installed_patch nexus.value < #expected_patch nexus.value run tellraw @a ["",{{"text":"[","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"red"}}," ",{{"text":"Error: ","color":"dark_red"}},{{"text":"{dependency_name}","color":"{dependency_color}"}}," ",{{"score":{{"name":"#installed_major","objective":"nexus.value"}},"color":"gold"}},{{"text":".","color":"gold"}},{{"score":{{"name":"#installed_minor","objective":"nexus.value"}},"color":"gold"}},{{"text":".","color":"gold"}},{{"score":{{"name":"#installed_patch","objective":"nexus.value"}},"color":"gold"}},{{"text":" is too old, update it to the latest version.","color":"red"}}{dependency_download}]',
+                    f'execute if score #module_count nexus.value matches 1 if score #installed_major nexus.value = #expected_major nexus.value if score #installed_minor nexus.value = #expected_minor nexus.value if score #installed_patch nexus.value < #expected_patch nexus.value run tellraw @a {TOO_OLD_TEMPLATE.fill(module_name=module_name, dependency_name=dependency_name, dependency_color=dependency_color, installed=INSTALLED_PATCH_TEXT, dependency_download=dependency_download)}',
                     '\n'*6
                 ]
             )
@@ -1337,9 +3510,10 @@ class Program:
             [
                 '# Throw error if multiple copies of the module are loaded',
                 '',
+                f'execute store result score #module_count nexus.value run data get storage nexus:data module_index."{internal_id}".copies' if keyed else
                 f'execute store result score #module_count nexus.value if data storage nexus:data modules[{{id:"{internal_id}"}}]',
                 f'execute if score #module_count nexus.value matches 2.. run scoreboard players set #doms_nexus_error_boolean nexus.value 1',
-                f'execute if score #module_count nexus.value matches 2.. run tellraw @a ["",{{"text":"[","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":"]","color":"red"}}," ",{{"text":"Error: ","color":"dark_red"}},{{"text":"Multiple copies of ","color":"red"}},{{"text":"{module_name}","color":"gold"}},{{"text":" exist. Remove all outdated versions.","color":"red"}}]'
+                f'execute if score #module_count nexus.value matches 2.. run tellraw @a {MULTIPLE_COPIES_TEMPLATE.fill(module_name=module_name, dependency_name=module_name, dependency_color="gold")}'
             ]
         )
 
@@ -1374,6 +3548,421 @@ def check_action(action_string: str, minimum: int, maximum: int) -> tuple[int, b
         return action, True, " ERROR: Input is out of range!\n"
     return action, False, ""
 
+def is_zip_module(module_path: Path) -> bool:
+    """Checks if a module path refers to a zip file rather than a folder."""
+    return module_path.suffix == ".zip"
+
+def dispatch_tree(count: int, condition: str, leaf, branch) -> tuple[list[str], dict[tuple[int, int], list[str]]]:
+    """Splits cases numbered from 1 to `count` into a balanced binary tree of functions,
+    so that finding the right case takes a logarithmic number of commands instead of a linear chain.
+
+    `condition` is an `execute` condition which is followed by the number or range being checked,
+    `leaf(i)` returns the command run for case `i`, and `branch(low, high)` returns the ID of the function holding cases `low` to `high`.
+    Returns the commands of the root, and the commands of each branch function keyed by the cases it holds."""
+    branches: dict[tuple[int, int], list[str]] = {}
+
+    def create_branch(low: int, high: int) -> list[str]:
+        if high - low < DISPATCH_LEAF_SIZE:
+            return [f'{condition} {i} run {leaf(i)}' for i in range(low, high + 1)]
+        middle = (low + high)//2
+        contents: list[str] = []
+        for branch_low, branch_high in [(low, middle), (middle + 1, high)]:
+            if branch_low == branch_high:
+                contents.extend(create_branch(branch_low, branch_high))
+                continue
+            branches[(branch_low, branch_high)] = create_branch(branch_low, branch_high)
+            contents.append(f'{condition} {branch_low}..{branch_high} run function {branch(branch_low, branch_high)}')
+        return contents
+
+    return create_branch(1, count), branches
+
+def dispatch_hash(commands: list[str]) -> str:
+    """Returns the hash written in the header of a generated dispatch function, taken from its commands,
+    so that the function can later be told apart from one which the user edited, even after it was minified."""
+    return hashlib.sha256("\n".join(commands).encode("utf-8")).hexdigest()[:16]
+
+def minify_file(file_path: Path, contents: bytes) -> bytes:
+    """Returns the contents of a data pack file with everything the game doesn't need removed.
+
+    Comments and blank lines are removed from `.mcfunction` files, along with the indentation of each line,
+    except for the comments starting with `MINIFY_KEPT_PREFIXES` which mark generated files. JSON files are written without any whitespace. Other files, and JSON files which can't be read, are returned unchanged."""
+    if file_path.suffix == ".mcfunction":
+        lines = [line.strip() for line in contents.decode("utf-8", errors="surrogateescape").splitlines()]
+        return "\n".join([line for line in lines if line and (not line.startswith("#") or line.startswith(MINIFY_KEPT_PREFIXES))]).encode("utf-8", errors="surrogateescape")
+    if file_path.suffix in [".json", ".mcmeta"]:
+        try:
+            return json.dumps(json.loads(contents), separators=(",", ":")).encode("utf-8")
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return contents
+    return contents
+
+def parse_function_files(module_path: str, names: list[str]) -> dict[str, list[tuple[int, str, int, str, list[str]]]]:
+    """Reads and parses the given `.mcfunction` files of a module for `Module_Linter`. This can run inside a worker process.
+
+    Returns the line number, command, iteration multiplier, called function, and broken rules of each command, keyed by function ID."""
+    functions: dict[str, list[tuple[int, str, int, str, list[str]]]] = {}
+    archive = zipfile.ZipFile(module_path) if is_zip_module(Path(module_path)) else None
+    for name in names:
+        contents = archive.read(name) if archive else (Path(module_path) / name).read_bytes()
+        parts = name.split("/")
+        commands: list[tuple[int, str, int, str, list[str]]] = []
+        for line_number, line in enumerate(contents.decode("utf-8", errors="replace").splitlines(), 1):
+            command = line.strip()
+            if not command or command.startswith("#"):
+                continue
+
+            # Check rules
+            rules: list[str] = []
+            selectors = find_selectors(command)
+            if any("nbt=" in arguments for _, arguments in selectors):
+                rules.append("NBT selector")
+            if any(kind == "e" and not TYPE_FILTER_PATTERN.search(arguments) for kind, arguments in selectors):
+                rules.append("@e selector without type")
+            if DATA_GET_ENTITY_PATTERN.search(command):
+                rules.append("data get entity")
+
+            # Count iterations and find function call
+            iterations = 1
+            for kind in ITERATION_PATTERN.findall(command):
+                iterations *= LINT_PLAYER_COUNT if kind == "a" else LINT_ENTITY_COUNT
+            call = FUNCTION_CALL_PATTERN.search(command)
+            commands.append((line_number, command, iterations, call.group(1) if call else "", rules))
+        functions[parts[1] + ":" + "/".join(parts[3:]).removesuffix(".mcfunction")] = commands
+    if archive:
+        archive.close()
+    return functions
+
+def find_selectors(command: str) -> list[tuple[str, str]]:
+    """Returns the type and arguments of every target selector in a command, such as `("e", "type=zombie,limit=1")` for `@e[type=zombie,limit=1]`.
+
+    Brackets and quotes within the arguments are matched, so NBT containing lists doesn't end the selector early.
+    An `@` followed by a longer word, such as in an email address, isn't a selector."""
+    selectors: list[tuple[str, str]] = []
+    i = command.find("@")
+    while i != -1 and i + 1 < len(command):
+        kind = command[i + 1]
+        end = i + 2
+        if kind in "aeprs" and end < len(command) and command[end] == "[":
+            depth = 0
+            quote = ""
+            while end < len(command):
+                character = command[end]
+                if quote:
+                    if character == "\\":
+                        end += 1
+                    elif character == quote:
+                        quote = ""
+                elif character in "\"'":
+                    quote = character
+                elif character in "[{":
+                    depth += 1
+                elif character in "]}":
+                    depth -= 1
+                    if depth == 0:
+                        break
+                end += 1
+            selectors.append((kind, command[i + 3:end]))
+        elif kind in "aeprs" and (end == len(command) or not (command[end].isalnum() or command[end] == "_")):
+            selectors.append((kind, ""))
+        i = command.find("@", end)
+    return selectors
+
+def has_commands(contents: bytes) -> bool:
+    """Checks if the contents of a `.mcfunction` file have any commands, rather than only comments and blank lines."""
+    for line in contents.decode("utf-8", errors="replace").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            return True
+    return False
+
+def is_module(path: Path) -> bool:
+    """Checks if a path is a module, that is, a folder or zip file containing `module_info.json`.
+
+    Hidden paths are skipped, since these are used for staging builds."""
+    if path.name.startswith("."):
+        return False
+    if path.is_dir():
+        return (path / "module_info.json").exists()
+    if not is_zip_module(path) or not path.is_file():
+        return False
+    try:
+        with zipfile.ZipFile(path) as archive:
+            return "module_info.json" in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+def check_setting(setting_class: type[Setting_Template], value, field: str) -> list[dict[str, str]]:
+    """Checks a single setting, returning its error in the format of `validate_settings()`."""
+    error_message = setting_class.check(value, field)
+    if not error_message:
+        return []
+    return [{"field": field, "error": error_message.strip().removeprefix("ERROR: ").removeprefix(field).lstrip(": ")}]
+
+def validate_settings(settings_json: dict[str, dict[str, str] | list[dict[str, str]]]) -> list[dict[str, str]]:
+    """Checks every field of a settings file or `module_info.json` without importing it into a program,
+    and returns the field and error of every problem found, rather than stopping at the first one.
+
+    Each field is checked by the `check()` method of the setting type it would be imported as."""
+    category_classes = {
+        Setting_Category.MODULE_INFO.value: MODULE_INFO_CLASSES,
+        Setting_Category.FEATURES.value: FEATURE_CLASSES
+    }
+    errors: list[dict[str, str]] = []
+    if not isinstance(settings_json, dict):
+        return [{"field": "", "error": "Settings must be a JSON object!"}]
+
+    for category in [Setting_Category.MODULE_INFO.value, Setting_Category.FEATURES.value]:
+        if category not in settings_json:
+            continue
+        if not isinstance(settings_json[category], dict):
+            errors.append({"field": category, "error": "Must be a JSON object!"})
+            continue
+        for setting, value in settings_json[category].items():
+            if setting not in category_classes[category]:
+                errors.append({"field": f"{category}.{setting}", "error": "Unknown setting!"})
+                continue
+            errors.extend(check_setting(category_classes[category][setting], value, f"{category}.{setting}"))
+
+    category = Setting_Category.DEPENDENCIES.value
+    if category in settings_json:
+        if not isinstance(settings_json[category], list):
+            errors.append({"field": category, "error": "Must be a JSON array!"})
+        else:
+            for i, dependency in enumerate(settings_json[category]):
+                if not isinstance(dependency, dict):
+                    errors.append({"field": f"{category}[{i}]", "error": "Must be a JSON object!"})
+                    continue
+                for setting, value in dependency.items():
+                    if setting not in DEPENDENCY_CLASSES:
+                        errors.append({"field": f"{category}[{i}].{setting}", "error": "Unknown setting!"})
+                        continue
+                    errors.extend(check_setting(DEPENDENCY_CLASSES[setting], value, f"{category}[{i}].{setting}"))
+
+    for category in [Setting_Category.ENTITY_KINDS.value, Setting_Category.OBJECT_KINDS.value]:
+        if category not in settings_json:
+            continue
+        if not isinstance(settings_json[category], list):
+            errors.append({"field": category, "error": "Must be a JSON array!"})
+            continue
+        for i, kind in enumerate(settings_json[category]):
+            errors.extend(check_setting(Internal, kind, f"{category}[{i}]"))
+            if kind in settings_json[category][:i]:
+                errors.append({"field": f"{category}[{i}]", "error": f'Cannot declare "{kind}" twice!'})
+
+    for category in settings_json:
+        if category not in [category.value for category in Setting_Category]:
+            errors.append({"field": category, "error": "Unknown category!"})
+    return errors
+
+
+
+# Module functions
+
+def read_module_info(module_path: Path) -> tuple[dict[str, dict[str, str]], str]:
+    """Reads `module_info.json` from a module, whether it is a folder or a zip file.
+
+    Returns the contents and an error message, which is empty if the file was read successfully."""
+    if not is_zip_module(module_path):
+        file_path = module_path / "module_info.json"
+        try:
+            with file_path.open("r", encoding="utf-8") as file:
+                contents = file.read().encode(encoding="utf-8", errors="backslashreplace")
+        except (FileNotFoundError, NotADirectoryError):
+            return {}, f" ERROR: {file_path.as_posix()} doesn't exist!\n"
+    else:
+        try:
+            with zipfile.ZipFile(module_path) as archive:
+                contents = archive.read("module_info.json")
+        except (FileNotFoundError, KeyError, zipfile.BadZipFile):
+            return {}, f" ERROR: {module_path.as_posix()} doesn't contain module_info.json!\n"
+    try:
+        settings_json = json.loads(contents)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {}, f" ERROR: {module_path.as_posix()}/module_info.json is not properly formatted!\n"
+    if not isinstance(settings_json, dict):
+        return {}, f" ERROR: {module_path.as_posix()}/module_info.json is not properly formatted!\n"
+    return settings_json, ""
+
+
+
+def changed_stages(old_settings: dict[str, dict[str, str] | list[dict[str, str]]], new_settings: dict[str, dict[str, str] | list[dict[str, str]]]) -> set[Build_Stage]:
+    """Returns the update stages whose output depends on the settings which differ between two exported settings,
+    so that a small change doesn't regenerate the whole module. `module_info.json` is included whenever anything changed."""
+    stages: set[Build_Stage] = set()
+    if old_settings[Setting_Category.MODULE_INFO.value] != new_settings[Setting_Category.MODULE_INFO.value]:
+        stages |= UPDATE_STAGES
+    if old_settings[Setting_Category.DEPENDENCIES.value] != new_settings[Setting_Category.DEPENDENCIES.value]:
+        stages |= {Build_Stage.PACK_MCMETA, Build_Stage.VERIFICATION_FUNCTIONS}
+
+    old_features = old_settings[Setting_Category.FEATURES.value]
+    for feature, value in new_settings[Setting_Category.FEATURES.value].items():
+        if old_features.get(feature) == value:
+            continue
+        stages |= FEATURE_STAGES.get(feature, set())
+        if feature not in GENERATOR_FEATURES:
+            stages.add(Build_Stage.UPDATE_SETUP_FUNCTIONS)
+
+    for category, stage in [(Setting_Category.ENTITY_KINDS.value, Build_Stage.ENTITY_FUNCTIONS), (Setting_Category.OBJECT_KINDS.value, Build_Stage.OBJECT_FUNCTIONS)]:
+        if old_settings.get(category, []) != new_settings[category]:
+            stages |= {stage, Build_Stage.UPDATE_SETUP_FUNCTIONS}
+
+    if stages:
+        stages.add(Build_Stage.MODULE_INFO_JSON)
+    return stages
+
+def version_tuple(value: dict[str, int] | None) -> tuple[int, int, int]:
+    """Converts a version from `module_info.json` into a tuple, using zeroes for anything missing or malformed."""
+    if not isinstance(value, dict):
+        return 0, 0, 0
+    return tuple(value.get(key) if isinstance(value.get(key), int) else 0 for key in ["major", "minor", "patch"])
+
+def find_modules(folder_path: Path) -> list[tuple[Path, str, tuple[int, int, int]]]:
+    """Returns the path, internal ID, and version of every module in a folder, skipping modules without a readable internal ID."""
+    modules: list[tuple[Path, str, tuple[int, int, int]]] = []
+    for module_path in sorted(folder_path.iterdir()):
+        if not is_module(module_path):
+            continue
+        settings_json, error_message = read_module_info(module_path)
+        module_info = settings_json.get(Setting_Category.MODULE_INFO.value)
+        if error_message or not isinstance(module_info, dict) or not isinstance(module_info.get(Module_Setting.INTERNAL_ID.value), str):
+            continue
+        modules.append((module_path, module_info[Module_Setting.INTERNAL_ID.value], version_tuple(module_info.get(Module_Setting.VERSION.value))))
+    return modules
+
+
+
+def synthetic_settings(module_count: int, dependency_count: int, feature_ratio: float, seed: int) -> list[dict[str, dict[str, str] | list[dict[str, str]]]]:
+    """Returns the settings of a workspace of made-up modules, used for benchmarking.
+
+    Every module depends on Dom's Nexus and on up to `dependency_count` of the modules before it.
+    Each Boolean feature is enabled with a chance of `feature_ratio`, picked with a seeded generator so that runs can be repeated."""
+    generator = random.Random(seed)
+    settings_list: list[dict[str, dict[str, str] | list[dict[str, str]]]] = []
+    for i in range(module_count):
+        settings_json = Program(False).export_settings()
+        module_info = settings_json[Setting_Category.MODULE_INFO.value]
+        module_info[Module_Setting.MODULE_NAME.value] = f"Benchmark {i}"
+        module_info[Module_Setting.INTERNAL_ID.value] = f"benchmark_{i}"
+        module_info[Module_Setting.NAMESPACE.value] = f"benchmark_{i}"
+        for j in sorted(generator.sample(range(i), min(i, dependency_count))):
+            settings_json[Setting_Category.DEPENDENCIES.value].append(
+                {
+                    Module_Setting.MODULE_NAME.value: f"Benchmark {j}",
+                    Module_Setting.VERSION.value: module_info[Module_Setting.VERSION.value],
+                    Module_Setting.INTERNAL_ID.value: f"benchmark_{j}",
+                    Module_Setting.DOWNLOAD_LINK.value: ""
+                }
+            )
+        features = settings_json[Setting_Category.FEATURES.value]
+        for feature in features:
+            if isinstance(features[feature], bool):
+                features[feature] = generator.random() < feature_ratio
+        settings_list.append(settings_json)
+    return settings_list
+
+
+
+# Path functions
+
+def data_pack_name(file_name: str) -> str:
+    """Returns the module name in the name of a data pack folder or zip file, such as `Dom's Nexus` in `Dom's Nexus DP - By Dominexis - 2.0.0.zip`.
+    Names which don't follow that format are returned whole, without the `.zip` suffix."""
+    file_name = file_name.removesuffix(".zip")
+    match = DATA_PACK_NAME_PATTERN.fullmatch(file_name)
+    return match.group(1) if match else file_name
+
+def zip_file_path(module_path: Path) -> Path:
+    """Returns the path of the zip file which a module folder is written to when zip output is enabled."""
+    return module_path.parent / f'{module_path.name}.zip'
+
+def datapacks_path(world_path: Path) -> Path | None:
+    """Returns the `datapacks` folder of a world, which `world_path` may also point to directly, or `None` if it isn't a world."""
+    if (world_path / "level.dat").is_file():
+        return world_path / "datapacks"
+    if world_path.name == "datapacks" and world_path.is_dir():
+        return world_path
+    return None
+
+def is_same_file(source_path: Path, source_stat: os.stat_result, file_path: Path, dry_run: bool = False) -> bool:
+    """Checks if `file_path` has the same contents as `source_path`, comparing the size first, then the modification time,
+    and only reading both files if the modification times differ.
+
+    Files with the same contents are given the modification time of the source, so that the next check doesn't read them,
+    unless `dry_run` is enabled."""
+    try:
+        file_stat = file_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    if file_stat.st_size != source_stat.st_size:
+        return False
+    if file_stat.st_mtime_ns == source_stat.st_mtime_ns:
+        return True
+    if hashlib.sha256(file_path.read_bytes()).digest() != hashlib.sha256(source_path.read_bytes()).digest():
+        return False
+    if not dry_run:
+        os.utime(file_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+    return True
+
+def remove_path(path: Path):
+    """Deletes a file or a folder along with its contents."""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+def sync_module(source_path: Path, module_path: Path, dry_run: bool = False) -> tuple[int, int, int]:
+    """Makes `module_path` an exact copy of the module at `source_path`, only copying the files which differ
+    and removing the files which aren't in the source. Modification times are copied so that unchanged files are skipped quickly.
+
+    If `dry_run` is enabled, nothing is changed. Returns the number of files copied, unchanged, and removed."""
+    # Replace a folder with a zip file or the other way around
+    removed = 0
+    if module_path.exists() and module_path.is_dir() != source_path.is_dir():
+        removed += sum(1 for file_path in module_path.rglob("*") if file_path.is_file()) if module_path.is_dir() else 1
+        if not dry_run:
+            remove_path(module_path)
+
+    # Copy zip file
+    if not source_path.is_dir():
+        if is_same_file(source_path, source_path.stat(), module_path, dry_run):
+            return 0, 1, removed
+        if not dry_run:
+            shutil.copy2(source_path, module_path)
+        return 1, 0, removed
+
+    # Copy changed files
+    copied = 0
+    unchanged = 0
+    source_files: set[Path] = set()
+    for directory, _, file_names in os.walk(source_path):
+        directory = Path(directory)
+        relative_directory = directory.relative_to(source_path)
+        if not dry_run:
+            (module_path / relative_directory).mkdir(exist_ok=True)
+        for file_name in file_names:
+            source_files.add(relative_directory / file_name)
+            if is_same_file(directory / file_name, (directory / file_name).stat(), module_path / relative_directory / file_name, dry_run):
+                unchanged += 1
+                continue
+            if not dry_run:
+                shutil.copy2(directory / file_name, module_path / relative_directory / file_name)
+            copied += 1
+
+    # Remove files which aren't in the source
+    if module_path.is_dir():
+        for directory, directory_names, file_names in os.walk(module_path, topdown=False):
+            directory = Path(directory)
+            relative_directory = directory.relative_to(module_path)
+            for file_name in file_names:
+                if relative_directory / file_name in source_files:
+                    continue
+                removed += 1
+                if not dry_run:
+                    (directory / file_name).unlink()
+            if not dry_run and not (source_path / relative_directory).is_dir():
+                directory.rmdir()
+    return copied, unchanged, removed
+
 
 
 # Display functions
@@ -1396,7 +3985,705 @@ def print_lines(*lines: str):
 
 
 
+# Command line functions
+
+def positive_integer(value: str) -> int:
+    """Converts a command line argument to an integer, rejecting anything below 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, not {number}")
+    return number
+
+def run_command_line(arguments: list[str]) -> int:
+    """Runs the program from command line arguments instead of the interactive menus, and returns the exit code."""
+    COMMAND_HANDLER = {
+        "build": run_build,
+        "catalog": run_catalog,
+        "bump": run_bump,
+        "resolve": run_resolve,
+        "benchmark": run_benchmark,
+        "validate": run_validate,
+        "watch": run_watch,
+        "cache": run_cache,
+        "deploy": run_deploy,
+        "minify": run_minify,
+        "lint": run_lint,
+        "bundle": run_bundle
+    }
+
+    parser = argparse.ArgumentParser(
+        prog="Module Manager",
+        description="Creates and updates modules for Dom's Nexus without the interactive menus."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser("build", help="create modules from settings files and update existing modules")
+    build_parser.add_argument("targets", nargs="+", type=Path, help="settings files to create modules from, or module folders to update")
+    build_parser.add_argument("--workspace", type=Path, default=PROGRAM_PATH, help="folder to create modules in")
+    build_parser.add_argument("--jobs", type=positive_integer, default=None, help="number of worker processes")
+    build_parser.add_argument("--overwrite", action="store_true", help="replace modules which already exist")
+    build_parser.add_argument("--zip", action="store_true", help="write modules as zip files instead of folders")
+    build_parser.add_argument("--trace", type=Path, help="JSON file to write a trace of each build stage to")
+    build_parser.add_argument("--dry-run", action="store_true", help="list the files which would be added, modified, or deleted without writing anything")
+    build_parser.add_argument("--prune-empty-hooks", action="store_true", help="leave hook functions without any commands out of the Nexus tags until they get some")
+    build_parser.add_argument("--release", action="store_true", help="remove comments, blank lines, and JSON whitespace from the generated files")
+    build_parser.add_argument("--no-cache", action="store_true", help="generate every created module from scratch instead of using the generation cache")
+    build_parser.add_argument("--writer", choices=list(WRITER_BACKENDS), default="serial", help="how module files are written, threaded keeps many writes in flight for network drives")
+
+    catalog_parser = subparsers.add_parser("catalog", help="list and search the modules in a workspace")
+    catalog_parser.add_argument("--workspace", type=Path, default=PROGRAM_PATH, help="folder containing the modules")
+    catalog_parser.add_argument("--depends-on", metavar="INTERNAL_ID", help="only list modules with this dependency")
+    catalog_parser.add_argument("--below", metavar="VERSION", help="only match dependency versions older than this")
+    catalog_parser.add_argument("--at-least", metavar="VERSION", help="only match dependency versions at least this new")
+    catalog_parser.add_argument("--feature", metavar="NAME[=VALUE]", action="append", default=[], help="only list modules with this feature value, true if no value is given")
+
+    bump_parser = subparsers.add_parser("bump", help="change the version of a dependency in every module which declares it")
+    bump_parser.add_argument("internal_id", help="internal ID of the dependency")
+    bump_parser.add_argument("version", help="new version of the dependency")
+    bump_parser.add_argument("--workspace", type=Path, default=PROGRAM_PATH, help="folder containing the modules")
+    bump_parser.add_argument("--jobs", type=positive_integer, default=None, help="number of worker processes")
+    bump_parser.add_argument("--trace", type=Path, help="JSON file to write a trace of each build stage to")
+    bump_parser.add_argument("--dry-run", action="store_true", help="list the files which would be added, modified, or deleted without writing anything")
+    bump_parser.add_argument("--writer", choices=list(WRITER_BACKENDS), default="serial", help="how module files are written, threaded keeps many writes in flight for network drives")
+
+    resolve_parser = subparsers.add_parser("resolve", help="check the dependencies between the modules in a workspace")
+    resolve_parser.add_argument("--workspace", type=Path, default=PROGRAM_PATH, help="folder containing the modules, such as the datapacks folder of a world")
+
+    benchmark_parser = subparsers.add_parser("benchmark", help="time module creation, updates, discovery, and settings on a made-up workspace")
+    benchmark_parser.add_argument("--modules", type=int, default=100, help="number of modules in the workspace")
+    benchmark_parser.add_argument("--dependencies", type=int, default=2, help="number of other modules each module depends on")
+    benchmark_parser.add_argument("--features", type=float, default=0.5, help="chance of each Boolean feature being enabled")
+    benchmark_parser.add_argument("--repeat", type=positive_integer, default=3, help="number of times to run each benchmark")
+    benchmark_parser.add_argument("--seed", type=int, default=0, help="seed used to pick dependencies and features")
+    benchmark_parser.add_argument("--output", type=Path, default=PROGRAM_PATH / BENCHMARK_FILE_NAME, help="JSON file to write the results to")
+    benchmark_parser.add_argument("--compare", type=Path, help="JSON file of an earlier run to compare the results with")
+
+    validate_parser = subparsers.add_parser("validate", help="check settings files and modules for invalid settings")
+    validate_parser.add_argument("targets", nargs="+", type=Path, help="settings files, modules, or folders containing them")
+    validate_parser.add_argument("--jobs", type=positive_integer, default=None, help="number of worker processes")
+    validate_parser.add_argument("--report", type=Path, help="JSON file to write the report of every target to")
+
+    watch_parser = subparsers.add_parser("watch", help="regenerate modules whenever their settings change")
+    watch_parser.add_argument("targets", nargs="+", type=Path, help="settings files to create and update modules from, or modules whose module_info.json is edited directly")
+    watch_parser.add_argument("--workspace", type=Path, default=PROGRAM_PATH, help="folder to create modules in")
+    watch_parser.add_argument("--interval", type=float, default=0.25, help="seconds between checks for changes")
+
+    cache_parser = subparsers.add_parser("cache", help="show statistics of the generation cache or clear it")
+    cache_parser.add_argument("action", choices=["stats", "clear"], help="action to take on the cache")
+
+    deploy_parser = subparsers.add_parser("deploy", help="copy the modules in the workspace into the datapacks folders of worlds")
+    deploy_parser.add_argument("worlds", nargs="+", type=Path, help="world folders, or their datapacks folders")
+    deploy_parser.add_argument("--workspace", type=Path, default=PROGRAM_PATH, help="folder containing the modules")
+    deploy_parser.add_argument("--module", metavar="INTERNAL_ID", action="append", default=[], help="only deploy the module with this internal ID")
+    deploy_parser.add_argument("--jobs", type=positive_integer, default=None, help="number of worker processes")
+    deploy_parser.add_argument("--dry-run", action="store_true", help="count the files which would be copied or removed without changing anything")
+
+    minify_parser = subparsers.add_parser("minify", help="remove comments, blank lines, and JSON whitespace from every file of existing modules")
+    minify_parser.add_argument("targets", nargs="+", type=Path, help="module folders or zip files")
+    minify_parser.add_argument("--jobs", type=positive_integer, default=None, help="number of worker processes")
+
+    lint_parser = subparsers.add_parser("lint", help="find expensive commands in the functions which run every tick")
+    lint_parser.add_argument("targets", nargs="+", type=Path, help="module folders or zip files")
+    lint_parser.add_argument("--jobs", type=positive_integer, default=None, help="number of worker processes used to parse functions")
+    lint_parser.add_argument("--top", type=int, default=20, help="number of the highest scoring commands to show for each module")
+
+    bundle_parser = subparsers.add_parser("bundle", help="merge several modules into one data pack with a single entity and object dispatcher")
+    bundle_parser.add_argument("targets", nargs="+", type=Path, help="module folders or zip files")
+    bundle_parser.add_argument("--output", type=Path, default=PROGRAM_PATH / BUNDLE_NAME, help="data pack folder to write the bundle to")
+    bundle_parser.add_argument("--namespace", default="bundle", help="namespace of the dispatcher")
+    bundle_parser.add_argument("--zip", action="store_true", help="write the bundle as a zip file instead of a folder")
+    bundle_parser.add_argument("--overwrite", action="store_true", help="replace the bundle if it already exists")
+
+    options = parser.parse_args(arguments)
+    if options.command == "catalog" and options.depends_on is None and (options.below is not None or options.at_least is not None):
+        catalog_parser.error("--below and --at-least need --depends-on")
+    return COMMAND_HANDLER[options.command](options)
+
+def run_build(options: argparse.Namespace) -> int:
+    """Creates or updates every target in a process pool and reports the timing and exit code of each."""
+    return run_parallel(build_target, options.targets, (str(options.workspace), options.overwrite, options.zip, options.trace is not None, options.dry_run, not options.no_cache, options.writer, options.prune_empty_hooks, options.release), options.jobs, options.trace)
+
+def run_bump(options: argparse.Namespace) -> int:
+    """Changes the version of a dependency in every module of the workspace which declares it,
+    and regenerates the files which depend on it in a process pool."""
+    version = Version(0, 0, 0)
+    error_message = version.assign(options.version, "version")
+    if error_message:
+        print(error_message, end="")
+        return 1
+
+    catalog = Module_Catalog(options.workspace)
+    catalog.refresh()
+    targets = [module_path for module_path, _, _ in catalog.query(options.internal_id)]
+    catalog.close()
+    return run_parallel(bump_target, targets, (options.internal_id, str(version), options.trace is not None, options.dry_run, options.writer), options.jobs, options.trace)
+
+def run_parallel(function, targets: list[Path], arguments: tuple, jobs: int | None, trace_path: Path | None = None) -> int:
+    """Runs `function` on every target in a process pool, reporting the timing and exit code of each, and returns the overall exit code.
+
+    The function is called with the target and `arguments`, and must return the action, exit code, duration, message, and trace events.
+    The trace events of every target are written to `trace_path` if it is given."""
+    print_lines(
+        f' Module Manager - By Dominexis - {MODULE_MANAGER_VERSION}',
+        ''
+    )
+    exit_code = 0
+    failures = 0
+    events: list[dict[str, str | int | float | dict[str, str | int]]] = []
+    start = perf_counter()
+    with ProcessPoolExecutor(jobs) as executor:
+        futures = {
+            executor.submit(function, str(target), *arguments): target
+            for target in targets
+        }
+        for future in as_completed(futures):
+            action, code, duration, message, target_events = future.result()
+            events.extend(target_events)
+            print(f' [{code}] {duration:8.3f}s {action:6} {futures[future]}')
+            print(message, end="")
+            if code:
+                failures += 1
+            exit_code = max(exit_code, code)
+
+    print_lines(
+        '',
+        f' {len(futures) - failures} succeeded, {failures} failed in {perf_counter() - start:.3f}s'
+    )
+    if trace_path:
+        with trace_path.open("w", encoding="utf-8", newline="\n") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        print(f' Trace written to {trace_path.as_posix()}')
+    return exit_code
+
+def run_catalog(options: argparse.Namespace) -> int:
+    """Refreshes the module catalog of a workspace and prints the modules which match the query."""
+    # Parse query
+    versions: dict[str, Version | None] = {"--below": None, "--at-least": None}
+    for key, value in [("--below", options.below), ("--at-least", options.at_least)]:
+        if value is None:
+            continue
+        versions[key] = Version(0, 0, 0)
+        error_message = versions[key].assign(value, key)
+        if error_message:
+            print(error_message, end="")
+            return 1
+    features: dict[str, bool | int | str] = {}
+    for feature in options.feature:
+        name, _, value = feature.partition("=")
+        try:
+            features[name] = json.loads(value) if value else True
+        except json.JSONDecodeError:
+            features[name] = value
+
+    # Query catalog
+    catalog = Module_Catalog(options.workspace)
+    catalog.refresh()
+    results = catalog.query(options.depends_on, versions["--below"], versions["--at-least"], features)
+    catalog.close()
+    for module_path, internal_id, version in results:
+        print(f' {internal_id} {version}: {module_path.name}')
+    print(f' {len(results)} module{"" if len(results) == 1 else "s"}')
+    return 0
+
+def run_resolve(options: argparse.Namespace) -> int:
+    """Reads every module in a workspace and reports the problems with their dependencies, along with the order they load in."""
+    start = perf_counter()
+    graph = Dependency_Graph(options.workspace)
+    order = graph.resolve()
+    print_lines(
+        f' Module Manager - By Dominexis - {MODULE_MANAGER_VERSION}',
+        '',
+        f' Load order: {", ".join(order)}'
+    )
+    print(graph.message, end="")
+    print_lines(
+        '',
+        f' {len(graph.modules)} module{"" if len(graph.modules) == 1 else "s"}, {graph.message.count(" ERROR:")} problem{"" if graph.message.count(" ERROR:") == 1 else "s"} in {perf_counter() - start:.3f}s'
+    )
+    return 1 if " ERROR:" in graph.message else 0
+
+def run_benchmark(options: argparse.Namespace) -> int:
+    """Times module creation, updates, discovery, and settings conversion on a made-up workspace in a temporary folder,
+    then writes the results to a JSON file which later runs can be compared with.
+
+    Everything runs in this process, one module at a time, so that the timings don't depend on the number of cores."""
+    # Read earlier results
+    previous: dict[str, dict[str, float]] = {}
+    if options.compare:
+        try:
+            with options.compare.open("r", encoding="utf-8") as file:
+                previous = json.load(file)["results"]
+            if not isinstance(previous, dict) or not all(isinstance(result, dict) and isinstance(result.get("minimum"), (int, float)) for result in previous.values()):
+                raise TypeError
+        except OSError:
+            print(f" ERROR: {options.compare.as_posix()} couldn't be read!")
+            return 1
+        except (json.JSONDecodeError, UnicodeDecodeError, TypeError, KeyError):
+            print(f" ERROR: {options.compare.as_posix()} is not properly formatted!")
+            return 1
+
+    settings_list = synthetic_settings(options.modules, options.dependencies, options.features, options.seed)
+    timings: dict[str, list[float]] = {"create": [], "update": [], "discovery": [], "catalog": [], "import_export": [], "records": []}
+
+    for i in range(options.repeat):
+        with tempfile.TemporaryDirectory() as folder:
+            workspace = Path(folder) / "workspace"
+            workspace.mkdir()
+
+            # Create modules
+            start = perf_counter()
+            for settings_json in settings_list:
+                program = Program(False, workspace)
+                program.import_settings(settings_json)
+                program.build_module(program.get_module_path())
+                if " ERROR:" in program.message:
+                    print(program.message, end="")
+                    return 1
+            timings["create"].append(perf_counter() - start)
+
+            # Find modules
+            start = perf_counter()
+            module_paths = [module_path for module_path in sorted(workspace.iterdir()) if is_module(module_path)]
+            timings["discovery"].append(perf_counter() - start)
+
+            # Update modules
+            start = perf_counter()
+            for module_path in module_paths:
+                program = Program(False, workspace)
+                settings_json, _ = program.open_module_info(module_path)
+                program.import_settings(settings_json)
+                if program.update_module(module_path):
+                    print(program.message, end="")
+                    return 1
+            timings["update"].append(perf_counter() - start)
+
+            # Read modules into a new catalog
+            start = perf_counter()
+            catalog = Module_Catalog(workspace, Path(folder) / CATALOG_FILE_NAME)
+            catalog.refresh()
+            catalog.close()
+            timings["catalog"].append(perf_counter() - start)
+
+        # Import and export settings
+        start = perf_counter()
+        for settings_json in settings_list:
+            program = Program(False)
+            program.import_settings(settings_json)
+            program.export_settings()
+        timings["import_export"].append(perf_counter() - start)
+
+        # Convert settings to and from records
+        start = perf_counter()
+        for settings_json in settings_list:
+            Module_Record.from_json(settings_json)[0].to_json()
+        timings["records"].append(perf_counter() - start)
+
+    # Summarize results
+    results = {
+        "module_manager_version": MODULE_MANAGER_VERSION,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "modules": options.modules,
+            "dependencies": options.dependencies,
+            "features": options.features,
+            "repeat": options.repeat,
+            "seed": options.seed
+        },
+        "results": {
+            name: {
+                "minimum": min(durations),
+                "median": statistics.median(durations),
+                "per_module": min(durations)/max(options.modules, 1)
+            }
+            for name, durations in timings.items()
+        }
+    }
+    print_lines(
+        f' Module Manager - By Dominexis - {MODULE_MANAGER_VERSION}',
+        '',
+        f' {options.modules} modules, {options.dependencies} dependencies each, {options.repeat} runs',
+        ''
+    )
+    for name, result in results["results"].items():
+        comparison = ""
+        if name in previous and previous[name]["minimum"] > 0:
+            comparison = f'  {result["minimum"]/previous[name]["minimum"]:6.2f}x'
+        print(f' {name:14} {result["minimum"]:8.3f}s  {result["per_module"]*1000:8.3f}ms per module{comparison}')
+
+    with options.output.open("w", encoding="utf-8", newline="\n") as file:
+        json.dump(results, file, indent=4)
+        file.write("\n")
+    print_lines('', f' Results written to {options.output.as_posix()}')
+    return 0
+
+def run_validate(options: argparse.Namespace) -> int:
+    """Checks every settings file and module among the targets in a process pool, and reports the invalid ones.
+
+    Folders which aren't modules are searched for the modules and JSON files directly inside them.
+    Targets are sent to the workers in batches, since each one only takes a fraction of a millisecond to check."""
+    start = perf_counter()
+    targets: list[str] = []
+    for target in options.targets:
+        if target.is_dir() and not is_module(target):
+            targets.extend(str(path) for path in sorted(target.iterdir()) if is_module(path) or (path.suffix == ".json" and path.is_file()))
+        else:
+            targets.append(str(target))
+
+    jobs = options.jobs or os.cpu_count() or 1
+    batch_size = max(1, min(256, len(targets)//(jobs*4)))
+    batches = [targets[i:i + batch_size] for i in range(0, len(targets), batch_size)]
+    with ProcessPoolExecutor(jobs) as executor:
+        report = [entry for batch in executor.map(validate_targets, batches) for entry in batch]
+
+    print_lines(
+        f' Module Manager - By Dominexis - {MODULE_MANAGER_VERSION}',
+        ''
+    )
+    invalid = [entry for entry in report if entry["errors"]]
+    for entry in invalid:
+        print(f' {entry["target"]}')
+        for error in entry["errors"]:
+            print(f'   {error["field"] or "(file)"}: {error["error"]}')
+    error_count = sum(len(entry["errors"]) for entry in invalid)
+    print_lines(
+        '',
+        f' {len(report)} checked, {len(invalid)} invalid, {error_count} error{"" if error_count == 1 else "s"} in {perf_counter() - start:.3f}s'
+    )
+
+    if options.report:
+        with options.report.open("w", encoding="utf-8", newline="\n") as file:
+            json.dump(report, file, indent=4)
+            file.write("\n")
+    return 1 if invalid else 0
+
+def validate_targets(targets: list[str]) -> list[dict[str, str | list[dict[str, str]]]]:
+    """Checks a batch of settings files and modules. This runs inside a worker process.
+
+    Returns the target and its errors for each one."""
+    report: list[dict[str, str | list[dict[str, str]]]] = []
+    for target in targets:
+        target_path = Path(target)
+        if target_path.is_dir() or is_zip_module(target_path):
+            settings_json, error_message = read_module_info(target_path)
+        else:
+            settings_json, error_message = {}, ""
+            try:
+                with target_path.open("r", encoding="utf-8") as file:
+                    settings_json = json.load(file)
+            except (FileNotFoundError, IsADirectoryError):
+                error_message = f" ERROR: {target_path.as_posix()} doesn't exist!\n"
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                error_message = f" ERROR: {target_path.as_posix()} is not properly formatted!\n"
+        if error_message:
+            errors = [{"field": "", "error": error_message.strip().removeprefix("ERROR: ")}]
+        else:
+            errors = validate_settings(settings_json)
+        report.append({"target": target, "errors": errors})
+    return report
+
+def run_watch(options: argparse.Namespace) -> int:
+    """Polls the settings of every target, and regenerates the stages whose settings changed until interrupted."""
+    print_lines(
+        f' Module Manager - By Dominexis - {MODULE_MANAGER_VERSION}',
+        '',
+        ' Watching for changes, press Ctrl+C to stop',
+        ''
+    )
+    targets = [Watch_Target(target) for target in options.targets]
+    try:
+        while True:
+            for target in targets:
+                if not target.changed():
+                    continue
+                start = perf_counter()
+                try:
+                    message = target.sync(options.workspace)
+                except Exception as exception:
+                    message = f" ERROR: {type(exception).__name__}: {exception}\n"
+                if message:
+                    print(f' {datetime.now():%H:%M:%S} {perf_counter() - start:8.3f}s {target.target.name}')
+                    print(message, end="", flush=True)
+            sleep(options.interval)
+    except KeyboardInterrupt:
+        return 0
+
+def run_cache(options: argparse.Namespace) -> int:
+    """Prints the size and hit rate of the generation cache, or removes every entry from it."""
+    cache = Generation_Cache()
+    if options.action == "clear":
+        cache.clear()
+        cache.close()
+        print(' Generation cache cleared')
+        return 0
+
+    counters = cache.statistics()
+    cache.close()
+    lookups = counters["hits"] + counters["misses"]
+    print_lines(
+        f' Module Manager - By Dominexis - {MODULE_MANAGER_VERSION}',
+        '',
+        f' Entries: {counters["entries"]}',
+        f' Size: {counters["size"]/1024/1024:.2f} MiB of {CACHE_SIZE_LIMIT/1024/1024:.2f} MiB',
+        f' Hits: {counters["hits"]}',
+        f' Misses: {counters["misses"]}',
+        f' Hit rate: {counters["hits"]/lookups*100 if lookups else 0:.1f}%',
+        f' Evictions: {counters["evictions"]}'
+    )
+    return 0
+
+def run_deploy(options: argparse.Namespace) -> int:
+    """Copies the newest version of every module in the workspace into the `datapacks` folder of each world in a process pool."""
+    # Pick newest version of each module
+    newest: dict[str, tuple[Path, tuple[int, int, int]]] = {}
+    for module_path, internal_id, version in find_modules(options.workspace):
+        if options.module and internal_id not in options.module:
+            continue
+        if internal_id not in newest or version > newest[internal_id][1]:
+            newest[internal_id] = module_path, version
+    missing = [internal_id for internal_id in options.module if internal_id not in newest]
+    if missing:
+        for internal_id in missing:
+            print(f' ERROR: No module with the internal ID "{internal_id}" is in {options.workspace.as_posix()}!')
+        return 1
+
+    modules = [(str(module_path), internal_id) for internal_id, (module_path, _) in sorted(newest.items())]
+    return run_parallel(deploy_target, options.worlds, (str(options.workspace), modules, options.dry_run), options.jobs)
+
+def run_minify(options: argparse.Namespace) -> int:
+    """Minifies every file of the target modules in a process pool, including the functions written by the user."""
+    return run_parallel(minify_target, options.targets, (), options.jobs)
+
+def run_lint(options: argparse.Namespace) -> int:
+    """Lints the functions of each target module, and prints the highest scoring commands along with where they are run from."""
+    print_lines(
+        f' Module Manager - By Dominexis - {MODULE_MANAGER_VERSION}',
+        ''
+    )
+    exit_code = 0
+    for target in options.targets:
+        start = perf_counter()
+        if not is_module(target):
+            print(f' ERROR: {target.as_posix()} is not a module!')
+            exit_code = 1
+            continue
+        linter = Module_Linter(target, options.jobs)
+        findings, reachable = linter.lint()
+        print(f' {target.name}: {len(linter.functions)} functions, {reachable} run every tick, {len(findings)} finding{"" if len(findings) == 1 else "s"} in {perf_counter() - start:.3f}s')
+        for score, function_id, line_number, command, rules, entry_point, depth in findings[:options.top]:
+            print_lines(
+                f' {score:8} {function_id}:{line_number} {", ".join(rules)} (from #nexus:{entry_point}, depth {depth})',
+                f'          {command if len(command) <= 100 else command[:97] + "..."}'
+            )
+        print()
+    return exit_code
+
+def run_bundle(options: argparse.Namespace) -> int:
+    """Merges the target modules into one data pack, replacing their verify functions with a single dispatcher."""
+    start = perf_counter()
+    print_lines(
+        f' Module Manager - By Dominexis - {MODULE_MANAGER_VERSION}',
+        ''
+    )
+    error_message = Internal.check(options.namespace, "namespace")
+    if error_message:
+        print(error_message, end="")
+        return 1
+    output_path = zip_file_path(options.output) if options.zip else options.output
+    if output_path.exists() and not options.overwrite:
+        print(f' ERROR: {output_path.as_posix()} already exists! Use --overwrite to replace it.')
+        return 1
+
+    # Merge modules
+    bundle = Module_Bundle(options.targets)
+    if options.namespace in [namespace for _, namespace in bundle.modules]:
+        bundle.message += f" ERROR: The namespace {options.namespace} is already used by a module in the bundle!\n"
+    fused = bundle.fuse(options.namespace)
+    print(bundle.message, end="")
+    if " ERROR:" in bundle.message:
+        return 1
+
+    # Write bundle
+    plan = bundle.plan(options.output)
+    if options.zip:
+        plan.flush_zip(output_path)
+    else:
+        plan.flush()
+    print_lines(
+        f' {len(bundle.modules)} module{"" if len(bundle.modules) == 1 else "s"} bundled into {output_path.as_posix()}, {fused} verify function{"" if fused == 1 else "s"} replaced by the dispatcher in {perf_counter() - start:.3f}s'
+    )
+    return 0
+
+def build_target(target: str, workspace: str, overwrite: bool, output_zip: bool, trace: bool, dry_run: bool = False, use_cache: bool = False, writer: str = "serial", prune_empty_hooks: bool = False, release: bool = False) -> tuple[str, int, float, str, list[dict]]:
+    """Creates or updates a single module without user input. This runs inside a worker process.
+
+    A settings file in the format of `Module Manager Input.json` creates a module in `workspace`,
+    while a module folder or zip file is updated. In a dry run, the changes are listed instead of written.
+    Created modules are taken from the generation cache if `use_cache` is enabled, and files are written with the `writer` backend.
+    If `prune_empty_hooks` is enabled, hook functions without commands are left out of the Nexus tags,
+    and if `release` is enabled, the generated files are minified.
+    Returns the action, exit code, duration, message, and trace events."""
+    start = perf_counter()
+    target_path = Path(target)
+    action = "update" if target_path.is_dir() or is_zip_module(target_path) else "create"
+    program = Program(False, Path(workspace))
+    program.output_zip = output_zip
+    program.dry_run = dry_run
+    program.writer = WRITER_BACKENDS[writer]()
+    program.prune_empty_hooks = prune_empty_hooks
+    program.release = release
+    program.trace = Build_Trace() if trace else None
+    events = program.trace.events if program.trace else []
+
+    try:
+        # Import settings
+        if action == "update":
+            settings_json, error = program.open_module_info(target_path)
+        else:
+            settings_json, error = program.open_json(target_path)
+        if error:
+            return action, 1, perf_counter() - start, program.message, events
+        program.import_settings(settings_json)
+        if " ERROR:" in program.message:
+            return action, 1, perf_counter() - start, program.message, events
+
+        # Update module
+        if action == "update":
+            if program.update_module(target_path):
+                return action, 1, perf_counter() - start, program.message, events
+            return action, 0, perf_counter() - start, program.message + (" Nothing written\n" if dry_run else " Module updated\n"), events
+
+        # Create module
+        module_path = program.get_module_path()
+        output_path = zip_file_path(module_path) if output_zip else module_path
+        if output_path.exists() and not overwrite:
+            program.message += f" ERROR: {output_path.as_posix()} already exists! Use --overwrite to replace it.\n"
+            return action, 1, perf_counter() - start, program.message, events
+        if use_cache and not dry_run:
+            program.cache = Generation_Cache()
+        program.build_module(module_path)
+        if program.cache:
+            program.cache.close()
+        return action, 0, perf_counter() - start, program.message + (" Nothing written\n" if dry_run else " Module created\n"), events
+
+    except Exception as exception:
+        return action, 1, perf_counter() - start, program.message + f" ERROR: {type(exception).__name__}: {exception}\n", events
+
+def bump_target(target: str, internal_id: str, version: str, trace: bool, dry_run: bool = False, writer: str = "serial") -> tuple[str, int, float, str, list[dict]]:
+    """Changes the version of a dependency in a single module and regenerates `pack.mcmeta`, `module_info.json`,
+    and the verification functions, leaving every other file alone. This runs inside a worker process.
+
+    In a dry run, the changes are listed instead of written, otherwise files are written with the `writer` backend. Returns the action, exit code, duration, message, and trace events."""
+    start = perf_counter()
+    action = "bump"
+    target_path = Path(target)
+    program = Program(False, target_path.parent)
+    program.dry_run = dry_run
+    program.writer = WRITER_BACKENDS[writer]()
+    program.trace = Build_Trace() if trace else None
+    events = program.trace.events if program.trace else []
+
+    try:
+        # Import settings
+        settings_json, error = program.open_module_info(target_path)
+        if error:
+            return action, 1, perf_counter() - start, program.message, events
+        program.import_settings(settings_json)
+        if " ERROR:" in program.message:
+            return action, 1, perf_counter() - start, program.message, events
+
+        # Change dependency version
+        for dependency in program.settings[Setting_Category.DEPENDENCIES.value]:
+            if dependency[Module_Setting.INTERNAL_ID.value].value == internal_id:
+                dependency[Module_Setting.VERSION.value].assign(version, Module_Setting.VERSION.value)
+
+        # Update module
+        if program.update_module(target_path, {Build_Stage.PACK_MCMETA, Build_Stage.MODULE_INFO_JSON, Build_Stage.VERIFICATION_FUNCTIONS}):
+            return action, 1, perf_counter() - start, program.message, events
+        return action, 0, perf_counter() - start, program.message + (" Nothing written\n" if dry_run else " Module updated\n"), events
+
+    except Exception as exception:
+        return action, 1, perf_counter() - start, program.message + f" ERROR: {type(exception).__name__}: {exception}\n", events
+
+def deploy_target(target: str, workspace: str, modules: list[tuple[str, str]], dry_run: bool) -> tuple[str, int, float, str, list[dict]]:
+    """Copies modules into the `datapacks` folder of a single world, only copying the files which changed.
+    Any other copy of a deployed module, found by its internal ID, is removed, since it would fail the multiple copies check.
+    This runs inside a worker process.
+
+    `modules` holds the path and internal ID of each module. Returns the action, exit code, duration, message, and trace events."""
+    start = perf_counter()
+    action = "deploy"
+    message = ""
+    datapacks = datapacks_path(Path(target))
+    if datapacks is None:
+        return action, 1, perf_counter() - start, f" ERROR: {Path(target).as_posix()} is not a world or datapacks folder!\n", []
+    if datapacks.resolve() == Path(workspace).resolve():
+        return action, 1, perf_counter() - start, f" ERROR: {datapacks.as_posix()} is the workspace!\n", []
+
+    try:
+        if not dry_run:
+            datapacks.mkdir(exist_ok=True)
+        installed = find_modules(datapacks) if datapacks.is_dir() else []
+        copied = 0
+        unchanged = 0
+        removed = 0
+        for source, internal_id in modules:
+            source_path = Path(source)
+            module_path = datapacks / source_path.name
+
+            # Remove other copies
+            for installed_path, installed_id, _ in installed:
+                if installed_id == internal_id and installed_path != module_path:
+                    message += f" Removed {installed_path.name}, another copy of {internal_id}\n"
+                    if not dry_run:
+                        remove_path(installed_path)
+
+            # Copy changed files
+            module_copied, module_unchanged, module_removed = sync_module(source_path, module_path, dry_run)
+            if module_copied or module_removed:
+                message += f" {module_path.name}: {module_copied} copied, {module_removed} removed\n"
+            copied += module_copied
+            unchanged += module_unchanged
+            removed += module_removed
+
+        message += f" {copied} file{'' if copied == 1 else 's'} copied, {unchanged} unchanged, {removed} removed{' (dry run, nothing changed)' if dry_run else ''}\n"
+        return action, 0, perf_counter() - start, message, []
+
+    except Exception as exception:
+        return action, 1, perf_counter() - start, message + f" ERROR: {type(exception).__name__}: {exception}\n", []
+
+
+def minify_target(target: str) -> tuple[str, int, float, str, list[dict]]:
+    """Minifies every file of a single module with `minify_file()`, writing only the files which change. This runs inside a worker process.
+
+    Returns the action, exit code, duration, message, and trace events."""
+    start = perf_counter()
+    action = "minify"
+    target_path = Path(target)
+    if not is_module(target_path):
+        return action, 1, perf_counter() - start, f" ERROR: {target_path.as_posix()} is not a module!\n", []
+
+    try:
+        plan = Build_Plan(target_path, True)
+        before = 0
+        for file_path, contents in plan.read_existing().items():
+            plan.add(file_path, minify_file(file_path, contents))
+            before += len(contents)
+        written, skipped, _ = plan.flush_zip(target_path) if is_zip_module(target_path) else plan.flush()
+        after = sum(map(len, plan.files.values()))
+        return action, 0, perf_counter() - start, f" {written} file{'' if written == 1 else 's'} minified, {skipped} unchanged, {before - after} bytes saved\n", []
+
+    except Exception as exception:
+        return action, 1, perf_counter() - start, f" ERROR: {type(exception).__name__}: {exception}\n", []
+
+
+
 # Run program
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_command_line(sys.argv[1:]))
     Program()
\ No newline at end of file
@@ -0,0 +1,942 @@
+import copy
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+import zipfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import mock
+
+
+
+# Load program
+
+PROGRAM_PATH = Path(__file__).parent.parent / "Module Manager - By Dominexis - 2.0.2.py"
+INPUT_PATH = Path(__file__).parent.parent / "Module Manager Input.json"
+
+spec = importlib.util.spec_from_file_location("module_manager", PROGRAM_PATH)
+mm = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = mm
+spec.loader.exec_module(mm)
+
+
+
+# Test helpers
+
+class Workspace_Test(unittest.TestCase):
+    """Base class of tests which build modules in a temporary workspace."""
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.workspace = Path(self.folder.name)
+        self.settings = json.loads(INPUT_PATH.read_text(encoding="utf-8"))
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def build(self, target: Path, output_zip: bool = False, **options) -> str:
+        _, code, _, message, _ = mm.build_target(str(target), str(self.workspace), False, output_zip, False, **options)
+        self.assertEqual(code, 0, message)
+        return message
+
+    def create(self, settings: dict | None = None, output_zip: bool = False, **options) -> Path:
+        settings_path = self.workspace / "settings.json"
+        settings_path.write_text(json.dumps(settings or self.settings), encoding="utf-8")
+        modules = set(path for path in self.workspace.iterdir() if mm.is_module(path))
+        self.build(settings_path, output_zip, **options)
+        return next(path for path in self.workspace.iterdir() if mm.is_module(path) and path not in modules)
+
+    def edit_module_info(self, module_path: Path, category: str, value):
+        file_path = module_path / "module_info.json"
+        settings_json = json.loads(file_path.read_text(encoding="utf-8"))
+        settings_json[category] = value
+        file_path.write_text(json.dumps(settings_json, indent=4), encoding="utf-8")
+
+    def read_tag(self, module_path: Path, name: str) -> list[str]:
+        return json.loads((module_path / "data" / "nexus" / "tags" / "functions" / f"{name}.json").read_text(encoding="utf-8"))["values"]
+
+    def run_command(self, *arguments: str) -> tuple[int, str]:
+        """Runs the command line with the given arguments, and returns the exit code and everything printed."""
+        output = io.StringIO()
+        with redirect_stdout(output), redirect_stderr(output):
+            try:
+                code = mm.run_command_line(list(arguments))
+            except SystemExit as exception:
+                code = exception.code
+        return code, output.getvalue()
+
+
+
+# Build command tests
+
+class Build_Command_Test(Workspace_Test):
+    def test_create_and_update(self):
+        module_path = self.create()
+        self.assertTrue((module_path / "pack.mcmeta").is_file())
+        self.assertTrue((module_path / "module_info.json").is_file())
+        action, code, _, message, _ = mm.build_target(str(module_path), str(self.workspace), False, False, False)
+        self.assertEqual((action, code), ("update", 0), message)
+
+    def test_invalid_target_fails(self):
+        action, code, _, _, _ = mm.build_target(str(self.workspace / "missing.json"), str(self.workspace), False, False, False)
+        self.assertEqual((action, code), ("create", 1))
+
+    def test_job_count_must_be_positive(self):
+        for jobs in ["0", "-1"]:
+            code, output = self.run_command("build", "--jobs", jobs, "--workspace", str(self.workspace), str(INPUT_PATH))
+            self.assertEqual(code, 2)
+            self.assertIn("must be at least 1", output)
+
+
+
+# Build plan tests
+
+class Build_Plan_Test(Workspace_Test):
+    def test_flush_writes_planned_files(self):
+        module_path = self.workspace / "module"
+        plan = mm.Build_Plan(module_path)
+        plan.add(module_path / "pack.mcmeta", b"{}")
+        plan.add(module_path / "data" / "a" / "functions" / "b" / "c.mcfunction", b"say hi")
+        written, _, _ = plan.flush()
+        self.assertEqual(written, 2)
+        self.assertEqual((module_path / "data" / "a" / "functions" / "b" / "c.mcfunction").read_bytes(), b"say hi")
+
+    def test_later_entry_replaces_earlier_one(self):
+        module_path = self.workspace / "module"
+        plan = mm.Build_Plan(module_path)
+        plan.add(module_path / "a.mcfunction", b"first")
+        plan.add(module_path / "a.mcfunction", b"second")
+        plan.flush()
+        self.assertEqual((module_path / "a.mcfunction").read_bytes(), b"second")
+
+    def test_stale_files(self):
+        module_path = Path("module")
+        plan = mm.Build_Plan(module_path, True)
+        existing = {
+            module_path / "data" / "a" / "functions" / "dispatch" / "1_4.mcfunction": b"",
+            module_path / "data" / "a" / "functions" / "dispatch" / "5_8.mcfunction": b"",
+            module_path / "data" / "a" / "functions" / "old.mcfunction": b"",
+            module_path / "data" / "a" / "functions" / "kept.mcfunction": b""
+        }
+        plan.remove_stale(module_path / "data" / "a" / "functions" / "dispatch")
+        plan.add(module_path / "data" / "a" / "functions" / "dispatch" / "1_4.mcfunction", b"")
+        plan.remove(module_path / "data" / "a" / "functions" / "old.mcfunction")
+        plan.remove(module_path / "data" / "a" / "functions" / "missing.mcfunction")
+        self.assertEqual(
+            sorted(plan.stale_files(existing)),
+            [
+                module_path / "data" / "a" / "functions" / "dispatch" / "5_8.mcfunction",
+                module_path / "data" / "a" / "functions" / "old.mcfunction"
+            ]
+        )
+
+
+
+# Incremental update tests
+
+class Incremental_Update_Test(Workspace_Test):
+    def test_unchanged_module_writes_nothing(self):
+        module_path = self.create()
+        last_modified = next(module_path.rglob("last_modified.mcfunction")).read_bytes()
+        self.assertIn(" 0 files written", self.build(module_path))
+        self.assertEqual(next(module_path.rglob("last_modified.mcfunction")).read_bytes(), last_modified)
+
+    def test_missing_file_is_written_again(self):
+        module_path = self.create()
+        (module_path / "pack.mcmeta").unlink()
+        self.assertIn(" 1 file written", self.build(module_path))
+        self.assertTrue((module_path / "pack.mcmeta").is_file())
+
+
+
+# Zip output tests
+
+class Zip_Output_Test(Workspace_Test):
+    def test_create_zip(self):
+        module_path = self.create(output_zip=True)
+        self.assertEqual(module_path.suffix, ".zip")
+        with zipfile.ZipFile(module_path) as archive:
+            names = archive.namelist()
+            self.assertEqual(names, sorted(names))
+            self.assertIn("pack.mcmeta", names)
+            self.assertIn("module_info.json", names)
+            self.assertTrue(all(info.date_time == mm.ZIP_DATE_TIME for info in archive.infolist()))
+
+    def test_unchanged_zip_is_left_alone(self):
+        module_path = self.create(output_zip=True)
+        contents = module_path.read_bytes()
+        self.assertIn(" 0 files written", self.build(module_path))
+        self.assertEqual(module_path.read_bytes(), contents)
+
+    def test_folder_module_written_as_zip(self):
+        module_path = self.create()
+        self.build(module_path, output_zip=True)
+        with zipfile.ZipFile(mm.zip_file_path(module_path)) as archive:
+            self.assertEqual(
+                sorted(archive.namelist()),
+                sorted(file_path.relative_to(module_path).as_posix() for file_path in module_path.rglob("*") if file_path.is_file())
+            )
+
+
+
+# Staged build tests
+
+class Staged_Build_Test(Workspace_Test):
+    def test_overwrite_replaces_module(self):
+        module_path = self.create()
+        (module_path / "data" / "junk.txt").write_text("junk", encoding="utf-8")
+        _, code, _, message, _ = mm.build_target(str(self.workspace / "settings.json"), str(self.workspace), True, False, False)
+        self.assertEqual(code, 0, message)
+        for thread in threading.enumerate():
+            if thread is not threading.current_thread():
+                thread.join()
+        self.assertFalse((module_path / "data" / "junk.txt").exists())
+        self.assertTrue((module_path / "pack.mcmeta").is_file())
+        self.assertEqual([path.name for path in self.workspace.iterdir() if path.name.startswith(".")], [])
+
+
+
+# Catalog tests
+
+class Catalog_Test(Workspace_Test):
+    def create_dependent(self, module_name: str, version: dict[str, int]) -> Path:
+        settings = copy.deepcopy(self.settings)
+        settings["module_info"].update(module_name=module_name, internal_id=module_name.lower(), namespace=module_name.lower())
+        settings["dependencies"][0]["version"] = version
+        return self.create(settings)
+
+    def test_refresh_and_query(self):
+        self.create_dependent("Old", {"major": 1, "minor": 0, "patch": 0})
+        self.create_dependent("New", {"major": 2, "minor": 0, "patch": 0})
+        catalog = mm.Module_Catalog(self.workspace)
+        self.assertEqual(catalog.refresh(), (2, 0))
+        self.assertEqual(catalog.refresh(), (0, 0))
+        results = catalog.query("doms_nexus", mm.Version(2, 0, 0), None, {})
+        self.assertEqual([internal_id for _, internal_id, _ in results], ["old"])
+        catalog.close()
+
+    def test_settings_with_relative_path(self):
+        module_path = self.create()
+        catalog = mm.Module_Catalog(self.workspace)
+        catalog.refresh()
+        settings_json, error_message = catalog.settings(Path(os.path.relpath(module_path)))
+        self.assertEqual(error_message, "")
+        self.assertEqual(settings_json["module_info"]["internal_id"], "blank_module")
+        _, error_message = catalog.settings(self.workspace / "missing")
+        self.assertIn(" ERROR:", error_message)
+        catalog.close()
+
+    def test_version_filters_need_dependency(self):
+        code, output = self.run_command("catalog", "--workspace", str(self.workspace), "--below", "2.0.0")
+        self.assertEqual(code, 2)
+        self.assertIn("--depends-on", output)
+
+
+
+# Bump command tests
+
+class Bump_Command_Test(Workspace_Test):
+    def test_bump_dependency(self):
+        module_path = self.create()
+        settings = copy.deepcopy(self.settings)
+        settings["module_info"].update(module_name="Other", internal_id="other", namespace="other")
+        settings["dependencies"] = []
+        other_path = self.create(settings)
+        other_info = (other_path / "module_info.json").read_bytes()
+        (module_path / "data" / "blank" / "functions" / "custom.mcfunction").write_text("say kept", encoding="utf-8")
+
+        code, output = self.run_command("bump", "--workspace", str(self.workspace), "--jobs", "1", "doms_nexus", "2.1.0")
+        self.assertEqual(code, 0, output)
+        settings_json, _ = mm.read_module_info(module_path)
+        self.assertEqual(settings_json["dependencies"][0]["version"], {"major": 2, "minor": 1, "patch": 0})
+        check = next((module_path / "data" / "blank" / "functions" / "verify").rglob("check.mcfunction")).read_text(encoding="utf-8")
+        self.assertIn("scoreboard players set #expected_minor nexus.value 1", check)
+        self.assertEqual((module_path / "data" / "blank" / "functions" / "custom.mcfunction").read_text(encoding="utf-8"), "say kept")
+        self.assertEqual((other_path / "module_info.json").read_bytes(), other_info)
+
+    def test_invalid_version(self):
+        code, output = self.run_command("bump", "--workspace", str(self.workspace), "doms_nexus", "2.x")
+        self.assertNotEqual(code, 0)
+        self.assertIn(" ERROR:", output)
+
+
+
+# Keyed verification tests
+
+class Keyed_Verification_Test(Workspace_Test):
+    def read_verify(self, module_path: Path, name: str) -> list[str]:
+        return (module_path / "data" / "blank" / "functions" / "verify" / "1_0_0" / f"{name}.mcfunction").read_text(encoding="utf-8").splitlines()
+
+    def test_keyed_module_reads_index(self):
+        settings = copy.deepcopy(self.settings)
+        settings["features"]["keyed_verification"] = True
+        settings["dependencies"].append({"module_name": "Other", "version": {"major": 1, "minor": 2, "patch": 0}, "internal_id": "other", "download_link": ""})
+        module_path = self.create(settings)
+        version = self.read_verify(module_path, "version")
+        self.assertIn('execute if score #index_time nexus.value = #time nexus.value store result score #module_count nexus.value run data get storage nexus:data module_index."blank_module".copies', version)
+        self.assertIn('execute store result storage nexus:data module_index."blank_module".copies int 1 run scoreboard players get #module_count nexus.value', version)
+        check = self.read_verify(module_path, "check")
+        self.assertIn('execute if score #index_time nexus.value = #time nexus.value run data modify storage nexus:data module_check set from storage nexus:data module_index."other"', check)
+        self.assertIn('execute store result score #module_count nexus.value run data get storage nexus:data module_index."blank_module".copies', check)
+        self.assertFalse(any('modules[{id:"blank_module"}]' in line for line in check))
+        self.assertFalse(any('modules[{id:"other"}]' in line and "module_check.copies" not in line for line in check))
+
+    def test_unkeyed_module_filters_list(self):
+        module_path = self.create()
+        self.assertFalse(any("module_index" in line for line in self.read_verify(module_path, "version")))
+        self.assertIn('execute store result score #module_count nexus.value if data storage nexus:data modules[{id:"blank_module"}]', self.read_verify(module_path, "check"))
+
+
+
+# Kind dispatch tests
+
+class Kind_Dispatch_Test(Workspace_Test):
+    def entity_function(self, module_path: Path, name: str) -> str:
+        return (module_path / "data" / "blank" / "functions" / "entity" / f"{name}.mcfunction").read_text(encoding="utf-8")
+
+    def test_dispatch_tree_covers_every_case(self):
+        for count in [1, 4, 5, 17]:
+            root, branches = mm.dispatch_tree(count, "if", lambda i: f"leaf {i}", lambda low, high: f"{low}_{high}")
+            leaves = [line for contents in [root, *branches.values()] for line in contents if "leaf" in line]
+            self.assertEqual(sorted(leaves), sorted(f"if {i} run leaf {i}" for i in range(1, count + 1)))
+            self.assertLessEqual(len(root), 2 if count > mm.DISPATCH_LEAF_SIZE else count)
+
+    def test_kinds_are_dispatched_from_main(self):
+        settings = copy.deepcopy(self.settings)
+        settings["entity_kinds"] = ["zombie_king", "ghost"]
+        module_path = self.create(settings)
+        main = self.entity_function(module_path, "main")
+        self.assertIn("execute if score @s blank.kind matches 2 run function blank:entity/kind/ghost", main)
+        self.assertIn("scoreboard players set @s blank.kind 1", self.entity_function(module_path, "dispatch/assign/zombie_king"))
+        self.assertIn("scoreboard objectives remove blank.kind", (module_path / "data" / "blank" / "functions" / "uninstall" / "main.mcfunction").read_text(encoding="utf-8"))
+
+        self.edit_module_info(module_path, "entity_kinds", ["zombie_king", "ghost", "wraith"])
+        self.build(module_path)
+        self.assertIn("function blank:entity/kind/wraith", self.entity_function(module_path, "main"))
+        self.assertFalse((module_path / "data" / "blank" / "functions" / "entity" / "dispatch" / "main.mcfunction").exists())
+
+    def test_minified_main_is_regenerated(self):
+        settings = copy.deepcopy(self.settings)
+        settings["entity_kinds"] = ["ghost"]
+        module_path = self.create(settings)
+        self.build(module_path, release=True)
+        self.edit_module_info(module_path, "entity_kinds", ["ghost", "wraith"])
+        self.build(module_path, release=True)
+        self.assertIn("function blank:entity/kind/wraith", self.entity_function(module_path, "main"))
+
+    def test_edited_main_is_kept(self):
+        settings = copy.deepcopy(self.settings)
+        settings["entity_kinds"] = ["ghost"]
+        module_path = self.create(settings)
+        main = self.entity_function(module_path, "main") + "\nsay custom"
+        (module_path / "data" / "blank" / "functions" / "entity" / "main.mcfunction").write_text(main, encoding="utf-8")
+        self.edit_module_info(module_path, "entity_kinds", ["ghost", "wraith"])
+        self.assertIn("entity/main.mcfunction was edited", self.build(module_path))
+        self.assertEqual(self.entity_function(module_path, "main"), main)
+        self.assertIn("function blank:entity/kind/wraith", self.entity_function(module_path, "dispatch/main"))
+
+    def test_no_kind_objective_without_kinds(self):
+        module_path = self.create()
+        self.assertNotIn(".kind", (module_path / "data" / "blank" / "functions" / "uninstall" / "main.mcfunction").read_text(encoding="utf-8"))
+
+
+
+# Resolve command tests
+
+class Resolve_Command_Test(Workspace_Test):
+    def create_version(self, version: dict[str, int], dependency_version: dict[str, int] | None = None, internal_id: str = "blank_module", name: str = "Blank Module") -> Path:
+        settings = copy.deepcopy(self.settings)
+        settings["module_info"].update(module_name=name, internal_id=internal_id, namespace=internal_id.split("_")[0], version=version)
+        if dependency_version:
+            settings["dependencies"] = [{"module_name": "Blank Module", "version": dependency_version, "internal_id": "blank_module", "download_link": ""}]
+        return self.create(settings)
+
+    def test_data_pack_name(self):
+        self.assertEqual(mm.data_pack_name("Dom's Nexus DP - By Dominexis - 2.0.0.zip"), "Dom's Nexus")
+        self.assertEqual(mm.data_pack_name("Dom's Nexus Extras"), "Dom's Nexus Extras")
+
+    def test_external_dependency_needs_exact_name(self):
+        self.create()
+        (self.workspace / "Dom's Nexus Extras").mkdir()
+        (self.workspace / "Dom's Nexus Extras" / "pack.mcmeta").write_text("{}", encoding="utf-8")
+        graph = mm.Dependency_Graph(self.workspace)
+        graph.resolve()
+        self.assertIn("doms_nexus 2.0.0 is missing", graph.message)
+
+        (self.workspace / "Dom's Nexus DP - By Dominexis - 2.0.0.zip").write_bytes(b"")
+        graph = mm.Dependency_Graph(self.workspace)
+        graph.resolve()
+        self.assertEqual(graph.message, "")
+
+    def test_older_versions_only_warn(self):
+        self.create_version({"major": 1, "minor": 0, "patch": 0})
+        self.create_version({"major": 1, "minor": 1, "patch": 0})
+        self.create_version({"major": 1, "minor": 0, "patch": 0}, {"major": 1, "minor": 1, "patch": 0}, "other_module", "Other Module")
+        (self.workspace / "Dom's Nexus DP - By Dominexis - 2.0.0").mkdir()
+        (self.workspace / "Dom's Nexus DP - By Dominexis - 2.0.0" / "pack.mcmeta").write_text("{}", encoding="utf-8")
+        code, output = self.run_command("resolve", "--workspace", str(self.workspace))
+        self.assertEqual(code, 0, output)
+        self.assertIn(" WARNING: Older versions of blank_module exist, only 1.1.0 is deployed", output)
+        self.assertIn(" Load order: blank_module, other_module", output)
+
+    def test_same_version_copies_are_errors(self):
+        module_path = self.create()
+        (self.workspace / "copy").mkdir()
+        for file_name in ["module_info.json", "pack.mcmeta"]:
+            (self.workspace / "copy" / file_name).write_bytes((module_path / file_name).read_bytes())
+        code, output = self.run_command("resolve", "--workspace", str(self.workspace))
+        self.assertEqual(code, 1)
+        self.assertIn(" ERROR: Multiple copies of blank_module 1.0.0 exist", output)
+
+
+
+# Benchmark command tests
+
+class Benchmark_Command_Test(Workspace_Test):
+    def benchmark(self, *arguments: str) -> tuple[int, str]:
+        return self.run_command("benchmark", "--modules", "2", "--repeat", "1", "--output", str(self.workspace / "results.json"), *arguments)
+
+    def test_compare_with_earlier_run(self):
+        code, output = self.benchmark()
+        self.assertEqual(code, 0, output)
+        results = json.loads((self.workspace / "results.json").read_text(encoding="utf-8"))
+        self.assertEqual(set(results["results"]), {"create", "update", "discovery", "catalog", "import_export", "records"})
+        code, output = self.benchmark("--compare", str(self.workspace / "results.json"))
+        self.assertEqual(code, 0, output)
+        self.assertIn("x\n", output)
+
+    def test_compare_with_missing_file(self):
+        code, output = self.benchmark("--compare", str(self.workspace / "missing.json"))
+        self.assertEqual(code, 1)
+        self.assertIn(" ERROR:", output)
+        self.assertFalse((self.workspace / "results.json").exists())
+
+    def test_compare_with_invalid_file(self):
+        (self.workspace / "invalid.json").write_text("{", encoding="utf-8")
+        code, output = self.benchmark("--compare", str(self.workspace / "invalid.json"))
+        self.assertEqual(code, 1)
+        self.assertIn("is not properly formatted", output)
+
+
+
+# Trace tests
+
+class Trace_Test(Workspace_Test):
+    def test_trace_records_stages(self):
+        trace_path = self.workspace / "trace.json"
+        code, output = self.run_command("build", "--workspace", str(self.workspace), "--jobs", "1", "--no-cache", "--trace", str(trace_path), str(INPUT_PATH))
+        self.assertEqual(code, 0, output)
+        events = json.loads(trace_path.read_text(encoding="utf-8"))["traceEvents"]
+        stages = {event["name"]: event for event in events if event["cat"] == "stage"}
+        self.assertIn("create_tags", stages)
+        self.assertGreater(stages["create_tags"]["args"]["files"], 0)
+        self.assertTrue(all(event["ph"] == "X" and event["dur"] >= 0 for event in events))
+        self.assertTrue(any(event["cat"] == "module" for event in events))
+
+
+
+# Text template tests
+
+class Text_Template_Test(unittest.TestCase):
+    def test_values_are_escaped(self):
+        template = mm.Text_Template('{{"text":"{name}","color":"gold"}}')
+        filled = template.fill(name='Dom\'s "Best" \\ Module')
+        self.assertEqual(json.loads(filled), {"text": 'Dom\'s "Best" \\ Module', "color": "gold"})
+
+    def test_raw_fields_are_inserted_as_they_are(self):
+        template = mm.Text_Template('["",{{"text":"{name}"}}{extra:raw}]')
+        filled = template.fill(name="A", extra=',{"text":"B"}')
+        self.assertEqual(json.loads(filled), ["", {"text": "A"}, {"text": "B"}])
+
+    def test_download_link_with_quote(self):
+        filled = mm.DOWNLOAD_TEMPLATE.fill(name="Module", color="gold", link='https://example.com/?a="b"')
+        self.assertEqual(json.loads(f"[{filled[1:]}]")[1]["clickEvent"]["value"], 'https://example.com/?a="b"')
+
+    def test_setting_values_are_filled(self):
+        filled = mm.UNINSTALLED_TEMPLATE.fill(module_name=mm.Path_Part("Blank Module"))
+        self.assertEqual(json.loads(filled)[2]["text"], "Blank Module")
+
+
+
+# Validate command tests
+
+class Validate_Command_Test(Workspace_Test):
+    def test_errors_are_aggregated(self):
+        settings = copy.deepcopy(self.settings)
+        settings["module_info"]["namespace"] = "Bad Namespace"
+        settings["features"]["time_manager"] = "yes"
+        settings["features"]["unknown_feature"] = True
+        settings["entity_kinds"] = ["ghost", "ghost"]
+        self.assertEqual(
+            sorted(error["field"] for error in mm.validate_settings(settings)),
+            ["entity_kinds[1]", "features.time_manager", "features.unknown_feature", "module_info.namespace"]
+        )
+
+    def test_non_string_kinds_are_rejected_everywhere(self):
+        settings = copy.deepcopy(self.settings)
+        settings["entity_kinds"] = [5]
+        self.assertEqual([error["field"] for error in mm.validate_settings(settings)], ["entity_kinds[0]"])
+        program = mm.Program(False)
+        program.import_settings(settings)
+        self.assertIn("entity_kinds: Input must be a string", program.message)
+        record, error_message = mm.Module_Record.from_json(settings)
+        self.assertIn("entity_kinds: Input must be a string", error_message)
+        self.assertEqual(record.entity_kinds, ())
+
+    def test_validate_command(self):
+        module_path = self.create()
+        invalid_path = self.workspace / "invalid.json"
+        invalid_path.write_text(json.dumps({"module_info": {"version": "1.0"}}), encoding="utf-8")
+        report_path = self.workspace / "report.json"
+        code, output = self.run_command("validate", "--jobs", "1", "--report", str(report_path), str(module_path), str(invalid_path))
+        self.assertEqual(code, 1, output)
+        self.assertIn(" 2 checked, 1 invalid, 1 error", output)
+        report = {entry["target"]: entry["errors"] for entry in json.loads(report_path.read_text(encoding="utf-8"))}
+        self.assertEqual(report[str(module_path)], [])
+        self.assertEqual([error["field"] for error in report[str(invalid_path)]], ["module_info.version"])
+
+
+
+# Module record tests
+
+class Module_Record_Test(unittest.TestCase):
+    def import_export(self, settings_json: dict) -> tuple[dict, str]:
+        program = mm.Program(False)
+        program.import_settings(settings_json)
+        return program.export_settings(), program.message
+
+    def test_records_match_imported_settings(self):
+        settings_list = mm.synthetic_settings(6, 3, 0.5, 0)
+        settings_list.append(json.loads(INPUT_PATH.read_text(encoding="utf-8")))
+        settings_list[-1]["entity_kinds"] = ["ghost", "wraith"]
+        for settings_json in settings_list:
+            record, error_message = mm.Module_Record.from_json(settings_json)
+            self.assertEqual(error_message, "")
+            self.assertEqual(record.to_json(), self.import_export(settings_json)[0])
+
+    def test_records_match_imported_errors(self):
+        settings_json = json.loads(INPUT_PATH.read_text(encoding="utf-8"))
+        settings_json["module_info"]["namespace"] = "Bad"
+        settings_json["features"]["maximum_entity_time"] = "long"
+        settings_json["object_kinds"] = ["box", "box", "Bad"]
+        record, error_message = mm.Module_Record.from_json(settings_json)
+        exported, program_message = self.import_export(settings_json)
+        self.assertEqual(error_message, program_message)
+        self.assertEqual(record.to_json()["object_kinds"], exported["object_kinds"])
+        self.assertEqual(record.to_json()["features"], exported["features"])
+
+
+
+# Watch tests
+
+class Watch_Test(Workspace_Test):
+    def test_changed_stages(self):
+        old_settings = mm.Module_Record.from_json(self.settings)[0].to_json()
+        self.assertEqual(mm.changed_stages(old_settings, copy.deepcopy(old_settings)), set())
+        new_settings = copy.deepcopy(old_settings)
+        new_settings["dependencies"][0]["version"]["minor"] = 1
+        self.assertEqual(mm.changed_stages(old_settings, new_settings), {mm.Build_Stage.PACK_MCMETA, mm.Build_Stage.VERIFICATION_FUNCTIONS, mm.Build_Stage.MODULE_INFO_JSON})
+        new_settings = copy.deepcopy(old_settings)
+        new_settings["object_kinds"] = ["box"]
+        self.assertEqual(mm.changed_stages(old_settings, new_settings), {mm.Build_Stage.OBJECT_FUNCTIONS, mm.Build_Stage.UPDATE_SETUP_FUNCTIONS, mm.Build_Stage.MODULE_INFO_JSON})
+        new_settings = copy.deepcopy(old_settings)
+        new_settings["module_info"]["download_link"] = "https://example.com"
+        self.assertTrue(mm.UPDATE_STAGES <= mm.changed_stages(old_settings, new_settings))
+
+    def test_sync_settings_file(self):
+        settings_path = self.workspace / "settings.json"
+        settings_path.write_text(json.dumps(self.settings), encoding="utf-8")
+        target = mm.Watch_Target(settings_path)
+        self.assertTrue(target.changed())
+        self.assertIn("Module created", target.sync(self.workspace))
+        self.assertFalse(target.changed())
+        self.assertEqual(target.sync(self.workspace), "")
+
+        self.settings["features"]["player_motion"] = True
+        settings_path.write_text(json.dumps(self.settings), encoding="utf-8")
+        os.utime(settings_path, ns=(0, 0))
+        self.assertTrue(target.changed())
+        message = target.sync(self.workspace)
+        self.assertIn("Updated", message)
+        self.assertNotIn("create_verification_functions", message)
+        module_path = next(path for path in self.workspace.iterdir() if mm.is_module(path))
+        self.assertTrue(json.loads((module_path / "module_info.json").read_text(encoding="utf-8"))["features"]["player_motion"])
+
+    def test_sync_module_edited_by_hand(self):
+        module_path = self.create()
+        target = mm.Watch_Target(module_path)
+        self.assertTrue(target.changed())
+        self.assertEqual(target.sync(self.workspace), "")
+        self.edit_module_info(module_path, "object_kinds", ["box"])
+        os.utime(module_path / "module_info.json", ns=(0, 0))
+        self.assertTrue(target.changed())
+        self.assertIn("create_object_functions", target.sync(self.workspace))
+        self.assertFalse(target.changed())
+
+
+
+# Dry run tests
+
+class Dry_Run_Test(Workspace_Test):
+    def test_dry_run_create_writes_nothing(self):
+        settings_path = self.workspace / "settings.json"
+        settings_path.write_text(json.dumps(self.settings), encoding="utf-8")
+        message = self.build(settings_path, dry_run=True)
+        self.assertIn("+ pack.mcmeta", message)
+        self.assertEqual([path.name for path in self.workspace.iterdir()], ["settings.json"])
+
+    def test_dry_run_against_zip(self):
+        module_path = self.create(output_zip=True)
+        contents = module_path.read_bytes()
+        self.assertIn(" 0 added, 0 modified, 0 deleted (+0 bytes)", self.build(module_path, dry_run=True))
+        message = self.build(module_path, dry_run=True, release=True)
+        self.assertIn("~ module_info.json", message)
+        self.assertNotIn(" 0 modified", message)
+        self.assertEqual(module_path.read_bytes(), contents)
+
+    def test_dry_run_folder_written_as_zip(self):
+        module_path = self.create()
+        file_count = len([file_path for file_path in module_path.rglob("*") if file_path.is_file()])
+        self.assertIn(f" {file_count} added, 0 modified, 0 deleted", self.build(module_path, output_zip=True, dry_run=True))
+        self.assertFalse(mm.zip_file_path(module_path).exists())
+        self.build(module_path, output_zip=True)
+        self.assertIn(" 0 added, 0 modified, 0 deleted", self.build(module_path, output_zip=True, dry_run=True))
+
+
+
+# Generation cache tests
+
+class Generation_Cache_Test(Workspace_Test):
+    def setUp(self):
+        super().setUp()
+        self.settings["entity_kinds"] = ["ghost", "wraith"]
+        self.settings["features"]["object_ticking"] = True
+        self.settings["object_kinds"] = ["box"]
+
+    def generate(self, settings: dict, folder_name: str, cache) -> tuple[dict[str, bytes], str]:
+        workspace = self.workspace / folder_name
+        workspace.mkdir(exist_ok=True)
+        program = mm.Program(False, workspace)
+        program.import_settings(settings)
+        program.cache = cache
+        module_path = program.get_module_path()
+        program.build_module(module_path)
+        files = {
+            file_path.relative_to(module_path).as_posix(): file_path.read_bytes()
+            for file_path in module_path.rglob("*")
+            if file_path.is_file() and file_path.name != "last_modified.mcfunction"
+        }
+        return files, program.message
+
+    def test_other_module_hits_cache(self):
+        cache = mm.Generation_Cache(self.workspace / "cache.db")
+        self.generate(self.settings, "first", cache)
+        settings = copy.deepcopy(self.settings)
+        settings["module_info"].update(module_name="Modulé Two", internal_id="module_two", namespace="two")
+        cached, _ = self.generate(settings, "second", cache)
+        statistics = cache.statistics()
+        cache.close()
+        self.assertEqual((statistics["hits"], statistics["misses"]), (1, 1))
+
+        generated, _ = self.generate(settings, "third", None)
+        self.assertEqual(cached.keys(), generated.keys())
+        for path in generated:
+            self.assertEqual(cached[path], generated[path], path)
+        self.assertIn("data/two/functions/entity/main.mcfunction", cached)
+
+    def test_changed_feature_misses_cache(self):
+        cache = mm.Generation_Cache(self.workspace / "cache.db")
+        self.generate(self.settings, "first", cache)
+        settings = copy.deepcopy(self.settings)
+        settings["features"]["player_motion"] = True
+        self.generate(settings, "second", cache)
+        self.assertEqual(cache.statistics()["misses"], 2)
+        cache.close()
+
+    def test_dry_run_does_not_open_cache(self):
+        settings_path = self.workspace / "settings.json"
+        settings_path.write_text(json.dumps(self.settings), encoding="utf-8")
+        with mock.patch.object(mm, "Generation_Cache") as cache_class:
+            _, code, _, message, _ = mm.build_target(str(settings_path), str(self.workspace), False, False, False, dry_run=True, use_cache=True)
+        self.assertEqual(code, 0, message)
+        cache_class.assert_not_called()
+
+
+
+# Writer tests
+
+class Writer_Test(Workspace_Test):
+    def test_threaded_writer_writes_every_file(self):
+        module_path = self.workspace / "module"
+        plan = mm.Build_Plan(module_path, writer=mm.Threaded_File_Writer(4))
+        for i in range(40):
+            plan.add(module_path / "data" / str(i % 5) / f"{i}.mcfunction", f"say {i}".encode("utf-8"))
+        self.assertEqual(plan.flush(), (40, 0, 0))
+        self.assertEqual((module_path / "data" / "3" / "8.mcfunction").read_bytes(), b"say 8")
+
+    def test_failed_write_leaves_module_untouched(self):
+        module_path = self.create()
+        contents = {file_path: file_path.read_bytes() for file_path in module_path.rglob("*") if file_path.is_file()}
+        write_file = mm.File_Writer.write_file
+
+        def fail_pack_mcmeta(file_path: Path, file_contents: bytes):
+            if file_path.name == "pack.mcmeta":
+                raise PermissionError("denied")
+            write_file(file_path, file_contents)
+
+        plan = mm.Build_Plan(module_path, True, writer=mm.Threaded_File_Writer(4))
+        plan.add(module_path / "pack.mcmeta", b"{}")
+        plan.add(module_path / "data" / "new.mcfunction", b"say new")
+        with mock.patch.object(mm.File_Writer, "write_file", staticmethod(fail_pack_mcmeta)):
+            with self.assertRaises(OSError) as context:
+                plan.flush()
+        self.assertIn("1 file could not be written", str(context.exception))
+        self.assertIn("PermissionError: denied", str(context.exception))
+        self.assertEqual({file_path: file_path.read_bytes() for file_path in module_path.rglob("*") if file_path.is_file()}, contents)
+        self.assertEqual([path.name for path in self.workspace.iterdir() if path.name.startswith(".")], [])
+
+
+
+# Deploy command tests
+
+class Deploy_Command_Test(Workspace_Test):
+    def setUp(self):
+        super().setUp()
+        self.world = self.workspace / "world"
+        (self.world / "datapacks").mkdir(parents=True)
+        (self.world / "level.dat").write_bytes(b"")
+
+    def module_files(self, module_path: Path) -> dict[str, bytes]:
+        return {file_path.relative_to(module_path).as_posix(): file_path.read_bytes() for file_path in module_path.rglob("*") if file_path.is_file()}
+
+    def test_deploy_newest_version(self):
+        old_path = self.create()
+        self.settings["module_info"]["version"]["minor"] = 1
+        new_path = self.create()
+        (self.world / "datapacks" / old_path.name).mkdir()
+        (self.world / "datapacks" / old_path.name / "module_info.json").write_bytes((old_path / "module_info.json").read_bytes())
+
+        code, output = self.run_command("deploy", "--workspace", str(self.workspace), "--jobs", "1", str(self.world))
+        self.assertEqual(code, 0, output)
+        self.assertIn(f" Removed {old_path.name}, another copy of blank_module", output)
+        self.assertEqual([path.name for path in (self.world / "datapacks").iterdir()], [new_path.name])
+        self.assertEqual(self.module_files(self.world / "datapacks" / new_path.name), self.module_files(new_path))
+
+    def test_dry_run_changes_nothing(self):
+        module_path = self.create()
+        deployed_path = self.world / "datapacks" / module_path.name
+        self.assertEqual(mm.sync_module(module_path, deployed_path), (len(self.module_files(module_path)), 0, 0))
+        (module_path / "pack.mcmeta").write_bytes((module_path / "pack.mcmeta").read_bytes())
+        os.utime(deployed_path / "pack.mcmeta", ns=(0, 0))
+        (deployed_path / "extra.txt").write_text("extra", encoding="utf-8")
+
+        self.assertEqual(mm.sync_module(module_path, deployed_path, True), (0, len(self.module_files(module_path)), 1))
+        self.assertEqual((deployed_path / "pack.mcmeta").stat().st_mtime_ns, 0)
+        self.assertTrue((deployed_path / "extra.txt").exists())
+        self.assertEqual(mm.sync_module(module_path, deployed_path), (0, len(self.module_files(module_path)), 1))
+        self.assertNotEqual((deployed_path / "pack.mcmeta").stat().st_mtime_ns, 0)
+        self.assertFalse((deployed_path / "extra.txt").exists())
+
+    def test_workspace_is_not_a_target(self):
+        self.create()
+        code, output = self.run_command("deploy", "--workspace", str(self.world / "datapacks"), "--jobs", "1", str(self.world))
+        self.assertEqual(code, 1)
+        self.assertIn("is the workspace", output)
+
+
+
+# Feature pruning tests
+
+class Feature_Pruning_Test(Workspace_Test):
+    def turn_off(self, module_path: Path, feature: str) -> str:
+        """Updates the module with a feature turned off, the way the update menu does, and returns the message."""
+        settings_json = json.loads((module_path / "module_info.json").read_text(encoding="utf-8"))
+        old_features = dict(settings_json["features"])
+        settings_json["features"][feature] = False
+        program = mm.Program(False, self.workspace)
+        program.import_settings(settings_json)
+        self.assertFalse(program.update_module(module_path, old_features=old_features), program.message)
+        return program.message
+
+    def test_turning_feature_off_removes_its_files(self):
+        module_path = self.create()
+        process_path = module_path / "data" / "blank" / "functions" / "entity" / "generic" / "process" / "main.mcfunction"
+        self.assertTrue(process_path.is_file())
+        self.turn_off(module_path, "entity_processing")
+        self.assertFalse(process_path.exists())
+        self.assertFalse((module_path / "data" / "nexus" / "tags" / "functions" / "entity" / "process.json").exists())
+
+    def test_edited_function_is_kept(self):
+        module_path = self.create()
+        verify_path = module_path / "data" / "blank" / "functions" / "entity" / "verify.mcfunction"
+        verify_path.write_text(verify_path.read_text(encoding="utf-8") + "\nsay custom", encoding="utf-8")
+        self.assertIn("entity/verify.mcfunction was edited", self.turn_off(module_path, "custom_entity_ticking"))
+        self.assertTrue(verify_path.is_file())
+        self.assertFalse((module_path / "data" / "nexus" / "tags" / "functions" / "entity" / "main.json").exists())
+
+    def test_shared_tag_keeps_other_entries(self):
+        module_path = self.create()
+        tag_path = module_path / "data" / "nexus" / "tags" / "functions" / "entity" / "process.json"
+        tag_json = json.loads(tag_path.read_text(encoding="utf-8"))
+        tag_json["values"].append("other:process")
+        tag_path.write_text(json.dumps(tag_json), encoding="utf-8")
+        self.turn_off(module_path, "entity_processing")
+        self.assertEqual(json.loads(tag_path.read_text(encoding="utf-8"))["values"], ["other:process"])
+
+
+
+# Hook pruning tests
+
+class Hook_Pruning_Test(Workspace_Test):
+    def test_empty_hooks_are_left_out(self):
+        module_path = self.create(prune_empty_hooks=True)
+        self.assertNotIn("blank:player/main", self.read_tag(module_path, "player/main"))
+        self.assertIn("blank:player/login/main", self.read_tag(module_path, "player/login"))
+        self.assertIn("blank:entity/verify", self.read_tag(module_path, "entity/main"))
+
+    def test_filled_hook_is_added_back_when_pruning(self):
+        module_path = self.create(prune_empty_hooks=True)
+        (module_path / "data" / "blank" / "functions" / "player" / "main.mcfunction").write_text("say hi", encoding="utf-8")
+        self.build(module_path)
+        self.assertNotIn("blank:player/main", self.read_tag(module_path, "player/main"))
+        self.build(module_path, prune_empty_hooks=True)
+        self.assertIn("blank:player/main", self.read_tag(module_path, "player/main"))
+
+    def test_entry_removed_by_hand_is_kept_out(self):
+        module_path = self.create()
+        tag_path = module_path / "data" / "nexus" / "tags" / "functions" / "player" / "login.json"
+        tag_path.write_text(json.dumps({"replace": False, "values": []}), encoding="utf-8")
+        self.build(module_path)
+        self.assertEqual(self.read_tag(module_path, "player/login"), [])
+
+
+
+# Minify tests
+
+class Minify_Test(Workspace_Test):
+    def test_minify_file(self):
+        header = mm.MINIFY_KEPT_PREFIXES[0] + "0123456789abcdef"
+        contents = f"{header}\n\n# Comment\n    say hi\n\n".encode("utf-8")
+        self.assertEqual(mm.minify_file(Path("a.mcfunction"), contents), f"{header}\nsay hi".encode("utf-8"))
+        self.assertEqual(mm.minify_file(Path("a.json"), b'{\n    "values": [\n        "a:b"\n    ]\n}'), b'{"values":["a:b"]}')
+        self.assertEqual(mm.minify_file(Path("a.json"), b"{"), b"{")
+        self.assertEqual(mm.minify_file(Path("a.txt"), b"# text\n\n"), b"# text\n\n")
+
+    def test_release_build(self):
+        module_path = self.create(release=True)
+        for file_path in module_path.rglob("*.mcfunction"):
+            lines = file_path.read_text(encoding="utf-8").splitlines()
+            self.assertFalse(any(line == "" or line.startswith("#") for line in lines), file_path)
+        self.assertNotIn("\n", (module_path / "pack.mcmeta").read_text(encoding="utf-8"))
+
+    def test_release_then_add_kind(self):
+        module_path = self.create(release=True)
+        main_path = module_path / "data" / "blank" / "functions" / "entity" / "main.mcfunction"
+        self.assertEqual(main_path.read_bytes(), b"")
+        self.edit_module_info(module_path, "entity_kinds", ["ghost"])
+        message = self.build(module_path, release=True)
+        self.assertNotIn("was edited", message)
+        self.assertIn("function blank:entity/kind/ghost", main_path.read_text(encoding="utf-8"))
+
+    def test_minify_command(self):
+        module_path = self.create()
+        code, output = self.run_command("minify", "--jobs", "1", str(module_path))
+        self.assertEqual(code, 0, output)
+        self.assertNotIn(" 0 files minified", output)
+        code, output = self.run_command("minify", "--jobs", "1", str(module_path))
+        self.assertIn(" 0 files minified", output)
+        self.assertIn(" 0 files written", self.build(module_path, release=True))
+
+
+
+# Lint tests
+
+class Lint_Test(Workspace_Test):
+    def test_find_selectors(self):
+        self.assertEqual(mm.find_selectors("execute as @a at @s run say hi"), [("a", ""), ("s", "")])
+        self.assertEqual(
+            mm.find_selectors('kill @e[type=zombie,nbt={Tags:["a]"],Items:[{}]},limit=1] @p[tag=x]'),
+            [("e", 'type=zombie,nbt={Tags:["a]"],Items:[{}]},limit=1'), ("p", "tag=x")]
+        )
+        self.assertEqual(mm.find_selectors("say email@example.com @"), [])
+
+    def test_lint_scores_ticking_commands(self):
+        module_path = self.create()
+        functions_path = module_path / "data" / "blank" / "functions"
+        (functions_path / "tick" / "main.mcfunction").write_text("execute as @a run function blank:tick/player", encoding="utf-8")
+        (functions_path / "tick" / "player.mcfunction").write_text("# Check\n\nexecute if entity @e[distance=..5] run say near\nsay @e[type=zombie]", encoding="utf-8")
+        (functions_path / "unused.mcfunction").write_text("kill @e[nbt={a:1b}]", encoding="utf-8")
+        linter = mm.Module_Linter(module_path)
+        findings, reachable = linter.lint()
+        self.assertEqual(
+            [(score, function_id, line_number, rules) for score, function_id, line_number, _, rules, _, _ in findings],
+            [(mm.LINT_RULES["@e selector without type"]*mm.LINT_PLAYER_COUNT, "blank:tick/player", 3, ["@e selector without type"])]
+        )
+        self.assertGreater(reachable, 2)
+
+    def test_lint_command(self):
+        module_path = self.create()
+        code, output = self.run_command("lint", str(module_path), str(self.workspace / "missing"))
+        self.assertEqual(code, 1)
+        self.assertIn(f" {module_path.name}:", output)
+        self.assertIn("is not a module", output)
+
+
+
+# Bundle tests
+
+class Bundle_Test(Workspace_Test):
+    def create_modules(self) -> list[Path]:
+        module_paths: list[Path] = []
+        for name in ["Alpha", "Beta", "Gamma"]:
+            settings = copy.deepcopy(self.settings)
+            settings["module_info"].update(module_name=name, internal_id=name.lower(), namespace=name.lower())
+            module_paths.append(self.create(settings))
+        return module_paths
+
+    def test_fuse_verify_functions(self):
+        bundle = mm.Module_Bundle(self.create_modules())
+        self.assertEqual(bundle.fuse("bundle"), 3)
+        self.assertEqual(bundle.message, "")
+        self.assertEqual(bundle.tags["data/nexus/tags/functions/entity/main.json"], ["bundle:entity/verify"])
+        assign = bundle.files["data/bundle/functions/entity/assign.mcfunction"].decode("utf-8").splitlines()
+        self.assertEqual(assign[-1], "execute unless score @s bundle.entity matches -1.. run scoreboard players set @s bundle.entity 0")
+        verify = bundle.files["data/bundle/functions/entity/verify.mcfunction"].decode("utf-8")
+        self.assertIn("execute unless score @s bundle.entity matches -1.. run function bundle:entity/assign", verify)
+        self.assertNotIn("matches 0 ", verify)
+        self.assertIn("execute if score @s bundle.entity matches 2 run function bundle:entity/module/beta", verify)
+
+    def test_objectives_are_created_and_removed(self):
+        bundle = mm.Module_Bundle(self.create_modules())
+        bundle.fuse("bundle")
+        self.assertIn("scoreboard objectives add bundle.entity dummy", bundle.files["data/bundle/functions/setup/main.mcfunction"].decode("utf-8"))
+        self.assertIn("scoreboard objectives remove bundle.entity", bundle.files["data/bundle/functions/uninstall/main.mcfunction"].decode("utf-8"))
+        self.assertIn("bundle:uninstall/main", bundle.tags["data/nexus/tags/functions/uninstall/modules.json"])
+
+    def test_edited_verify_function_is_kept(self):
+        module_paths = self.create_modules()
+        verify_path = module_paths[0] / "data" / "alpha" / "functions" / "entity" / "verify.mcfunction"
+        verify_path.write_text("say edited", encoding="utf-8")
+        bundle = mm.Module_Bundle(module_paths)
+        self.assertEqual(bundle.fuse("bundle"), 2)
+        self.assertIn("alpha:entity/verify was edited", bundle.message)
+        self.assertIn("alpha:entity/verify", bundle.tags["data/nexus/tags/functions/entity/main.json"])
+
+    def test_bundle_command(self):
+        module_paths = self.create_modules()
+        output_path = self.workspace / "Bundle"
+        code, output = self.run_command("bundle", "--output", str(output_path), *map(str, module_paths))
+        self.assertEqual(code, 0, output)
+        self.assertTrue((output_path / "data" / "bundle" / "functions" / "uninstall" / "main.mcfunction").is_file())
+        self.assertIn("Alpha, Beta, Gamma", (output_path / "pack.mcmeta").read_text(encoding="utf-8"))
+        code, output = self.run_command("bundle", "--output", str(output_path), *map(str, module_paths))
+        self.assertEqual(code, 1)
+        self.assertIn("already exists", output)
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file